@@ -0,0 +1,205 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: batch mode of SQDoc - documents multiple databases of multiple servers concurrently
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+* 2026-10-16 - v1.1 - output of each server kept in its own subdirectory
+* 2026-10-16 - v1.1 - changelog against previous snapshot
+* 2026-10-16 - v1.1 - render cache shared by all servers
+* 2026-10-16 - v1.1 - queued log written at end of each job
+* 2026-10-16 - v1.1 - relationship graph export
+* 2026-10-16 - v1.1 - documentation run shared with other entry points
+
+Usage:
+
+    python batch.py
+
+Documented servers and databases are set by _batch_targets in main.py.
+"""
+
+# import generic libraries
+import os
+import re
+import sys
+import json
+import time
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+# import engine modules
+import main
+import fetcher as f
+import utility as u
+import metrics as m
+
+
+class MyBatchJob:
+    """
+    Documentation of a single database, executed in a batch worker process.
+    """
+
+    def __init__(self, server, database, server_config, timestamp):
+        """
+        Initialize class instance and document database.
+        :param str server: server name
+        :param str database: database name
+        :param server_config: server level configuration shared across databases of a server
+        :param str timestamp: batch start timestamp used in log file name
+        :type server_config: list(any), optional
+        """
+        self.metrics = m.MyMetrics(database)
+        self.utils = self.metrics.instrument(u.MyUtils())
+        self.log = self.utils.get_logger(os.path.join(main._logs_path, f"{timestamp}_batch_{os.getpid()}.log"))
+        # set document properties
+        self.doc_content = main._doc_content
+        self.doc_properties = main._doc_properties
+        self.fetch_settings = main._fetch_settings
+        self.fetch_filters = main._fetch_filters
+        self.build_settings = main._build_settings
+        # set utilities
+        self.db_name = database
+        self.db_conn_string = main._batch_conn_string.format(server=server, database=database)
+        self.server_config = server_config
+        self.db_pool = None
+        # same database name may exist on several servers, output files are kept apart per server
+        self.export = server_path(main._docs_path, server)
+        self.state = server_path(main._state_path, server)
+        self.snapshots = server_path(main._snapshots_path, server)
+        self.metrics_path = server_path(main._metrics_path, server)
+        # cached sections are addressed by content, so cache is shared by all servers
+        self.cache = main._cache_path
+        # job summary
+        self.summary = {'server': server, 'database': database, 'status': 'ERROR', 'tables': 0, 'procedures': 0,
+                        'seconds': 0.0,
+                        'documents': [os.path.join(self.export, f"{database}_documentation.{output}")
+                                      for output in self.build_settings['formats']]}
+        start = time.perf_counter()
+        try:
+            for path in (self.export, self.state, self.snapshots):
+                os.makedirs(path, exist_ok=True)
+            self.log.info(f"----------")
+            self.log.info(f"new batch job: {server} {database}")
+            details = main.run(self)
+            if details is not None:
+                self.summary['status'] = 'OK'
+                self.summary['tables'] = len(details.db_tables or {})
+                self.summary['procedures'] = len(details.db_procedures or {})
+        except SystemExit:
+            self.log.warn(f"batch job {server} {database} stopped")
+        except Exception as exc:
+            self.log.warn(f"Unspecified batch job exception: {exc}")
+        self.summary['seconds'] = round(time.perf_counter() - start, 2)
+        # worker processes exit without running exit handlers, queued records are written before job ends
+        self.utils.stop_logger()
+
+
+def server_path(path, server):
+    """
+    Get server subdirectory of an output directory.
+    :param str path: output directory
+    :param str server: server name, instance name included
+    :return: subdirectory path
+    :rtype: str
+    """
+    return os.path.join(path, re.sub(r'[^\w.-]+', '_', server))
+
+
+def _document_database(server, database, server_config, timestamp):
+    """
+    Batch worker process entry point.
+    :return: job summary
+    :rtype: dict(str, any)
+    """
+    return MyBatchJob(server, database, server_config, timestamp).summary
+
+
+class SQBatch:
+    """
+    Batch mode executable.
+    """
+
+    def __init__(self, targets):
+        """
+        Initialize class instance.
+        :param targets: list of servers with databases to document
+        :type targets: list(dict)
+        """
+        print(main._banner)
+
+        # import utility methods class
+        self.utils = u.MyUtils()
+
+        # setup log
+        self._timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        _log_path = os.path.join(main._logs_path, f"{self._timestamp}_batch.log")
+        self.log = self.utils.get_logger(_log_path)
+        print(f"{self.utils.timestamp()} log file: {_log_path}\n----------")
+        try:
+            # directory checks
+            os.makedirs(main._docs_path, exist_ok=True)
+            os.makedirs(main._state_path, exist_ok=True)
+            os.makedirs(main._snapshots_path, exist_ok=True)
+            self.log.info(f"----------")
+            self.log.info(f"new batch execution")
+            self._print_summary(self._run(targets))
+        except Exception as exc:
+            self.log.warn(f'Unspecified batch exception: {exc}')
+            time.sleep(5)
+            sys.exit(1)
+
+    def _run(self, targets):
+        """
+        Document all target databases in a process pool.
+        :param targets: list of servers with databases to document
+        :type targets: list(dict)
+        :return: list of job summaries
+        :rtype: list(dict)
+        """
+        jobs = []
+        # spawned processes behave the same regardless of platform
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=main._batch_settings['processes'], mp_context=context) as executor:
+            for target in targets:
+                server_config = self._get_server_config(target)
+                for database in target['databases']:
+                    print(f"{self.utils.timestamp()} queued {target['server']} {database}")
+                    jobs.append(executor.submit(_document_database, target['server'], database, server_config,
+                                                self._timestamp))
+            return [job.result() for job in jobs]
+
+    def _get_server_config(self, target):
+        """
+        Read server level configuration once per server.
+        :param target: server with databases to document
+        :type target: dict(str, any)
+        :return: configuration details list or None if not needed or not available
+        :rtype: list(any), optional
+        """
+        if not main._doc_content['db_configuration'] or not target['databases']:
+            return None
+        conn_string = main._batch_conn_string.format(server=target['server'], database=target['databases'][0])
+        print(f"{self.utils.timestamp()} reading server configuration: {target['server']}")
+        return f.get_server_configuration(self, conn_string)
+
+    def _print_summary(self, summary):
+        """
+        Print consolidated run summary and save it next to created documents.
+        :param summary: list of job summaries
+        :type summary: list(dict)
+        """
+        path = os.path.join(main._docs_path, f"batch_{self._timestamp}.json")
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=2)
+        print(f"----------\n{self.utils.timestamp()} batch summary: {path}")
+        for job in summary:
+            print(f"{self.utils.timestamp()} ┗ [{job['status']}] {job['server']} {job['database']}: "
+                  f"{job['tables']} tables, {job['procedures']} procedures, {job['seconds']} s")
+            self.log.info(f"{job['status']} {job['server']} {job['database']}")
+        failed = len([job for job in summary if job['status'] != 'OK'])
+        print(f"{self.utils.timestamp()} {len(summary) - failed} of {len(summary)} databases documented")
+
+
+if __name__ == '__main__':
+    SQBatch(main._batch_targets)
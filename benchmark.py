@@ -0,0 +1,304 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: performance benchmarks of SQDoc engine modules
+Updates:
+
+* 2026-10-16 - v1.1 - creation, table writer micro-benchmark
+* 2026-10-16 - v1.1 - fetch, render and save phases measured on synthetic catalogs
+* 2026-10-16 - v1.1 - memory use of fetched metadata model
+* 2026-10-16 - v1.1 - table storage section
+
+Usage:
+
+    python benchmark.py tables [--rows 100 1000 5000]
+    python benchmark.py catalog [--tables 100 1000 10000 50000] [--columns 10] [--latency 0.0] [--output file]
+    python benchmark.py memory [--tables 1000 10000] [--columns 10]
+
+Results are printed, or written to output file, as JSON.
+"""
+
+# import generic libraries
+import io
+import os
+import sys
+import json
+import time
+import logging
+import importlib
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from datetime import date
+from contextlib import redirect_stdout
+from docx import Document
+from docx.shared import Inches
+
+# import synthetic catalog, standing in for pyodbc where ODBC driver manager is not available
+import fakedb
+try:
+    importlib.import_module('pyodbc')
+except ImportError:
+    sys.modules['pyodbc'] = fakedb
+
+# import engine modules
+import main
+import fetcher as f
+import builder as b
+import utility as u
+import metrics as m
+from model import Table, Column, Key, ExtendedProperty
+
+# benchmarked table layout - same as table columns section
+_table_config = {'header': ['Column name', 'Data type', 'Max length', 'Nullable'], 'columns': [2, 2, 1, 1]}
+
+
+def _legacy_add_table(doc, config, content):
+    """
+    Table writer used before single pass implementation, kept as a benchmark reference.
+    :param doc: python-docx document object
+    :param config: table configuration containing header column names and column dimensions list
+    :param content: table content list
+    :type doc: docx.Document()
+    :type config: dict(str, any)
+    :type content: list(any)
+    :return: modified document object
+    :rtype: docx.Document()
+    """
+    cols = len(config['columns'])
+    table = doc.add_table(rows=1, cols=cols)
+    table.autofit = False
+    table.style = 'Light List Accent 1'
+    theader = table.rows[0].cells
+    for item_id in range(0, cols):
+        theader[item_id].text = config['header'][item_id]
+        theader[item_id].width = Inches(config['columns'][item_id])
+    for item in content:
+        row = table.add_row().cells
+        for item_id in range(0, cols):
+            row[item_id].text = item[item_id]
+            row[item_id].width = Inches(config['columns'][item_id])
+    return doc
+
+
+def bench_tables(rows=(100, 1000, 5000), repeat=3):
+    """
+    Compare table writers on tables of a given row count.
+    :param rows: row counts of benchmarked tables
+    :param int repeat: number of measured calls per row count
+    :type rows: tuple(int)
+    :return: list of benchmark results
+    :rtype: list(dict)
+    """
+    results = []
+    for count in rows:
+        content = [[f'column_{item_id}', 'nvarchar', '255', 'YES'] for item_id in range(count)]
+        for name, method in (('legacy', _legacy_add_table), ('single pass', b.MyPrinter._add_table)):
+            timings = []
+            for _ in range(repeat):
+                doc = Document()
+                start = time.perf_counter()
+                method(doc, _table_config, content)
+                timings.append(time.perf_counter() - start)
+            seconds = min(timings)
+            results.append({'benchmark': 'add_table', 'implementation': name, 'rows': count,
+                            'seconds': round(seconds, 4)})
+    return results
+
+
+class MyBenchmarkCore:
+    """
+    Script object replacement used by benchmarked data fetcher and document builder.
+    """
+
+    def __init__(self, export, workers=4, bulk=True, streaming=False):
+        """
+        Initialize class instance.
+        :param str export: directory of created documents
+        :param int workers: number of concurrent fetch workers
+        :param bool bulk: read table details with bulk queries
+        :param bool streaming: write document body to file as it is produced
+        """
+        self.metrics = m.MyMetrics('Synthetic_DB')
+        self.utils = self.metrics.instrument(u.MyUtils())
+        self.log = logging.getLogger('SQDoc.benchmark')
+        self.log.setLevel(logging.WARNING)
+        self.doc_content = {'db_configuration': True, 'db_tables': True, 'db_procedures': True, 'db_storage': True,
+                            'db_relationships': True}
+        self.doc_properties = [['Owner:', 'Benchmark'], ['Created on:', date.today().strftime("%Y-%m-%d")]]
+        self.fetch_settings = dict(main._fetch_settings, workers=workers, bulk=bulk, incremental=False,
+                                   snapshot=False, pipeline=0)
+        self.fetch_filters = main._fetch_filters
+        self.build_settings = dict(main._build_settings, streaming=streaming)
+        self.db_name = 'Synthetic_DB'
+        self.db_conn_string = 'synthetic'
+        self.server_config = None
+        self.db_pool = None
+        self.export = export
+        self.state = export
+        self.snapshots = export
+        self.cache = os.path.join(export, 'cache')
+
+
+def bench_catalog(tables=(100, 1000, 10000, 50000), columns=10, latency=0.0, workers=4, bulk=True,
+                  streaming=False):
+    """
+    Measure fetch, render and save phases on synthetic catalogs of a given table count.
+    :param tables: table counts of benchmarked catalogs
+    :param int columns: number of columns per table
+    :param float latency: delay of each query execution in seconds
+    :param int workers: number of concurrent fetch workers
+    :param bool bulk: read table details with bulk queries
+    :param bool streaming: write document body to file as it is produced
+    :type tables: tuple(int)
+    :return: list of benchmark results
+    :rtype: list(dict)
+    """
+    results = []
+    # benchmarked modules bind pyodbc at import, synthetic catalog replaces it regardless of availability
+    f.pyodbc = fakedb
+    for count in tables:
+        catalog = fakedb.MySyntheticCatalog(tables=count, columns=columns)
+        fakedb.setup(catalog, latency)
+        with tempfile.TemporaryDirectory() as export:
+            core = MyBenchmarkCore(export, workers, bulk, streaming)
+            with redirect_stdout(io.StringIO()):
+                with core.metrics.timer('phase', 'fetch'):
+                    details = f.MyFetcher(core)
+                with core.metrics.timer('phase', 'build'):
+                    b.MyPrinter(details, core)
+            size = os.path.getsize(os.path.join(export, f"{core.db_name}_documentation.docx"))
+        phases = core.metrics.phases
+        results.append({'benchmark': 'catalog', 'tables': count, 'columns': columns,
+                        'procedures': catalog.procedures, 'latency': latency, 'workers': workers, 'bulk': bulk,
+                        'streaming': streaming, 'queries': catalog.queries,
+                        'fetch_seconds': round(phases['fetch'], 4),
+                        'render_seconds': round(phases['build'] - phases['save (docx)'], 4),
+                        'save_seconds': round(phases['save (docx)'], 4), 'document_bytes': size,
+                        'sections': core.metrics.report()['sections']})
+    return results
+
+
+def _fetched(record):
+    """
+    Copy record values, as database driver creates new string objects for every fetched value.
+    :param record: synthetic catalog record
+    :type record: tuple(any)
+    :return: record values
+    :rtype: list(any)
+    """
+    return [value.encode('utf-8').decode('utf-8') if isinstance(value, str) else value for value in record]
+
+
+def _legacy_tables(catalog):
+    """
+    Table details as nested dictionaries and lists, kept as a benchmark reference.
+    :param catalog: synthetic catalog
+    :type catalog: fakedb.MySyntheticCatalog
+    :return: details per table
+    :rtype: dict(str, dict)
+    """
+    results = {}
+    grouped = [{}, {}, {}]
+    for group, records in zip(grouped, (catalog._columns('', ()), catalog._keys('', ()), catalog._table_ep('', ()))):
+        for record in records:
+            record = _fetched(record)
+            group.setdefault((record[0], record[1]), []).append(list(record[2:]))
+    for catalog_name, schema, name, table_type in catalog.tables:
+        results[f"{schema}.{name}"] = {'columns': grouped[0].get((schema, name), []),
+                                       'keys': grouped[1].get((schema, name), []),
+                                       'extended': grouped[2].get((schema, name), [])}
+    return results
+
+
+def _model_tables(catalog):
+    """
+    Table details as compact metadata model, same as data fetcher creates.
+    :param catalog: synthetic catalog
+    :type catalog: fakedb.MySyntheticCatalog
+    :return: details per table
+    :rtype: dict(str, Table)
+    """
+    results = {}
+    grouped = [{}, {}, {}]
+    for group, records, record_type in zip(grouped,
+                                           (catalog._columns('', ()), catalog._keys('', ()), catalog._table_ep('', ())),
+                                           (Column.from_record, Key.from_record, ExtendedProperty.from_record)):
+        for record in records:
+            record = _fetched(record)
+            group.setdefault((record[0], record[1]), []).append(record_type(record[2:]))
+    for catalog_name, schema, name, table_type in catalog.tables:
+        results[f"{schema}.{name}"] = Table(schema, name, grouped[0].get((schema, name), ()),
+                                            grouped[1].get((schema, name), ()), grouped[2].get((schema, name), ()))
+    return results
+
+
+def bench_memory(tables=(1000, 10000), columns=10):
+    """
+    Compare memory held by fetched table details in nested dictionaries and in metadata model.
+    :param tables: table counts of benchmarked catalogs
+    :param int columns: number of columns per table
+    :type tables: tuple(int)
+    :return: list of benchmark results
+    :rtype: list(dict)
+    """
+    results = []
+    for count in tables:
+        catalog = fakedb.MySyntheticCatalog(tables=count, columns=columns)
+        for name, method in (('nested dictionaries', _legacy_tables), ('model', _model_tables)):
+            tracemalloc.start()
+            details = method(catalog)
+            size, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results.append({'benchmark': 'memory', 'implementation': name, 'tables': count, 'columns': columns,
+                            'bytes': size, 'peak_bytes': peak,
+                            'bytes_per_column': round(size / (count * columns), 1)})
+            del details
+    return results
+
+
+def _revision():
+    """
+    Get benchmarked source revision.
+    :return: git commit hash or None if not available
+    :rtype: str, optional
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except Exception:
+        return None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='SQDoc performance benchmarks')
+    parser.add_argument('--output', help='JSON results file, printed if not set')
+    commands = parser.add_subparsers(dest='command', required=True)
+    command = commands.add_parser('tables', help='table writer micro-benchmark')
+    command.add_argument('--rows', type=int, nargs='+', default=[100, 1000, 5000])
+    command = commands.add_parser('catalog', help='fetch, render and save phases on synthetic catalogs')
+    command.add_argument('--tables', type=int, nargs='+', default=[100, 1000, 10000, 50000])
+    command.add_argument('--columns', type=int, default=10)
+    command.add_argument('--latency', type=float, default=0.0, help='delay of each query in seconds')
+    command.add_argument('--workers', type=int, default=4)
+    command.add_argument('--per-table', action='store_true', help='read table details with per-table queries')
+    command.add_argument('--streaming', action='store_true', help='stream document body to file')
+    command = commands.add_parser('memory', help='memory held by fetched table details')
+    command.add_argument('--tables', type=int, nargs='+', default=[1000, 10000])
+    command.add_argument('--columns', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == 'tables':
+        _results = bench_tables(tuple(args.rows))
+    elif args.command == 'memory':
+        _results = bench_memory(tuple(args.tables), args.columns)
+    else:
+        _results = bench_catalog(tuple(args.tables), args.columns, args.latency, args.workers, not args.per_table,
+                                 args.streaming)
+    _report = {'revision': _revision(), 'python': platform.python_version(), 'results': _results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(_report, file, indent=2)
+    else:
+        print(json.dumps(_report, indent=2))
@@ -6,48 +6,109 @@ Updates:
 * 2024-08-02 - v1.0 - creation
 * 2024-08-27 - v1.0 - code cleanup, adding content settings enabling predefined content inclusion / exclusion
                       from printed document
+* 2026-10-16 - v1.1 - single pass table writer
+* 2026-10-16 - v1.1 - streaming document export
+* 2026-10-16 - v1.1 - section render time metrics
+* 2026-10-16 - v1.1 - section layout moved to renderers module, Markdown, HTML and JSON output formats
+* 2026-10-16 - v1.1 - documentation split into volumes rendered in worker processes
+* 2026-10-16 - v1.1 - render cache of per-table and per-procedure sections
+* 2026-10-16 - v1.1 - static table of contents linking heading bookmarks
+* 2026-10-16 - v1.1 - table storage printed in general volume
+* 2026-10-16 - v1.1 - table relationships printed in general volume
+* 2026-10-16 - v1.1 - cached procedure sections include parameters
 """
 
 # import generic libraries
+import io
 import os
 import sys
 import time
+import logging
+import zipfile
+import multiprocessing
+from copy import deepcopy
+from lxml import etree
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
 from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE
 from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml import OxmlElement, parse_xml
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
+# import engine modules
+import utility as u
+import metrics as m
+from snapshot import MySnapshot
+from cache import MyRenderCache
+from renderers import MyRenderer, MyHeadingCollector, MyMarkdownRenderer, MyHtmlRenderer, MyJsonRenderer
 
-class MyPrinter:
+# table cell element tag
+_tc_tag = qn('w:tc')
+# main document part inside *.docx package
+_document_part = 'word/document.xml'
+# layout version of cached per-table and per-procedure sections, changed whenever their layout changes
+_fragment_layout = '2'
+# heading levels listed in table of contents
+_toc_levels = (1, 2)
+
+
+class MyPrinter(MyRenderer):
     """
     Class responsible for exporting data into *.docx file.
     """
 
-    def __init__(self, _details, _core):
+    extension = 'docx'
+
+    def __init__(self, _details, _core, **kwargs):
         """
         Initialize cass instance.
         """
-        # content settings
-        self._content = _core.doc_content
-        self._properties = _core.doc_properties
-        # content objects
-        self._db_config = _details.db_config
-        self._db_tables = _details.db_tables
-        self._db_procedures = _details.db_procedures
-        # utilities
-        self._db_name = _core.db_name
-        self._log = _core.log
-        self._utils = _core.utils
-        self._export = _core.export
-        # document export
-        self._print_document()
-
-    def _print_document(self):
-        """
-        Attempt to export database information to *.docx file.
-        """
-        print(f"----------\n{self._utils.timestamp()} creating *.docx file")
+        self._doc = None
+        self._stream = None
+        self._cache = None
+        # number of bookmarked headings, None until static table of contents is printed
+        self._bookmarks = None
+        settings = _core.build_settings
+        if settings['render_cache']:
+            # cached sections contain heading bookmarks only if static table of contents is printed
+            layout = f"{_fragment_layout}{' static toc' if settings['static_toc'] else ''}"
+            self._cache = MyRenderCache(_core.cache, settings['render_cache_size'] * 1024 * 1024, _core.metrics,
+                                        layout)
+        super().__init__(_details, _core, **kwargs)
+
+    def _open(self, path):
+        """
+        Create document, in streaming mode document body is written to file as it is produced.
+        :param str path: *.docx file path
+        """
+        self._doc = self._new_document()
+        # volume index links are package relationships added with content, index is always saved at once
+        if self._settings['streaming'] and self._volumes is None:
+            print(f"{self._utils.timestamp()} Streaming file: {path}")
+            self._stream = MyStreamWriter(self._doc, path)
+
+    def _close(self, path):
+        """
+        Save document to file, or finish file writing in streaming mode.
+        :param str path: *.docx file path
+        """
+        if self._stream:
+            self._stream.close()
+        else:
+            print(f"{self._utils.timestamp()} Saving file: {path}")
+            self._doc.save(path)
+        if self._cache:
+            self._log.info(f"render cache: {self._cache.hits} hits, {self._cache.misses} misses, "
+                           f"{self._cache.evictions} evictions")
+
+    def _new_document(self):
+        """
+        Create document with header and footer set.
+        :return: python-docx document object
+        :rtype: docx.Document()
+        """
         doc = Document()
         section = doc.sections[0]
         _logo_path = os.path.join(os.path.dirname(__file__), '.resources', 'doc_logo.png')
@@ -64,138 +125,132 @@ class MyPrinter:
         # Add page numbers to each section's footer
         for section in doc.sections:
             self._add_page_numbers(section)
+        return doc
 
-        # ---------------------------------------------------------------------------------
-        # main page
-        # ---------------------------------------------------------------------------------
-        doc.add_heading(f'{self._db_name} database technical documentation', 0)
-        # document details table
-        config = {'header': ['Properties', ''], 'columns': [1, 3]}
-        self._add_table(doc, config, self._properties)
-        # next page
-        doc.add_page_break()
+    def _flush(self):
+        """
+        Write document content produced so far to file in streaming mode.
+        """
+        if self._stream:
+            self._stream.flush()
 
-        # ---------------------------------------------------------------------------------
-        # table of contents
-        # ---------------------------------------------------------------------------------
-        doc.add_heading('Table of contents', level=1)
-        toc_paragraph = doc.add_paragraph()
-        toc_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-        self._add_toc(toc_paragraph)
-        # next page
-        doc.add_page_break()
+    def _print_table(self, number, table, content):
+        self._print_cached('table', number, table, content, super()._print_table)
 
-        # ---------------------------------------------------------------------------------
-        # document purpose
-        # ---------------------------------------------------------------------------------
-        doc.add_heading('1. Document purpose', level=1)
-        doc.add_paragraph(f'Purpose of this document is to provide a technical overview on details and structure of '
-                          f'{self._db_name} database. Document covers configuration of the database itself and '
-                          f'properties of each included table such as:')
-        doc.add_paragraph(f'table columns', style='List Bullet')
-        doc.add_paragraph(f'column types', style='List Bullet')
-        doc.add_paragraph(f'keys', style='List Bullet')
-        doc.add_paragraph(f'Details related to table contents and / or volume are not part o this document due to '
-                          f'their potentially sensitive nature.')
-        # next page
-        doc.add_page_break()
+    def _print_procedure(self, number, procedure, content):
+        self._print_cached('procedure', number, procedure, content, super()._print_procedure)
 
-        # ---------------------------------------------------------------------------------
-        # database details
-        # ---------------------------------------------------------------------------------
-        if self._content['db_configuration']:
-            doc.add_heading(f'2. {self._db_name} database details', level=1)
-            doc.add_paragraph(f'This section covers basic configuration details of database.')
-            # for each subject - create content table
-            paragraph = 1
-            for scope in self._db_config:
-                content = self._db_config[scope]
-                doc.add_heading(f"2.{paragraph} {scope}", level=2)
-                # create table
-                # separate formatting for different scope subjects
-                if scope == 'Configuration':
-                    config = {'header': ['Configuration item', 'Value default', 'Value in use'], 'columns': [4, 1, 1]}
-                    self._add_table(doc, config, content)
-                if scope == "Scoped configuration":
-                    config = {'header': ['Configuration item', 'Value'], 'columns': [4, 2]}
-                    self._add_table(doc, config, content)
-                paragraph += 1
-            # next page
-            doc.add_page_break()
+    def _print_cached(self, kind, number, name, content, method):
+        """
+        Insert object section stored in render cache, or print it and store it in cache.
+        :param str kind: printed object kind - 'table' or 'procedure'
+        :param str number: object heading number
+        :param str name: object name
+        :param content: object details
+        :param method: renderer method printing object section
+        :type content: Table | Procedure
+        :type method: callable
+        """
+        if self._cache is None:
+            method(number, name, content)
+            return
+        key = self._cache.key(kind, name, content)
+        fragment = self._cache.get(key)
+        body = self._doc.element.body
+        if fragment is not None:
+            for element in self._load_fragment(fragment, number):
+                body.sectPr.addprevious(element)
+            return
+        # printed elements are inserted before section properties, which stay last element of document body
+        start = len(body) - 1
+        method(number, name, content)
+        self._cache.put(key, self._dump_fragment(body[start:len(body) - 1], number))
 
-        # ---------------------------------------------------------------------------------
-        # per-table details
-        # ---------------------------------------------------------------------------------
-        if self._content['db_tables']:
-            doc.add_heading(f'3. {self._db_name} tables', level=1)
-            doc.add_paragraph(f'This section covers basic configuration details of database tables.')
-            # for each subject - create content table
-            paragraph = 1
-            for table in self._db_tables:
-                content = self._db_tables[table]
-                doc.add_heading(f"3.{paragraph} {table}", level=2)
-
-                # section - keys
-                doc.add_heading(f"3.{paragraph}.1 Keys", level=3)
-                if len(content['keys']) == 0:
-                    doc.add_paragraph(f'No keys configured for this table.')
-                else:
-                    config = {'header': ['Key column name', 'Constraint name', 'Constraint type'], 'columns': [2, 2, 2]}
-                    self._add_table(doc, config, content['keys'])
-
-                # section - extended properties
-                doc.add_heading(f"3.{paragraph}.2 Extended properties", level=3)
-                if len(content['extended']) == 0:
-                    doc.add_paragraph(f'No extended properties configured for this table.')
-                else:
-                    config = {'header': ['Property name', 'Property value'], 'columns': [2, 4]}
-                    self._add_table(doc, config, content['extended'])
-
-                # section - columns
-                doc.add_heading(f"3.{paragraph}.3 Columns", level=3)
-                if len(content['columns']) == 0:
-                    doc.add_paragraph(f'No columns configured for this table')
-                else:
-                    config = {'header': ['Column name', 'Data type', 'Max length', 'Nullable'], 'columns': [2, 2, 1, 1]}
-                    self._add_table(doc, config, content['columns'])
-                paragraph += 1
-
-            # next page
-            doc.add_page_break()
+    @staticmethod
+    def _dump_fragment(elements, number):
+        """
+        Serialize document body elements of an object section.
+        :param elements: document body elements
+        :param str number: object heading number
+        :type elements: list(lxml.etree.Element)
+        :return: serialized fragment
+        :rtype: bytes
+        """
+        fragment = etree.Element('fragment', number=number)
+        for element in elements:
+            fragment.append(deepcopy(element))
+        return etree.tostring(fragment)
 
-        # ---------------------------------------------------------------------------------
-        # stored procedure details
-        # ---------------------------------------------------------------------------------
-        if self._content['db_procedures']:
-            doc.add_heading(f'3. {self._db_name} stored procedures', level=1)
-            doc.add_paragraph(f'This section covers basic configuration details of configured stored procedures.')
-            # for each subject - create content table
-            paragraph = 1
-            for procedure in self._db_procedures:
-                content = self._db_procedures[procedure]
-                doc.add_heading(f"3.{paragraph} {procedure}", level=2)
-
-                # section - extended properties
-                doc.add_heading(f"3.{paragraph}.1 Extended properties", level=3)
-                if not content['extended']:
-                    doc.add_paragraph(f'No extended properties configured for this procedure.')
-                else:
-                    config = {'header': ['Property name', 'Property value'], 'columns': [2, 4]}
-                    self._add_table(doc, config, content['extended'])
-
-                # section - stored procedure details
-                doc.add_heading(f"3.{paragraph}.2 Details", level=3)
-                if not content['info']:
-                    doc.add_paragraph(f'No properties obtained for this procedure.')
-                else:
-                    config = {'header': ['Property name', 'Property value'], 'columns': [2, 4]}
-                    self._add_table(doc, config, content['info'])
-                paragraph += 1
-
-        # Save the document
-        path = f"{self._export}\\{self._db_name}_documentation.docx"
-        print(f"{self._utils.timestamp()} Saving file: {path}")
-        doc.save(path)
+    def _load_fragment(self, data, number):
+        """
+        Read document body elements of an object section, with heading numbers changed to current number and
+        heading bookmarks renamed to follow bookmarks printed so far.
+        :param bytes data: serialized fragment
+        :param str number: object heading number
+        :return: document body elements
+        :rtype: list(lxml.etree.Element)
+        """
+        fragment = parse_xml(data)
+        previous = fragment.get('number')
+        for paragraph in fragment.iterchildren(qn('w:p')):
+            style = paragraph.find(f"{qn('w:pPr')}/{qn('w:pStyle')}")
+            text = paragraph.find(f".//{qn('w:t')}")
+            if style is None or text is None or not style.get(qn('w:val')).startswith('Heading'):
+                continue
+            if text.text.startswith(previous) and text.text[len(previous):len(previous) + 1] in (' ', '.'):
+                text.text = number + text.text[len(previous):]
+            start = paragraph.find(qn('w:bookmarkStart'))
+            if start is not None and self._bookmarks is not None:
+                start.set(qn('w:name'), _bookmark(self._bookmarks))
+                start.set(qn('w:id'), str(self._bookmarks))
+                paragraph.find(qn('w:bookmarkEnd')).set(qn('w:id'), str(self._bookmarks))
+                self._bookmarks += 1
+        return list(fragment)
+
+    def _heading(self, text, level):
+        heading = self._doc.add_heading(text, level=level)
+        if self._bookmarks is not None and level in _toc_levels:
+            self._add_bookmark(heading, self._bookmarks)
+            self._bookmarks += 1
+
+    def _paragraph(self, text, style=None):
+        self._doc.add_paragraph(text, style=style)
+
+    def _table(self, config, content):
+        self._add_table(self._doc, config, content)
+
+    def _page_break(self):
+        self._doc.add_page_break()
+
+    def _link(self, text, target):
+        paragraph = self._doc.add_paragraph(style='List Bullet')
+        r_id = self._doc.part.relate_to(target.replace(' ', '%20'), RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+        hyperlink = OxmlElement('w:hyperlink')
+        hyperlink.set(qn('r:id'), r_id)
+        run = OxmlElement('w:r')
+        properties = OxmlElement('w:rPr')
+        color = OxmlElement('w:color')
+        color.set(qn('w:val'), '0563C1')
+        underline = OxmlElement('w:u')
+        underline.set(qn('w:val'), 'single')
+        properties.append(color)
+        properties.append(underline)
+        run.append(properties)
+        text_element = OxmlElement('w:t')
+        text_element.text = text
+        run.append(text_element)
+        hyperlink.append(run)
+        paragraph._p.append(hyperlink)
+
+    def _toc(self):
+        if self._settings['static_toc']:
+            headings = [(level, text) for level, text in MyHeadingCollector(self).headings if level in _toc_levels]
+            self._add_static_toc(self._doc, headings)
+            self._bookmarks = 0
+            return
+        toc_paragraph = self._doc.add_paragraph()
+        toc_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        self._add_toc(toc_paragraph)
 
     @staticmethod
     def _add_toc(paragraph):
@@ -228,6 +283,76 @@ class MyPrinter:
         r_element.append(char_ext_3)
         return paragraph
 
+    @staticmethod
+    def _add_static_toc(doc, headings):
+        """
+        Build table of contents linking heading bookmarks. Entries are placed in result of a table of contents
+        field, which Word does not update on open, but can refresh on request to add page numbers.
+        :param doc: python-docx document object
+        :param headings: listed headings - level and text, n-th heading is expected to have n-th bookmark
+        :type doc: docx.Document()
+        :type headings: list(tuple)
+        """
+        paragraphs = []
+        for index, (level, text) in enumerate(headings):
+            paragraph = doc.add_paragraph()
+            paragraph.paragraph_format.left_indent = Inches(0.3 * (level - 1))
+            paragraph.paragraph_format.space_after = Pt(2)
+            hyperlink = OxmlElement('w:hyperlink')
+            hyperlink.set(qn('w:anchor'), _bookmark(index))
+            hyperlink.set(qn('w:history'), '1')
+            run = OxmlElement('w:r')
+            text_element = OxmlElement('w:t')
+            text_element.set(qn('xml:space'), 'preserve')
+            text_element.text = text
+            run.append(text_element)
+            hyperlink.append(run)
+            paragraph._p.append(hyperlink)
+            paragraphs.append(paragraph)
+        if not paragraphs:
+            paragraphs.append(doc.add_paragraph())
+        # field begin precedes first entry, field end follows last entry
+        field = []
+        for char_type, instruction in (('begin', None), (None, 'TOC \\o "1-2" \\h \\z \\u'), ('separate', None)):
+            run = OxmlElement('w:r')
+            if char_type:
+                char = OxmlElement('w:fldChar')
+                char.set(qn('w:fldCharType'), char_type)
+                run.append(char)
+            else:
+                instr = OxmlElement('w:instrText')
+                instr.set(qn('xml:space'), 'preserve')
+                instr.text = instruction
+                run.append(instr)
+            field.append(run)
+        first = paragraphs[0]._p
+        position = 1 if first.pPr is not None else 0
+        for run in field:
+            first.insert(position, run)
+            position += 1
+        run = OxmlElement('w:r')
+        char = OxmlElement('w:fldChar')
+        char.set(qn('w:fldCharType'), 'end')
+        run.append(char)
+        paragraphs[-1]._p.append(run)
+
+    @staticmethod
+    def _add_bookmark(paragraph, index):
+        """
+        Add bookmark enclosing paragraph content.
+        :param paragraph: bookmarked paragraph
+        :param int index: bookmark number
+        :type paragraph: docx.text.paragraph.Paragraph
+        """
+        start = OxmlElement('w:bookmarkStart')
+        start.set(qn('w:id'), str(index))
+        start.set(qn('w:name'), _bookmark(index))
+        end = OxmlElement('w:bookmarkEnd')
+        end.set(qn('w:id'), str(index))
+        element = paragraph._p
+        element.insert(1 if element.pPr is not None else 0, start)
+        element.append(end)
+
     @staticmethod
     def _add_page_numbers(section):
         """
@@ -272,26 +397,213 @@ class MyPrinter:
         :rtype: docx.Document()
         """
         cols = len(config['columns'])
+        widths = [Inches(width) for width in config['columns']]
         table = doc.add_table(rows=1, cols=cols)
         table.autofit = False
         table.style = 'Light List Accent 1'
+        # set column dimensions once at grid level
+        for column, width in zip(table.columns, widths):
+            column.width = width
+        # set header text and cell dimensions
         theader = table.rows[0].cells
-        # set header text and column dimensions
         for item_id in range(0, cols):
             theader[item_id].text = config['header'][item_id]
-            theader[item_id].width = Inches(config['columns'][item_id])
-        # write table content
+            theader[item_id].width = widths[item_id]
+        # write table content - each row is a copy of header row with replaced run text, appended directly to
+        # table element, so table structure is not walked again for every added row
+        template = deepcopy(table.rows[0]._tr)
+        for tc in template.iterchildren(_tc_tag):
+            tc[-1][-1].text = ''
+        tbl = table._tbl
         for item in content:
-            row = table.add_row().cells
-            for item_id in range(0, cols):
-                row[item_id].text = item[item_id]
-                row[item_id].width = Inches(config['columns'][item_id])
+            tr = deepcopy(template)
+            for tc, text in zip(tr.iterchildren(_tc_tag), item):
+                tc[-1][-1].text = text
+            tbl.append(tr)
         return doc
 
 
+def _bookmark(index):
+    """
+    Get name of heading bookmark, hidden in Word as it starts with underscore.
+    :param int index: bookmark number
+    :return: bookmark name
+    :rtype: str
+    """
+    return f"_SQDoc_heading_{index:06d}"
+
+
+class MyStreamWriter:
+    """
+    Class responsible for writing document body into *.docx file incrementally. Package parts other than
+    document body - styles, header, footer and logo - are copied from python-docx document as set up before
+    any content is added, body elements are written to file and dropped from memory on each flush.
+    """
+
+    def __init__(self, doc, path):
+        """
+        Initialize class instance, open file and write package parts other than document body.
+        :param doc: python-docx document object with header and footer set, but no content
+        :param str path: *.docx file path
+        :type doc: docx.Document()
+        """
+        self._body = doc.element.body
+        self._sect_pr = self._body.sectPr
+        skeleton = io.BytesIO()
+        doc.save(skeleton)
+        self._stack = ExitStack()
+        package = self._stack.enter_context(zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True))
+        with zipfile.ZipFile(skeleton) as source:
+            for item in source.infolist():
+                if item.filename != _document_part:
+                    package.writestr(item, source.read(item.filename))
+        part = self._stack.enter_context(package.open(_document_part, 'w', force_zip64=True))
+        self._xf = self._stack.enter_context(etree.xmlfile(part, encoding='UTF-8'))
+        self._xf.write_declaration(standalone=True)
+        root = doc.element
+        self._stack.enter_context(self._xf.element(root.tag, attrib=dict(root.attrib), nsmap=root.nsmap))
+        self._stack.enter_context(self._xf.element(self._body.tag))
+
+    def flush(self):
+        """
+        Write body elements added since last flush and remove them from document.
+        """
+        for element in list(self._body):
+            if element is not self._sect_pr:
+                self._body.remove(element)
+                # drop namespace declarations inherited from document element, but not used by written element
+                etree.cleanup_namespaces(element)
+                self._xf.write(element)
+
+    def close(self):
+        """
+        Write remaining body elements and section properties, close file.
+        """
+        try:
+            self.flush()
+            if self._sect_pr is not None:
+                self._xf.write(self._sect_pr)
+        finally:
+            self._stack.close()
+
+
+# output format renderers
+renderers = {'docx': MyPrinter, 'md': MyMarkdownRenderer, 'html': MyHtmlRenderer, 'json': MyJsonRenderer}
+
+
+class MyVolumeJob:
+    """
+    Script object replacement used to print a documentation volume in a worker process.
+    """
+
+    def __init__(self, settings):
+        """
+        Initialize class instance.
+        :param settings: document settings of printed volume
+        :type settings: dict(str, any)
+        """
+        self.metrics = m.MyMetrics(settings['db_name'])
+        self.utils = u.MyUtils()
+        self.log = logging.getLogger('SQDoc')
+        self.doc_content = settings['doc_content']
+        self.doc_properties = settings['doc_properties']
+        self.build_settings = settings['build_settings']
+        self.db_name = settings['db_name']
+        self.export = settings['export']
+        self.cache = settings['cache']
+
+
+def _print_volume(_details, settings, volume):
+    """
+    Volume worker process entry point, prints volume in all configured output formats.
+    :param _details: details included in volume
+    :param settings: document settings of printed volume
+    :param volume: volume title and file name suffix
+    :type _details: MySnapshot
+    :type settings: dict(str, any)
+    :type volume: dict(str, any)
+    :return: volume run metrics
+    :rtype: dict(str, any)
+    """
+    job = MyVolumeJob(settings)
+    for output in job.build_settings['formats']:
+        renderers[output](_details, job, volume=volume)
+    return job.metrics.report()
+
+
+def split_volumes(tables, by_schema, max_tables):
+    """
+    Split tables into documentation volumes.
+    :param tables: details per table
+    :param bool by_schema: put tables of each schema in separate volumes
+    :param int max_tables: maximum number of tables per volume, not limited if 0
+    :type tables: dict(str, Table)
+    :return: list of volume title and table names
+    :rtype: list(tuple)
+    """
+    groups = {}
+    for name, table in tables.items():
+        groups.setdefault(table.schema if by_schema else None, []).append(name)
+    volumes = []
+    for schema, names in groups.items():
+        size = max_tables or len(names)
+        parts = [names[start:start + size] for start in range(0, len(names), size)]
+        for part_id, part in enumerate(parts, 1):
+            title = f"schema {schema}" if by_schema else f"tables {part[0]} - {part[-1]}"
+            if by_schema and len(parts) > 1:
+                title = f"{title}, part {part_id} of {len(parts)}"
+            volumes.append((title, part))
+    return volumes
+
+
+def print_volumes(_details, _core):
+    """
+    Print documentation split into volumes in worker processes, followed by volume index document.
+    :param _details: MSSQL database details
+    :param _core: SQDoc script object
+    :type _details: MyFetcher()
+    :type _core: SQDoc()
+    """
+    content = _core.doc_content
+    build_settings = _core.build_settings
+    tables = _details.db_tables if content['db_tables'] and _details.db_tables else {}
+    jobs = []
+    # database configuration, stored procedures, table storage and relationships are printed in their own volume
+    if content['db_configuration'] or content['db_procedures'] or content['db_storage'] or content['db_relationships']:
+        jobs.append(({'title': 'general', 'suffix': '_00', 'tables': 0, 'first': '', 'last': ''},
+                     dict(content, db_tables=False),
+                     MySnapshot(_core.db_name, _details.db_config, False, _details.db_procedures,
+                                db_storage=_details.db_storage, db_relationships=_details.db_relationships)))
+    for volume_id, (title, names) in enumerate(split_volumes(tables, build_settings['volume_by_schema'],
+                                                             build_settings['volume_tables']), 1):
+        jobs.append(({'title': f"volume {volume_id}, {title}", 'suffix': f"_{volume_id:02d}", 'tables': len(names),
+                      'first': names[0], 'last': names[-1]},
+                     dict(content, db_configuration=False, db_procedures=False, db_storage=False,
+                          db_relationships=False),
+                     MySnapshot(_core.db_name, False, {name: tables[name] for name in names}, False)))
+    print(f"{_core.utils.timestamp()} printing {len(jobs)} documentation volumes")
+    _core.log.info(f"printing {len(jobs)} documentation volumes")
+    # spawned processes behave the same regardless of platform
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=build_settings['volume_processes'], mp_context=context) as executor:
+        futures = []
+        for volume, volume_content, volume_details in jobs:
+            settings = {'db_name': _core.db_name, 'doc_content': volume_content,
+                        'doc_properties': _core.doc_properties, 'build_settings': build_settings,
+                        'export': _core.export,
+                        'cache': _core.cache if build_settings['render_cache'] else None}
+            futures.append(executor.submit(_print_volume, volume_details, settings, volume))
+        for future in futures:
+            _core.metrics.merge(future.result())
+    # volume index, linking volumes
+    volumes = [volume for volume, volume_content, volume_details in jobs]
+    for output in build_settings['formats']:
+        renderers[output](MySnapshot(_core.db_name), _core, volumes=volumes)
+
+
 def execute(_details, _core):
     """
-    Carry document print task.
+    Carry document print task, one document per configured output format.
     :param _details: MSSQL database details dictionary
     :param _core: SQDoc script object
     :type _details: dict(str, any)
@@ -299,10 +611,18 @@ def execute(_details, _core):
     :raise exc: Unspecified fil creation exception
     """
     try:
-        MyPrinter(_details, _core)
+        if _core.build_settings['volume_by_schema'] or _core.build_settings['volume_tables']:
+            print_volumes(_details, _core)
+        else:
+            for output in _core.build_settings['formats']:
+                renderers[output](_details, _core)
         print(f"{_core.utils.timestamp()} Document saved, all activities finished.")
     except Exception as exc:
         print(f"{_core.utils.timestamp()} Unspecified exception, check log for details. Exiting...")
         _core.log.warn(f"Unspecified *.docx file creation exception: {exc}")
         time.sleep(5)
         sys.exit(0)
+    finally:
+        # pipelined table details are no longer read once document is printed or its printing failed
+        if hasattr(_details.db_tables, 'close'):
+            _details.db_tables.close()
@@ -0,0 +1,124 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: render cache - document fragments of per-table and per-procedure sections kept on disk, keyed by
+              content hash of rendered details
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+"""
+
+# import generic libraries
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+# cached fragment file extension
+_extension = '.frag'
+
+
+class MyRenderCache:
+    """
+    Class responsible for storing rendered document fragments in a directory. Fragments are addressed by hash of
+    rendered details, so unchanged objects hit cache regardless of run, database or server. Least recently used
+    fragments are removed once cache exceeds its size limit.
+    """
+
+    def __init__(self, path, max_bytes, metrics, layout):
+        """
+        Initialize class instance, read present fragments in least recently used order.
+        :param str path: cache directory
+        :param int max_bytes: cache size limit in bytes
+        :param metrics: run metrics receiving hit, miss and eviction counters
+        :param str layout: layout version of cached fragments, part of each key
+        :type metrics: MyMetrics
+        """
+        self._path = path
+        self._max_bytes = max_bytes
+        self._metrics = metrics
+        self._layout = layout
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        entries = []
+        for entry in os.scandir(path):
+            if entry.name.endswith(_extension):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-len(_extension)], stat.st_size))
+        # fragment file modification time is its last use
+        self._entries = OrderedDict((key, size) for mtime, key, size in sorted(entries))
+        self._size = sum(self._entries.values())
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, kind, name, content):
+        """
+        Get fragment key of rendered object.
+        :param str kind: rendered object kind - 'table' or 'procedure'
+        :param str name: rendered object name
+        :param content: rendered object details
+        :type content: Table | Procedure
+        :return: fragment key
+        :rtype: str
+        """
+        data = json.dumps([self._layout, kind, name, content.as_dict()], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Read fragment, marking it as recently used.
+        :param str key: fragment key
+        :return: fragment or None if not cached
+        :rtype: bytes, optional
+        """
+        path = os.path.join(self._path, key + _extension)
+        with self._lock:
+            cached = key in self._entries
+            if cached:
+                self._entries.move_to_end(key)
+        try:
+            if not cached:
+                raise FileNotFoundError(path)
+            with open(path, 'rb') as file:
+                data = file.read()
+            os.utime(path)
+        except OSError:
+            # fragment removed by another process sharing cache directory
+            with self._lock:
+                self._size -= self._entries.pop(key, 0)
+                self.misses += 1
+            self._metrics.count('render cache misses')
+            return None
+        with self._lock:
+            self.hits += 1
+        self._metrics.count('render cache hits')
+        return data
+
+    def put(self, key, data):
+        """
+        Store fragment, removing least recently used fragments over size limit.
+        :param str key: fragment key
+        :param bytes data: fragment
+        """
+        path = os.path.join(self._path, key + _extension)
+        # fragment appears at once, processes sharing cache directory never read partial file
+        with open(f"{path}.{os.getpid()}.tmp", 'wb') as file:
+            file.write(data)
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+        evicted = []
+        with self._lock:
+            self._size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            while self._size > self._max_bytes and len(self._entries) > 1:
+                old_key, size = self._entries.popitem(last=False)
+                self._size -= size
+                evicted.append(old_key)
+            self.evictions += len(evicted)
+        for old_key in evicted:
+            try:
+                os.remove(os.path.join(self._path, old_key + _extension))
+            except OSError:
+                pass
+        if evicted:
+            self._metrics.count('render cache evictions', len(evicted))
@@ -0,0 +1,278 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: schema diff engine - compares two fetched catalogs and prints changelog document
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+* 2026-10-16 - v1.1 - stored procedure parameters
+
+Usage:
+
+    python diff.py previous.sqdoc current.sqdoc [--export directory]
+
+Changelog of two snapshots is printed to export directory, _docs_path by default.
+"""
+
+# import generic libraries
+import os
+import sys
+import time
+import argparse
+from datetime import date
+
+# import engine modules
+import main
+from snapshot import MySnapshot, latest
+from builder import MyPrinter, MyVolumeJob
+
+# changelog sections in print order
+sections = ['Configuration', 'Tables', 'Columns', 'Keys', 'Extended properties', 'Procedures', 'Parameters']
+
+
+def _index(records):
+    """
+    Index configuration records by option name.
+    :param records: configuration records - name followed by values
+    :type records: list(any)
+    :return: values per option name
+    :rtype: dict(str, tuple)
+    """
+    # unavailable configuration is kept as a single message
+    return {record[0]: tuple(record[1:]) for record in records or () if not isinstance(record, str)}
+
+
+def _values(values):
+    """
+    Format compared values.
+    :param values: values
+    :type values: tuple(any)
+    :return: values separated by slash
+    :rtype: str
+    """
+    return ' / '.join(str(value) for value in values)
+
+
+def _compare_items(changes, section, prefix, old, new, describe):
+    """
+    Compare two indexes of items, appending added, removed and changed items to changelog section.
+    :param changes: changelog rows per section
+    :param str section: changelog section
+    :param str prefix: object name prefix of compared items
+    :param old: previous items per name
+    :param new: current items per name
+    :param describe: function describing item details
+    :type changes: dict(str, list)
+    :type old: dict(str, any)
+    :type new: dict(str, any)
+    :type describe: callable
+    """
+    rows = changes[section]
+    for name, item in new.items():
+        previous = old.get(name)
+        if previous is None:
+            rows.append([f"{prefix}{name}", 'added', describe(item)])
+        elif previous != item:
+            rows.append([f"{prefix}{name}", 'changed', f"{describe(previous)} -> {describe(item)}"])
+    for name, item in old.items():
+        if name not in new:
+            rows.append([f"{prefix}{name}", 'removed', describe(item)])
+
+
+def _compare_tables(changes, old, new):
+    """
+    Compare table details.
+    :param changes: changelog rows per section
+    :param old: previous details per table
+    :param new: current details per table
+    :type changes: dict(str, list)
+    :type old: dict(str, Table)
+    :type new: dict(str, Table)
+    """
+    for name, table in new.items():
+        previous = old.get(name)
+        if previous is None:
+            changes['Tables'].append([name, 'added', f"{len(table.columns)} columns"])
+            continue
+        # unchanged tables are skipped without indexing their details
+        if (previous.columns, previous.keys, previous.extended) == (table.columns, table.keys, table.extended):
+            continue
+        prefix = f"{name}."
+        _compare_items(changes, 'Columns', prefix,
+                       {column.name: column[1:] for column in previous.columns},
+                       {column.name: column[1:] for column in table.columns}, _values)
+        _compare_items(changes, 'Keys', prefix,
+                       {f"{key.constraint} ({key.column})": key[2:] for key in previous.keys},
+                       {f"{key.constraint} ({key.column})": key[2:] for key in table.keys}, _values)
+        _compare_items(changes, 'Extended properties', prefix,
+                       {prop.name: prop.value for prop in previous.extended},
+                       {prop.name: prop.value for prop in table.extended}, str)
+    for name, table in old.items():
+        if name not in new:
+            changes['Tables'].append([name, 'removed', f"{len(table.columns)} columns"])
+
+
+def _compare_procedures(changes, old, new):
+    """
+    Compare stored procedure details.
+    :param changes: changelog rows per section
+    :param old: previous details per stored procedure
+    :param new: current details per stored procedure
+    :type changes: dict(str, list)
+    :type old: dict(str, Procedure)
+    :type new: dict(str, Procedure)
+    """
+    rows = changes['Procedures']
+    for name, procedure in new.items():
+        previous = old.get(name)
+        if previous is None:
+            rows.append([name, 'added', f"created on {procedure.created}"])
+            continue
+        altered = [f"{label} {old_value} -> {new_value}"
+                   for (label, old_value), (_, new_value) in zip(previous.info, procedure.info)
+                   if old_value != new_value]
+        if altered:
+            rows.append([name, 'changed', ', '.join(altered)])
+        if previous.extended != procedure.extended:
+            _compare_items(changes, 'Extended properties', f"{name}.",
+                           {prop.name: prop.value for prop in previous.extended},
+                           {prop.name: prop.value for prop in procedure.extended}, str)
+        if previous.parameters != procedure.parameters:
+            _compare_items(changes, 'Parameters', f"{name}.",
+                           {parameter.name: parameter[1:] for parameter in previous.parameters},
+                           {parameter.name: parameter[1:] for parameter in procedure.parameters}, _values)
+    for name, procedure in old.items():
+        if name not in new:
+            rows.append([name, 'removed', f"created on {procedure.created}"])
+
+
+def compare(previous, current):
+    """
+    Compare two fetched catalogs. Objects are looked up by name in dictionaries, so comparison time grows
+    linearly with catalog size.
+    :param previous: previous catalog details
+    :param current: current catalog details
+    :type previous: MySnapshot | MyFetcher()
+    :type current: MySnapshot | MyFetcher()
+    :return: changelog rows - object, change, details - per section
+    :rtype: dict(str, list)
+    """
+    changes = {section: [] for section in sections}
+    if previous.db_config and current.db_config:
+        for scope, records in current.db_config.items():
+            _compare_items(changes, 'Configuration', f"{scope}: ", _index(previous.db_config.get(scope)),
+                           _index(records), _values)
+    if previous.db_tables is not False and current.db_tables is not False:
+        _compare_tables(changes, previous.db_tables or {}, current.db_tables or {})
+    if previous.db_procedures is not False and current.db_procedures is not False:
+        _compare_procedures(changes, previous.db_procedures or {}, current.db_procedures or {})
+    return changes
+
+
+class MyChangelog(MyPrinter):
+    """
+    Class responsible for exporting changelog of two catalogs into *.docx file.
+    """
+
+    def __init__(self, changes, _details, _core, previous=None):
+        """
+        Initialize class instance.
+        :param changes: changelog rows per section, result of compare()
+        :param _details: current catalog details
+        :param _core: SQDoc script object
+        :param str previous: creation timestamp of previous catalog
+        :type changes: dict(str, list)
+        """
+        self._changes = changes
+        self._previous = previous
+        super().__init__(_details, _core)
+
+    def _sections(self):
+        return [('changelog main page', self._print_main_page, True),
+                ('changelog summary', self._print_summary, True),
+                ('changelog', self._print_changes, True)]
+
+    def _file_name(self, volume=None):
+        return f"{self._db_name}_changelog.{self.extension}"
+
+    def _print_main_page(self):
+        """
+        Print main page with compared catalogs.
+        """
+        self._heading(f'{self._db_name} database changelog', 0)
+        config = {'header': ['Properties', ''], 'columns': [1, 3]}
+        self._table(config, [['Compared with:', self._previous or 'not known'],
+                             ['Created on:', date.today().strftime("%Y-%m-%d")]])
+
+    def _print_summary(self):
+        """
+        Print number of changes per section.
+        """
+        self._heading('1. Summary', 1)
+        content = [[section] + [str(sum(1 for row in rows if row[1] == change))
+                                for change in ('added', 'removed', 'changed')]
+                   for section, rows in self._changes.items()]
+        config = {'header': ['Section', 'Added', 'Removed', 'Changed'], 'columns': [3, 1, 1, 1]}
+        self._table(config, content)
+
+    def _print_changes(self):
+        """
+        Print changes of each section.
+        """
+        paragraph = 2
+        for section, rows in self._changes.items():
+            if not rows:
+                continue
+            self._heading(f"{paragraph}. {section}", 1)
+            config = {'header': ['Object', 'Change', 'Details'], 'columns': [2.5, 0.8, 2.7]}
+            self._table(config, rows)
+            paragraph += 1
+            self._flush()
+
+
+def execute(_details, _core):
+    """
+    Print changelog of fetched details against latest snapshot of database.
+    :param _details: data fetcher object
+    :param _core: SQDoc script object
+    :type _details: MyFetcher()
+    :type _core: SQDoc()
+    :return: changelog rows per section or None if not available
+    :rtype: dict(str, list), optional
+    """
+    path = latest(_core.snapshots, _core.db_name)
+    if path is None:
+        print(f"{_core.utils.timestamp()} no previous snapshot, changelog skipped")
+        _core.log.info(f"no previous snapshot of {_core.db_name} in {_core.snapshots}, changelog skipped")
+        return None
+    try:
+        previous = MySnapshot.load(path)
+        with _core.metrics.timer('phase', 'changelog'):
+            changes = compare(previous, _details)
+            MyChangelog(changes, _details, _core, previous.created)
+        count = sum(len(rows) for rows in changes.values())
+        print(f"{_core.utils.timestamp()} changelog saved, {count} changes since {previous.created}")
+        _core.log.info(f"changelog against {path}: {count} changes")
+        return changes
+    except Exception as exc:
+        print(f"{_core.utils.timestamp()} [ERROR] cannot create changelog, check log for details")
+        _core.log.warn(f"cannot create changelog against {path}: {exc}")
+        return None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='SQDoc changelog of two snapshots')
+    parser.add_argument('previous', help='previous snapshot file')
+    parser.add_argument('current', help='current snapshot file')
+    parser.add_argument('--export', default=main._docs_path, help='changelog directory')
+    args = parser.parse_args()
+
+    _previous = MySnapshot.load(args.previous)
+    _current = MySnapshot.load(args.current)
+    os.makedirs(args.export, exist_ok=True)
+    _job = MyVolumeJob({'db_name': _current.db_name, 'doc_content': main._doc_content,
+                        'doc_properties': main._doc_properties, 'build_settings': main._build_settings,
+                        'export': args.export, 'cache': main._cache_path})
+    _start = time.perf_counter()
+    MyChangelog(compare(_previous, _current), _current, _job, _previous.created)
+    print(f"{_job.utils.timestamp()} changelog printed in {time.perf_counter() - _start:.2f} s")
+    sys.exit(0)
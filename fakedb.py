@@ -0,0 +1,436 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: synthetic database catalog served through pyodbc connection and cursor interface, enables
+              performance measurements without SQL Server
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+* 2026-10-16 - v1.1 - schema and object name filters of catalog queries
+* 2026-10-16 - v1.1 - parameterized per-object queries
+* 2026-10-16 - v1.1 - key constraints from catalog views
+* 2026-10-16 - v1.1 - partition statistics
+* 2026-10-16 - v1.1 - foreign keys of relationship graph
+* 2026-10-16 - v1.1 - stored procedure parameters, procedure details for one or all procedures
+* 2026-10-16 - v1.1 - current database switch of reused connections
+"""
+
+# import generic libraries
+import re
+import time
+import threading
+
+# data types assigned to synthetic columns in turn
+_data_types = [('int', 'not set'), ('nvarchar', '255'), ('datetime', 'not set'), ('decimal', 'not set'),
+               ('varchar', '50'), ('bit', 'not set')]
+# object modification date, formatted as by convert(varchar(23), modify_date, 121)
+_modify_date = '2024-01-01 00:00:00.000'
+
+
+class MySyntheticCatalog:
+    """
+    Generated catalog of a database with a given number of tables, columns and procedures. Records are
+    produced on demand, so catalog size does not affect memory use.
+    """
+
+    def __init__(self, tables=100, columns=10, procedures=None, schemas=4, db_name='Synthetic_DB'):
+        """
+        Initialize class instance.
+        :param int tables: number of tables
+        :param int columns: number of columns per table
+        :param int procedures: number of stored procedures, by default one per ten tables
+        :param int schemas: number of schemas tables are spread across
+        :param str db_name: database name
+        """
+        self.db_name = db_name
+        self.columns = columns
+        self.procedures = tables // 10 if procedures is None else procedures
+        self.schemas = ['dbo'] + [f'schema_{schema_id}' for schema_id in range(1, schemas)]
+        self.tables = [(db_name, self.schemas[table_id % len(self.schemas)], f'table_{table_id:06d}', 'BASE TABLE')
+                       for table_id in range(tables)]
+        self._index = {(table[1], table[2]): table_id for table_id, table in enumerate(self.tables)}
+        self.queries = 0
+        self._lock = threading.Lock()
+        # query routing - first route with marker found in lowercase query text is used
+        self._routes = [('is_ms_shipped', self._objects),
+                        ('dm_db_partition_stats', self._storage),
+                        ('information_schema.tables', self._structure),
+                        ('information_schema.columns', self._columns),
+                        ('sys.key_constraints', self._keys),
+                        ('sys.foreign_keys', self._foreign_keys),
+                        ('sys.configurations', self._configuration),
+                        ('sys.database_scoped_configurations', self._scoped_configuration),
+                        ('sys.extended_properties ep', self._procedure_ep),
+                        ('sys.parameters', self._parameters),
+                        ('sys.procedures', self._procedures),
+                        ('sys.tables', self._table_ep),
+                        ('use [', self._use)]
+
+    def execute(self, query, params):
+        """
+        Resolve query to a generator of result records.
+        :param str query: query string
+        :param params: query parameters
+        :type params: tuple(any)
+        :return: generator of records
+        :rtype: Iterator[tuple]
+        :raise Exception: query not recognized
+        """
+        with self._lock:
+            self.queries += 1
+        text = query.lower()
+        for marker, route in self._routes:
+            if marker in text:
+                return route(query, params)
+        raise Exception(f"synthetic catalog cannot resolve query: {query}")
+
+    def _tables(self, query, params, schema_column, name_column):
+        """
+        Get tables a query is limited to.
+        :param str query: query string
+        :param params: query parameters
+        :param str schema_column: column compared with schema name in query filter
+        :param str name_column: column compared with table name in query filter
+        :type params: tuple(any)
+        :return: list of (table id, table record)
+        :rtype: list(tuple)
+        """
+        conditions = _conditions(query, params)
+        schema = _equal(conditions, schema_column)
+        name = _equal(conditions, name_column)
+        if schema is None or name is None:
+            return [(table_id, table) for table_id, table in enumerate(self.tables)
+                    if _matches(conditions, {schema_column.lower(): table[1], name_column.lower(): table[2]})]
+        table_id = self._index.get((schema, name))
+        return [] if table_id is None else [(table_id, self.tables[table_id])]
+
+    def _structure(self, query, params):
+        """
+        Records of tables list query.
+        """
+        conditions = _conditions(query, params)
+        for table in self.tables:
+            if _matches(conditions, {'table_schema': table[1], 'table_name': table[2]}):
+                yield table
+
+    def _objects(self, query, params):
+        """
+        Records of object modification dates query.
+        """
+        conditions = _conditions(query, params)
+        for table_id, table in enumerate(self.tables):
+            if _matches(conditions, {'s.name': table[1], 'o.name': table[2]}):
+                yield table_id + 1000, table[1], table[2], 'U', _modify_date
+        for procedure_id in range(self.procedures):
+            if _matches(conditions, {'s.name': 'dbo', 'o.name': f'usp_procedure_{procedure_id:06d}'}):
+                yield procedure_id + 1000000, 'dbo', f'usp_procedure_{procedure_id:06d}', 'P', _modify_date
+
+    def _columns(self, query, params):
+        """
+        Records of column details query, for a single table or all tables.
+        """
+        single = _equal(_conditions(query, params), 'table_name') is not None
+        for table_id, table in self._tables(query, params, 'table_schema', 'table_name'):
+            for column_id in range(self.columns):
+                data_type, length = _data_types[(table_id + column_id) % len(_data_types)]
+                record = (f'column_{column_id:03d}', data_type, length, 'NO' if column_id == 0 else 'YES')
+                yield record if single else table[1:3] + record
+
+    def _keys(self, query, params):
+        """
+        Records of key constraints query, for a single table or all tables.
+        """
+        for table_id, table in self._tables(query, params, 's.name', 't.name'):
+            records = [('column_000', f'PK_{table[2]}', 'PRIMARY KEY', '---')]
+            if table_id > 0 and self.columns > 1:
+                referenced = self.tables[table_id - 1]
+                records.append(('column_001', f'FK_{table[2]}_{table_id - 1:06d}', 'FOREIGN KEY',
+                                f'{referenced[1]}.{referenced[2]} (column_000)'))
+            for record in records:
+                yield table[1:3] + record
+
+    def _foreign_keys(self, query, params):
+        """
+        Records of foreign keys query - every table references previous table, as in key constraints query.
+        """
+        for table_id, table in self._tables(query, params, 's.name', 't.name'):
+            if table_id > 0 and self.columns > 1:
+                referenced = self.tables[table_id - 1]
+                yield (f'FK_{table[2]}_{table_id - 1:06d}',) + table[1:3] + referenced[1:3]
+
+    def _table_ep(self, query, params):
+        """
+        Records of table extended properties query, for a single table or all tables.
+        """
+        single = _equal(_conditions(query, params), 't.name') is not None
+        for table_id, table in self._tables(query, params, 's.name', 't.name'):
+            record = ('MS_Description', f'Synthetic table {table[2]} of {table[1]} schema')
+            yield record if single else table[1:3] + record
+
+    def _use(self, query, params):
+        """
+        Result of current database switch - no records.
+        """
+        return iter(())
+
+    def _storage(self, query, params):
+        """
+        Records of partition statistics query - clustered index and one nonclustered index per table.
+        """
+        for table_id, table in self._tables(query, params, 's.name', 't.name'):
+            rows = (table_id * 7919) % 1000000
+            data_pages = rows // 50 + 1
+            yield table[1], table[2], 1, rows, data_pages + 8, data_pages + 2, data_pages
+            yield table[1], table[2], 2, rows, rows // 200 + 8, rows // 200 + 1, 0
+
+    def _configuration(self, query, params):
+        """
+        Records of server configuration query.
+        """
+        for option_id in range(80):
+            yield f'configuration option {option_id:02d}', '0', str(option_id % 2)
+
+    def _scoped_configuration(self, query, params):
+        """
+        Records of database scoped configuration query.
+        """
+        for option_id in range(20):
+            yield f'scoped configuration option {option_id:02d}', str(option_id % 2)
+
+    def _procedures(self, query, params):
+        """
+        Records of stored procedures list query.
+        """
+        conditions = _conditions(query, params)
+        for procedure_id in range(self.procedures):
+            if not _matches(conditions, {'s.name': 'dbo', 'p.name': f'usp_procedure_{procedure_id:06d}'}):
+                continue
+            yield (f'usp_procedure_{procedure_id:06d}', 'dbo', 'Jan  1 2024 12:00AM', 'Jan  1 2024 12:00AM',
+                   '1', '1', '0', procedure_id)
+
+    def _procedure_list(self, query, params):
+        """
+        Get stored procedures a query is limited to.
+        :param str query: query string
+        :param params: query parameters
+        :type params: tuple(any)
+        :return: list of (procedure id, procedure name)
+        :rtype: list(tuple)
+        """
+        conditions = _conditions(query, params)
+        name = _equal(conditions, 'p.name')
+        if name is not None:
+            procedure_id = int(name[len('usp_procedure_'):]) if name.startswith('usp_procedure_') else self.procedures
+            names = [(procedure_id, name)] if procedure_id < self.procedures else []
+        else:
+            names = [(procedure_id, f'usp_procedure_{procedure_id:06d}') for procedure_id in range(self.procedures)]
+        return [(procedure_id, name) for procedure_id, name in names
+                if _matches(conditions, {'s.name': 'dbo', 'p.name': name})]
+
+    def _procedure_ep(self, query, params):
+        """
+        Records of stored procedure extended properties query, for a single procedure or all procedures.
+        """
+        for procedure_id, name in self._procedure_list(query, params):
+            yield procedure_id, 'MS_Description', f"Synthetic procedure {name}"
+
+    def _parameters(self, query, params):
+        """
+        Records of stored procedure parameters query - one to three parameters per procedure.
+        """
+        for procedure_id, name in self._procedure_list(query, params):
+            yield procedure_id, '@id', 'int', 'not set', 'INPUT'
+            if procedure_id % 2:
+                yield procedure_id, '@name', 'nvarchar', '128', 'INPUT'
+            if procedure_id % 3 == 0:
+                yield procedure_id, '@result', 'int', 'not set', 'OUTPUT'
+
+
+
+class MyFakeCursor:
+    """
+    Cursor serving synthetic catalog records.
+    """
+
+    def __init__(self, connection):
+        """
+        Initialize class instance.
+        :param connection: parent connection
+        :type connection: MyFakeConnection
+        """
+        self._connection = connection
+        self._records = iter(())
+        self.arraysize = 1
+
+    def execute(self, query, *params):
+        """
+        Execute query, waiting for configured latency first.
+        :param str query: query string
+        :param params: query parameters
+        :return: cursor object
+        :rtype: MyFakeCursor
+        """
+        if self._connection.latency:
+            time.sleep(self._connection.latency)
+        self._records = self._connection.catalog.execute(query, params)
+        return self
+
+    def fetchmany(self, size=None):
+        """
+        Read next batch of records.
+        :param int size: batch size, cursor array size by default
+        :return: list of records
+        :rtype: list(tuple)
+        """
+        records = []
+        for record in self._records:
+            records.append(record)
+            if len(records) >= (size or self.arraysize):
+                break
+        return records
+
+    def fetchall(self):
+        """
+        Read all remaining records.
+        :return: list of records
+        :rtype: list(tuple)
+        """
+        return list(self._records)
+
+    def close(self):
+        """
+        Release remaining records.
+        """
+        self._records = iter(())
+
+
+class MyFakeConnection:
+    """
+    Connection to synthetic catalog.
+    """
+
+    def __init__(self, catalog, latency):
+        """
+        Initialize class instance.
+        :param catalog: served catalog
+        :param float latency: delay of each query execution in seconds
+        :type catalog: MySyntheticCatalog
+        """
+        self.catalog = catalog
+        self.latency = latency
+
+    def cursor(self):
+        """
+        Create cursor.
+        :return: cursor object
+        :rtype: MyFakeCursor
+        """
+        return MyFakeCursor(self)
+
+    def close(self):
+        """
+        Close connection, nothing to release.
+        """
+        pass
+
+
+# currently served catalog and query latency
+catalog = MySyntheticCatalog()
+latency = 0.0
+
+
+def setup(_catalog, _latency=0.0):
+    """
+    Set catalog served by new connections.
+    :param _catalog: served catalog
+    :param float _latency: delay of each query execution in seconds
+    :type _catalog: MySyntheticCatalog
+    """
+    global catalog, latency
+    catalog = _catalog
+    latency = _latency
+
+
+def connect(conn_string, **kwargs):
+    """
+    Open connection to currently served catalog, mirrors pyodbc.connect().
+    :param str conn_string: connection string, ignored
+    :return: connection object
+    :rtype: MyFakeConnection
+    """
+    return MyFakeConnection(catalog, latency)
+
+
+def _conditions(query, params):
+    """
+    Read query filter conditions comparing a column with a query parameter.
+    :param str query: query string
+    :param params: query parameters, in order of parameter markers
+    :type params: tuple(any)
+    :return: list of (lowercase column name, operator, value)
+    :rtype: list(tuple)
+    """
+    found = re.findall(r"([\w.]+)\s+(not\s+like|like|=)\s*\?", query, re.IGNORECASE)
+    return [(column.lower(), ' '.join(operator.lower().split()), value)
+            for (column, operator), value in zip(found, params)]
+
+
+def _equal(conditions, column):
+    """
+    Read value a column is compared with for equality in query filter.
+    :param conditions: conditions read by _conditions()
+    :param str column: column name
+    :type conditions: list(tuple)
+    :return: compared value or None if column is not compared for equality
+    :rtype: str, optional
+    """
+    column = column.lower()
+    return next((value for name, operator, value in conditions if name == column and operator == '='), None)
+
+
+def _matches(conditions, values):
+    """
+    Check if record values meet query filter conditions - any of 'like' patterns and none of 'not like'
+    patterns of a column.
+    :param conditions: conditions read by _conditions()
+    :param values: record values per lowercase column name
+    :type conditions: list(tuple)
+    :type values: dict(str, str)
+    :return: True if record is included in query result
+    :rtype: bool
+    """
+    for column, value in values.items():
+        include = [pattern for name, operator, pattern in conditions if name == column and operator == 'like']
+        if include and not any(_like(pattern, value) for pattern in include):
+            return False
+        for name, operator, pattern in conditions:
+            if name != column:
+                continue
+            if operator == 'not like' and _like(pattern, value):
+                return False
+            if operator == '=' and pattern != value:
+                return False
+    return True
+
+
+def _like(pattern, value):
+    """
+    Match value with SQL LIKE pattern, case insensitive as default SQL Server collation.
+    :param str pattern: LIKE pattern
+    :param str value: matched value
+    :return: True if value matches pattern
+    :rtype: bool
+    """
+    expression = ''
+    for part in re.findall(r"\[[^\]]*\]|.", pattern, re.DOTALL):
+        if part == '%':
+            expression += '.*'
+        elif part == '_':
+            expression += '.'
+        elif len(part) > 1:
+            # character set, ranges kept
+            negate = part[1] == '^'
+            chars = ''.join(char if char == '-' else re.escape(char) for char in part[2 if negate else 1:-1])
+            expression += f"[{'^' if negate else ''}{chars}]"
+        else:
+            expression += re.escape(part)
+    return re.fullmatch(expression, value, re.IGNORECASE | re.DOTALL) is not None
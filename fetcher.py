@@ -5,13 +5,353 @@ Updates:
 
 * 2024-07-26 - v1.0 - creation
 * 2024-08-27 - v1.0 - code cleanup
+* 2026-10-16 - v1.1 - set-based bulk read of table details
+* 2026-10-16 - v1.1 - concurrent fetch with connection pool
+* 2026-10-16 - v1.1 - incremental runs based on object modification dates
+* 2026-10-16 - v1.1 - pipelined per-table fetch consumed by document builder
+* 2026-10-16 - v1.1 - compact metadata model
+* 2026-10-16 - v1.1 - schema, table and procedure filters applied in catalog queries
+* 2026-10-16 - v1.1 - parameterized per-object queries on reused cursors
+* 2026-10-16 - v1.1 - key constraints read from catalog views, joined on schema and name
+* 2026-10-16 - v1.1 - progress display instead of per-table console and log lines
+* 2026-10-16 - v1.1 - table storage read from partition statistics
+* 2026-10-16 - v1.1 - foreign key relationship graph
+* 2026-10-16 - v1.1 - set-based read of stored procedure extended properties and parameters
+* 2026-10-16 - v1.1 - connection pool lent by resident worker
+* 2026-10-16 - v1.1 - tables and stored procedures keyed by schema and name
 """
 
 # import generic libraries
+import os
 import sys
 import time
-import main
+import queue
 import pyodbc
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from snapshot import MySnapshot
+from model import Table, Column, Key, ExtendedProperty, Procedure, Parameter, Storage
+from graph import MyRelationships
+
+# seconds between checks of pipelined read cancellation while builder queue is full
+_stop_interval = 0.5
+
+# database options queries per configuration subject
+_options_queries = {'Configuration': ("select name, "
+                                      "cast(value as nvarchar(max)) as value, "
+                                      "cast(value_in_use as nvarchar(max)) as value_in_use "
+                                      "from sys.configurations"),
+                    'Scoped configuration': ("select name, "
+                                             "cast(value as nvarchar(max)) as value "
+                                             "from sys.database_scoped_configurations")}
+
+# key constraints query - primary keys, unique, foreign and check constraints of user tables, joined by object ids
+# so that constraint names repeated across schemas are not mixed up; {condition} filters schema (s.name) and table
+# (t.name) of each constraint type and its parameters are repeated per constraint type
+_keys_query = ("select schema_name, table_name, column_name, constraint_name, constraint_type, reference "
+               "from ("
+               "select s.name as schema_name, t.name as table_name, c.name as column_name, k.name as constraint_name, "
+               "case k.type when 'PK' then 'PRIMARY KEY' else 'UNIQUE' end as constraint_type, "
+               "cast('---' as nvarchar(max)) as reference, ic.key_ordinal as position "
+               "from sys.key_constraints k "
+               "join sys.tables t on k.parent_object_id = t.object_id "
+               "join sys.schemas s on t.schema_id = s.schema_id "
+               "join sys.index_columns ic on ic.object_id = k.parent_object_id and ic.index_id = k.unique_index_id "
+               "join sys.columns c on c.object_id = ic.object_id and c.column_id = ic.column_id "
+               "where {condition} "
+               "union all "
+               "select s.name, t.name, c.name, f.name, 'FOREIGN KEY', "
+               "cast(rs.name + '.' + rt.name + ' (' + rc.name + ')' as nvarchar(max)), fc.constraint_column_id "
+               "from sys.foreign_keys f "
+               "join sys.foreign_key_columns fc on fc.constraint_object_id = f.object_id "
+               "join sys.tables t on f.parent_object_id = t.object_id "
+               "join sys.schemas s on t.schema_id = s.schema_id "
+               "join sys.columns c on c.object_id = fc.parent_object_id and c.column_id = fc.parent_column_id "
+               "join sys.tables rt on fc.referenced_object_id = rt.object_id "
+               "join sys.schemas rs on rt.schema_id = rs.schema_id "
+               "join sys.columns rc on rc.object_id = fc.referenced_object_id "
+               "and rc.column_id = fc.referenced_column_id "
+               "where {condition} "
+               "union all "
+               "select s.name, t.name, isnull(c.name, '---'), k.name, 'CHECK', cast(k.definition as nvarchar(max)), 1 "
+               "from sys.check_constraints k "
+               "join sys.tables t on k.parent_object_id = t.object_id "
+               "join sys.schemas s on t.schema_id = s.schema_id "
+               "left join sys.columns c on c.object_id = k.parent_object_id and c.column_id = k.parent_column_id "
+               "where {condition}"
+               ") as key_columns "
+               "order by schema_name, table_name, "
+               "case constraint_type when 'PRIMARY KEY' then 0 when 'UNIQUE' then 1 "
+               "when 'FOREIGN KEY' then 2 else 3 end, "
+               "constraint_name, position")
+
+# stored procedure extended properties query - properties of procedure itself, parameter properties excluded;
+# {condition} filters schema (s.name) and procedure (p.name)
+_procedure_ep_query = ("select p.object_id, cast(ep.name as varchar(max)), cast(ep.value as varchar(max)) "
+                       "from sys.extended_properties ep "
+                       "join sys.procedures p on ep.major_id = p.object_id "
+                       "join sys.schemas s on p.schema_id = s.schema_id "
+                       "where ep.class = 1 and ep.minor_id = 0 and {condition} "
+                       "order by p.object_id, ep.name")
+
+# stored procedure parameters query - name, data type, character or binary length and direction in declaration
+# order, return value excluded; {condition} filters schema (s.name) and procedure (p.name)
+_parameters_query = ("select p.object_id, pa.name, type_name(pa.user_type_id), "
+                     "case when pa.max_length = -1 then 'max' "
+                     "when type_name(pa.system_type_id) in ('nchar', 'nvarchar') "
+                     "then cast(pa.max_length / 2 as varchar) "
+                     "when type_name(pa.system_type_id) in ('char', 'varchar', 'binary', 'varbinary') "
+                     "then cast(pa.max_length as varchar) else 'not set' end, "
+                     "case when pa.is_output = 1 then 'OUTPUT' else 'INPUT' end "
+                     "from sys.parameters pa "
+                     "join sys.procedures p on pa.object_id = p.object_id "
+                     "join sys.schemas s on p.schema_id = s.schema_id "
+                     "where pa.parameter_id > 0 and {condition} "
+                     "order by p.object_id, pa.parameter_id")
+
+
+class MyConnectionPool:
+    """
+    Bounded pool of database connections shared by fetch workers.
+    """
+
+    def __init__(self, conn_string, size):
+        """
+        Initialize class instance. Connections are opened on demand, up to a pool size.
+        :param str conn_string: pyodbc connection string
+        :param int size: maximum number of open connections
+        """
+        self._conn_string = conn_string
+        self._size = max(1, size)
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._connections = []
+        # cursors per connection and query text, each used only by thread holding the connection
+        self._cursors = {}
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for the duration of a ``with`` block, waiting for a free one if pool is exhausted.
+        :return: database connection object
+        :rtype: pyodbc.connect()
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def _acquire(self):
+        """
+        Take an idle connection or open a new one if pool size allows it.
+        :return: database connection object
+        :rtype: pyodbc.connect()
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._connections) < self._size:
+                conn = self._open()
+                self._connections.append(conn)
+                return conn
+        return self._idle.get()
+
+    def _open(self):
+        """
+        Open a new database connection.
+        :return: database connection object
+        :rtype: pyodbc.connect()
+        """
+        return pyodbc.connect(self._conn_string)
+
+    def cursor(self, conn, query):
+        """
+        Get cursor of a borrowed connection dedicated to a query. Repeated execution of the same parameterized
+        statement on the same cursor reuses statement prepared by the first execution.
+        :param conn: database connection borrowed from the pool
+        :param str query: query string
+        :type conn: pyodbc.connect()
+        :return: database cursor object
+        :rtype: pyodbc.Cursor
+        """
+        cursors = self._cursors.setdefault(id(conn), {})
+        cursor = cursors.get(query)
+        if cursor is None:
+            cursor = cursors[query] = conn.cursor()
+        return cursor
+
+    def close(self):
+        """
+        Close all cursors and connections opened by the pool.
+        """
+        with self._lock:
+            for cursors in self._cursors.values():
+                for cursor in cursors.values():
+                    try:
+                        cursor.close()
+                    except Exception:
+                        pass
+            self._cursors = {}
+            connections, self._connections = self._connections, []
+        self._discard(connections)
+
+    def _discard(self, connections):
+        """
+        Close connections of a closed pool.
+        :param connections: database connections
+        :type connections: list(pyodbc.connect())
+        """
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+class MyTableStream:
+    """
+    Table details read in background and handed over to document builder through a bounded queue, so that
+    rendering of a table overlaps with reading of the following ones. Details can be iterated only once.
+    """
+
+    # end of stream marker
+    _end = object()
+
+    def __init__(self, fetcher, structure, size):
+        """
+        Initialize class instance and start reading table details.
+        :param fetcher: data fetcher owning connection pool
+        :param structure: list of table records - catalog, schema, name, type
+        :param int size: maximum number of read tables waiting for builder
+        :type fetcher: MyFetcher
+        :type structure: list(any)
+        """
+        self._fetcher = fetcher
+        self._structure = structure
+        self._queue = queue.Queue(maxsize=max(1, size))
+        # connection pool is shared with other sections, it is closed by the last of fetcher and stream
+        self._users = 2
+        self._lock = threading.Lock()
+        self._progress = fetcher._core.utils.progress('tables', len(structure))
+        self._stop = threading.Event()
+        self.count = 0
+        self._thread = threading.Thread(target=self._produce, name='SQDoc-pipeline', daemon=True)
+        self._thread.start()
+
+    def __len__(self):
+        """
+        Number of tables read so far, final once details were iterated.
+        """
+        return self.count
+
+    def __iter__(self):
+        for name, details in self.items():
+            yield name
+
+    def items(self):
+        """
+        Get table details in structure order, as soon as they are read.
+        :return: generator of (table name, table details)
+        :rtype: Iterator[tuple]
+        :raise exc: exception raised while reading table details
+        """
+        while True:
+            item = self._queue.get()
+            if item is self._end or isinstance(item, Exception):
+                # keep marker for any further iteration
+                self._queue.put(item)
+                if item is self._end:
+                    return
+                raise item
+            yield item
+
+    def close(self):
+        """
+        Stop reading table details, called by builder once document is printed or its printing failed. Waits for
+        reads in flight, so connection pool is released before method returns.
+        """
+        self._stop.set()
+        self._thread.join()
+
+    def release(self):
+        """
+        Release connection pool, close it if it is not used any more.
+        """
+        with self._lock:
+            self._users -= 1
+            close = self._users == 0
+        if close:
+            self._fetcher._db_pool.close()
+
+    def _produce(self):
+        """
+        Read table details with up to worker count tables in flight, put them to queue in structure order.
+        Waits whenever queue is full, so number of tables held in memory stays bounded.
+        """
+        core = self._fetcher._core
+        workers = self._fetcher._workers
+        try:
+            with core.metrics.timer('phase', 'fetch (pipelined tables)'), \
+                    ThreadPoolExecutor(max_workers=workers, thread_name_prefix='SQDoc-detail') as executor:
+                pending = deque()
+                for table in self._structure:
+                    pending.append((table, executor.submit(self._fetcher._get_table_details, table)))
+                    if len(pending) >= workers and not self._put(*pending.popleft()):
+                        break
+                while pending and not self._stop.is_set():
+                    self._put(*pending.popleft())
+                # builder stopped reading, tables not started yet are not read
+                for table, future in pending:
+                    future.cancel()
+            if self._stop.is_set():
+                core.log.info(f"pipelined read stopped after {self._progress.summary()}")
+                return
+            core.log.info(f"read details of {self._progress.summary()}")
+            self._hand_over(self._end)
+        except Exception as exc:
+            # builder fails on exception instead of saving incomplete document
+            core.log.warn(f"cannot read table details: {exc}")
+            self._hand_over(exc)
+        finally:
+            self.release()
+
+    def _put(self, table, future):
+        """
+        Hand over details of a read table to builder.
+        :param table: table record - catalog, schema, name, type
+        :param future: table details read task
+        :type table: list(any)
+        :type future: concurrent.futures.Future
+        :return: False if builder stopped reading
+        :rtype: bool
+        """
+        details = future.result()
+        self._progress.update(failed=details is None)
+        if details is None:
+            return not self._stop.is_set()
+        self.count += 1
+        return self._hand_over((f"{table[1]}.{table[2]}", details))
+
+    def _hand_over(self, item):
+        """
+        Put item to builder queue, waiting while queue is full unless builder stopped reading.
+        :param item: table name and details, end of stream marker or exception
+        :type item: any
+        :return: False if builder stopped reading
+        :rtype: bool
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_stop_interval)
+                return True
+            except queue.Full:
+                pass
+        return False
 
 
 class MyFetcher:
@@ -24,30 +364,61 @@ class MyFetcher:
         Initialize cass instance.
         """
         self._core = _core
-        self._db_conn = self._set_connection()
+        self._workers = max(1, _core.fetch_settings['workers'])
+        self._db_pool = self._set_connection()
+        # incremental mode - previous run state and current object modification dates
+        self._previous = None
+        self._objects = None
+        self._pipeline = None
+        if _core.fetch_settings['incremental']:
+            self._previous = self._load_state()
+            self._objects = self._get_objects()
         self.db_config = False
+        # tables and stored procedures are keyed by schema and name, same names may be used in several schemas
         self.db_tables = False
         self.db_procedures = False
-        # obtain data depending on a document content settings
-        if _core.doc_content['db_configuration']:
-            self.db_config = self._get_db_configration()
-        if _core.doc_content['db_tables']:
-            self.db_tables = self._get_tables()
-        if _core.doc_content['db_procedures']:
-            self.db_procedures = self._get_procedures()
+        self.db_storage = False
+        self.db_relationships = False
+        # obtain data depending on a document content settings, sections are read concurrently
+        # per-table details are read by a separate executor, so section workers never wait on themselves
+        sections = {'db_config': (_core.doc_content['db_configuration'], self._get_db_configration),
+                    'db_tables': (_core.doc_content['db_tables'], self._get_tables),
+                    'db_procedures': (_core.doc_content['db_procedures'], self._get_procedures),
+                    'db_storage': (_core.doc_content['db_storage'], self._get_storage),
+                    'db_relationships': (_core.doc_content['db_relationships'], self._get_relationships)}
+        try:
+            with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='SQDoc-detail') as details, \
+                    ThreadPoolExecutor(max_workers=min(self._workers, len(sections)),
+                                       thread_name_prefix='SQDoc-section') as executor:
+                self._executor = details
+                futures = {attr: executor.submit(method) for attr, (enabled, method) in sections.items() if enabled}
+                for attr, future in futures.items():
+                    setattr(self, attr, future.result())
+        finally:
+            # pipelined table details may still be read, pool is closed once they are all read
+            if self._pipeline is None:
+                self._db_pool.close()
+            else:
+                self._pipeline.release()
+        if self._objects is not None:
+            self._save_state()
 
     def _set_connection(self):
         """
         Attempt to connect with database.
-        :return: database connection object or exit script on failure
-        :rtype: pyodbc.connect(), optional
+        :return: database connection pool or exit script on failure
+        :rtype: MyConnectionPool, optional
         """
         print(f"{self._core.utils.timestamp()} connecting with database")
         try:
-            _db_conn = pyodbc.connect(main.db_conn_string)
+            # resident worker lends pools of warm connections, closing them returns connections to the worker
+            _db_pool = self._core.db_pool or MyConnectionPool(self._core.db_conn_string, self._workers)
+            # open first connection up front to validate connection settings
+            with _db_pool.connection():
+                pass
             print(f"{self._core.utils.timestamp()} ┗ [OK] connection set")
-            self._core.log.info("connection with database established")
-            return _db_conn
+            self._core.log.info(f"connection with database established, up to {self._workers} connections in pool")
+            return _db_pool
         except Exception as exc:
             print(f"{self._core.utils.timestamp()} ┗ [ERROR] cannot establish connection")
             self._core.log.warn(f"cannot establish pyodbc connection with database: {str(exc)}")
@@ -63,22 +434,28 @@ class MyFetcher:
         self._core.log.info("reading database configuration details")
         print(f"{self._core.utils.timestamp()} reading database configuration details")
         for subject in ['Configuration', 'Scoped configuration']:
+            # server level configuration may be read once and shared across databases of the same server
+            if subject == 'Configuration' and self._core.server_config is not None:
+                print(f"{self._core.utils.timestamp()} ┗ {subject} [OK] shared server configuration")
+                results[subject] = self._core.server_config
+                continue
             results[subject] = self._get_db_options(subject)
         return results
 
     def _get_tables(self):
         """
         Attempt to read database structure.
-        :return: database details list or exit script on failure
-        :rtype: list(any), optional
+        :return: details per table, empty if no table matches filters, or exit script on failure
+        :rtype: dict(str, Table) | MyTableStream
         """
         # attempt to obtain db details
         print(f"----------\n{self._core.utils.timestamp()} reading database structure")
         try:
             self._core.log.info("reading database details")
-            query = ("SELECT TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE "
-                     "FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_NAME != 'sysdiagrams' ORDER BY TABLE_NAME")
-            structure = self._core.utils.get_data(self._db_conn, query)
+            condition, params = self._get_filter('tables', 'TABLE_SCHEMA', 'TABLE_NAME')
+            query = (f"SELECT TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE "
+                     f"FROM INFORMATION_SCHEMA.TABLES WHERE {condition} ORDER BY TABLE_NAME")
+            structure = self._get_data(query, params)
             print(f"{self._core.utils.timestamp()} ┗ [OK]")
         except Exception as exc:
             print(f"{self._core.utils.timestamp()} ┗ [ERROR] cannot read database details")
@@ -86,72 +463,272 @@ class MyFetcher:
             time.sleep(5)
             sys.exit(0)
 
+        # schema and table filters may leave no tables to document
+        if len(structure) == 0:
+            self._core.log.warn(f"no tables match configured filters")
+            return {}
         # proceed if succeeded
         print(f"----------\n{self._core.utils.timestamp()} reading table details")
         self._core.log.info("reading db tables")
-        results = {}
-        # loop tables
-        for table in structure:
-            try:
-                details = {}
-                catalog, schema, name, table_type = table
-                # get column info
-                details['columns'] = self._get_column_details(catalog, schema, name)
-                # get keys info
-                details['keys'] = self._get_key_details(catalog, schema, name)
-                # get extended properties info
-                details['extended'] = self._get_table_ep(schema, name)
-                # append
-                results[table[2]] = details
-                print(f"{self._core.utils.timestamp()} ┗ {table[2]}")
-                self._core.log.info(f"OK {table[2]}")
-            except Exception as ext:
-                print(f"{self._core.utils.timestamp()} ┗ [ERROR] {table[2]}")
-                self._core.log.warn(f"NOK - cannot read {table[2]} info: {ext}, skipping")
-                continue
-        # check data volume
+        results = None
+        # incremental fetch re-reads only tables altered since previous run
+        if self._previous and self._previous.db_tables and self._objects is not None:
+            results = self._get_tables_incremental(structure)
+        # set-based fetch, per-table queries kept as a fallback for restricted logins
+        if results is None and self._core.fetch_settings['bulk']:
+            results = self._get_tables_bulk(structure)
+        # pipelined fetch - table details are read while document is built
+        if results is None and self._pipeline_enabled():
+            print(f"{self._core.utils.timestamp()} ┗ [OK] {len(structure)} tables queued for pipelined read")
+            self._core.log.info(f"pipelined read of {len(structure)} tables")
+            self._pipeline = MyTableStream(self, structure, self._core.fetch_settings['pipeline'])
+            return self._pipeline
+        if results is None:
+            results = self._get_tables_single(structure)
         self._core.log.info(f"collected details of {len(results)} tables")
-        if len(results) > 0:
-            return results
-        else:
-            self._core.log.warn(f"no data for documentation, exiting")
-            sys.exit(0)
+        return results
+
+    def _pipeline_enabled(self):
+        """
+        Check if table details may be handed over to builder while being read. Incremental state, snapshots,
+        changelog, static table of contents, multiple output formats and documentation volumes need all table
+        details at once.
+        :return: True if pipelined fetch is enabled
+        :rtype: bool
+        """
+        settings = self._core.fetch_settings
+        build_settings = self._core.build_settings
+        return bool(settings['pipeline']) and self._objects is None and not settings['snapshot'] \
+            and not (build_settings['changelog'] or build_settings['static_toc']) \
+            and len(build_settings['formats']) == 1 \
+            and not (build_settings['volume_by_schema'] or build_settings['volume_tables'])
+
+    def _get_tables_single(self, structure):
+        """
+        Read table details with separate queries issued per table.
+        :param structure: list of table records - catalog, schema, name, type
+        :type structure: list(any)
+        :return: dictionary of details per table
+        :rtype: dict(str, any)
+        """
+        results = {}
+        progress = self._core.utils.progress('tables', len(structure))
+        # details are read concurrently, map keeps results in the original structure order
+        for table, details in zip(structure, self._executor.map(self._get_table_details, structure)):
+            progress.update(failed=details is None)
+            if details is not None:
+                results[f"{table[1]}.{table[2]}"] = details
+        self._core.log.info(f"read details of {progress.summary()}")
+        return results
+
+    def _get_table_details(self, table):
+        """
+        Read details of a single table.
+        :param table: table record - catalog, schema, name, type
+        :type table: list(any)
+        :return: table details or None on failure
+        :rtype: Table, optional
+        """
+        try:
+            catalog, schema, name, table_type = table
+            # get column info
+            columns = [Column.from_record(record) for record in self._get_column_details(catalog, schema, name)]
+            # get keys info
+            keys = dict.fromkeys(Key.from_record(record) for record in self._get_key_details(catalog, schema, name))
+            # get extended properties info
+            extended = [ExtendedProperty.from_record(record) for record in self._get_table_ep(schema, name)]
+            return Table(schema, name, columns, keys, extended)
+        except Exception as ext:
+            print(f"{self._core.utils.timestamp()} ┗ [ERROR] {table[2]}")
+            self._core.log.warn(f"NOK - cannot read {table[2]} info: {ext}, skipping")
+            return None
+
+    def _get_tables_incremental(self, structure):
+        """
+        Read details of tables created or altered since previous run, reuse previous details of the rest.
+        :param structure: list of table records - catalog, schema, name, type
+        :type structure: list(any)
+        :return: dictionary of details per table
+        :rtype: dict(str, any)
+        """
+        previous = self._previous.db_tables
+        changed = self._get_changed_objects(('U', 'V'))
+        stale = [table for table in structure
+                 if (table[1], table[2]) in changed or f"{table[1]}.{table[2]}" not in previous]
+        print(f"{self._core.utils.timestamp()} ┗ {len(stale)} of {len(structure)} tables changed since last run")
+        self._core.log.info(f"incremental mode, {len(stale)} of {len(structure)} tables changed since last run")
+        fetched = self._get_tables_single(stale)
+        results = {}
+        for catalog, schema, name, table_type in structure:
+            key = f"{schema}.{name}"
+            if key in fetched:
+                results[key] = fetched[key]
+            elif (schema, name) not in changed and key in previous:
+                results[key] = previous[key]
+        return results
+
+    def _get_tables_bulk(self, structure):
+        """
+        Read table details with one set-based query per detail type, grouped in memory by table.
+        :param structure: list of table records - catalog, schema, name, type
+        :type structure: list(any)
+        :return: dictionary of details per table or None if any of bulk queries failed
+        :rtype: dict(str, any), optional
+        """
+        self._core.log.info("reading table details in bulk mode")
+        queries = [self._executor.submit(method) for method in
+                   (self._get_column_details_bulk, self._get_key_details_bulk, self._get_table_ep_bulk)]
+        columns, keys, extended = [future.result() for future in queries]
+        if columns is None or keys is None or extended is None:
+            print(f"{self._core.utils.timestamp()} ┗ [ERROR] bulk read failed, reading tables one by one")
+            self._core.log.warn("cannot read table details in bulk mode, falling back to per-table queries")
+            return None
+        results = {}
+        for catalog, schema, name, table_type in structure:
+            results[f"{schema}.{name}"] = Table(schema, name, columns.get((schema, name), ()),
+                                                keys.get((schema, name), ()), extended.get((schema, name), ()))
+        print(f"{self._core.utils.timestamp()} ┗ [OK] {len(results)} tables")
+        self._core.log.info(f"OK {len(results)} tables read in bulk mode")
+        return results
 
     def _get_procedures(self):
         """
-        Attempt to obtain basic details about stored procedures.
-        :return: list of details per stored procedure
+        Attempt to obtain basic details about stored procedures. In bulk mode extended properties and parameters
+        of all procedures are read with one query each, alongside procedure list, so number of queries does not
+        depend on number of procedures.
+        :return: details per stored procedure, empty if no procedure matches filters, or False on failure
+        :rtype: dict(str, Procedure)
         """
         results = {}
         print(f"----------\n{self._core.utils.timestamp()} reading stored procedures")
         try:
-            # get raw properties of stored procedures
+            # get raw properties of stored procedures, object id follows printed properties
+            condition, params = self._get_filter('procedures', 's.name', 'p.name')
             query = (f"select p.name, s.name, cast(p.create_date as varchar(32)), cast(p.modify_date as varchar(32)), "
                      f"cast(m.uses_ansi_nulls as varchar(max)), cast(m.uses_quoted_identifier as varchar(max)), "
-                     f"cast(p.is_auto_executed as varchar(max)) "
+                     f"cast(p.is_auto_executed as varchar(max)), p.object_id "
                      f"from sys.procedures p "
                      f"inner join sys.schemas s on p.schema_id = s.schema_id "
                      f"inner join sys.sql_modules m on p.object_id = m.object_id "
-                     f"where p.name not like 'sp%'")
-            procedures = self._core.utils.get_data(self._db_conn, query)
+                     f"where {condition}")
+            bulk = None
+            if self._core.fetch_settings['bulk']:
+                bulk = [self._executor.submit(self._get_grouped_data, query_text.format(condition=condition),
+                                              record_type, params, 1)
+                        for query_text, record_type in ((_procedure_ep_query, ExtendedProperty.from_record),
+                                                        (_parameters_query, Parameter.from_record))]
+            procedures = self._get_data(query, params)
+            if bulk is not None:
+                bulk = [future.result() for future in bulk]
+                if None in bulk:
+                    print(f"{self._core.utils.timestamp()} ┗ [ERROR] bulk read failed, reading procedures one by one")
+                    self._core.log.warn("cannot read procedure details in bulk mode, falling back to per-procedure "
+                                        "queries")
+                    bulk = None
+            # incremental mode - details of unchanged procedures are taken from previous run
+            previous = {}
+            changed = set()
+            if bulk is None and self._previous and self._previous.db_procedures and self._objects is not None:
+                previous = self._previous.db_procedures
+                changed = self._get_changed_objects(('P',))
 
-            # obtain extended properties, return as dict
+            # obtain extended properties and parameters, return as dict
             if len(procedures) == 0:
-                return False
+                # procedure filters may leave no procedures to document, False is kept for read failures
+                print(f"{self._core.utils.timestamp()} ┗ [OK] no stored procedures")
+                self._core.log.warn("no stored procedures match configured filters")
+                return {}
             else:
                 for procedure in procedures:
-                    details = {'info': [['Created on', procedure[2]],
-                                        ['Updated on', procedure[3]],
-                                        ['Use ANSI nulls', procedure[4]],
-                                        ['Use quoted identifier', procedure[5]],
-                                        ['Is auto executed', procedure[6]]],
-                               'extended': self._get_procedure_ep(procedure[0], procedure[1])}
-                    results[procedure[0]] = details.copy()
+                    # same procedure name may be used in several schemas
+                    key = f"{procedure[1]}.{procedure[0]}"
+                    if bulk is not None:
+                        extended, parameters = (grouped.get((procedure[7],), ()) for grouped in bulk)
+                    elif key in previous and (procedure[1], procedure[0]) not in changed:
+                        extended = previous[key].extended
+                        parameters = previous[key].parameters
+                    else:
+                        extended = self._get_procedure_ep(procedure[0], procedure[1])
+                        parameters = self._get_procedure_parameters(procedure[0], procedure[1])
+                    results[key] = Procedure.from_record(procedure, extended, parameters)
+            print(f"{self._core.utils.timestamp()} ┗ [OK] {len(results)} stored procedures")
+            self._core.log.info(f"OK {len(results)} stored procedures"
+                                f"{' read in bulk mode' if bulk is not None else ''}")
             return results
         except Exception as exc:
             self._core.log.warn(f"cannot retrieve stored procedure details: {exc}")
             return False
 
+    def _get_storage(self):
+        """
+        Attempt to read row counts and disk space of all tables with a single query on partition statistics,
+        aggregated per table while records are streamed.
+        :return: storage per table, ordered by schema and table name, or False on failure
+        :rtype: list(Storage)
+        """
+        print(f"----------\n{self._core.utils.timestamp()} reading table storage")
+        self._core.log.info("reading table storage")
+        condition, params = self._get_filter('tables', 's.name', 't.name')
+        # heap or clustered index (index_id 0 or 1) holds table rows and data pages, other indexes add index pages
+        query = (f"select s.name, t.name, ps.index_id, ps.row_count, ps.reserved_page_count, ps.used_page_count, "
+                 f"ps.in_row_data_page_count + ps.lob_used_page_count + ps.row_overflow_used_page_count "
+                 f"from sys.dm_db_partition_stats ps "
+                 f"inner join sys.tables t on ps.object_id = t.object_id "
+                 f"inner join sys.schemas s on t.schema_id = s.schema_id "
+                 f"where {condition}")
+        totals = {}
+        try:
+            with self._db_pool.connection() as db_conn:
+                for schema, name, index_id, rows, reserved, used, data in self._core.utils.stream_data(
+                        db_conn, query, params, arraysize=self._core.fetch_settings['arraysize']):
+                    table = totals.setdefault((schema, name), [0, 0, 0, 0])
+                    table[1] += reserved
+                    table[2] += used
+                    if index_id < 2:
+                        table[0] += rows
+                        table[3] += data
+        except Exception as exc:
+            print(f"{self._core.utils.timestamp()} ┗ [ERROR] cannot read table storage")
+            self._core.log.warn(f"cannot read table storage: {exc}")
+            return False
+        # 8 KB pages
+        results = [Storage(schema, name, rows, reserved * 8, used * 8, data * 8, (used - data) * 8)
+                   for (schema, name), (rows, reserved, used, data) in sorted(totals.items())]
+        print(f"{self._core.utils.timestamp()} ┗ [OK] {len(results)} tables")
+        self._core.log.info(f"OK storage of {len(results)} tables")
+        return results
+
+    def _get_relationships(self):
+        """
+        Attempt to read all foreign keys between documented tables with a single query and index them by
+        referencing and referenced table.
+        :return: relationship graph or False on failure
+        :rtype: MyRelationships
+        """
+        print(f"----------\n{self._core.utils.timestamp()} reading table relationships")
+        self._core.log.info("reading table relationships")
+        condition, params = self._get_filter('tables', 's.name', 't.name')
+        query = (f"select f.name, s.name, t.name, rs.name, rt.name "
+                 f"from sys.foreign_keys f "
+                 f"inner join sys.tables t on f.parent_object_id = t.object_id "
+                 f"inner join sys.schemas s on t.schema_id = s.schema_id "
+                 f"inner join sys.tables rt on f.referenced_object_id = rt.object_id "
+                 f"inner join sys.schemas rs on rt.schema_id = rs.schema_id "
+                 f"where {condition} "
+                 f"order by s.name, t.name, f.name")
+        try:
+            with self._db_pool.connection() as db_conn:
+                results = MyRelationships(self._core.utils.stream_data(
+                    db_conn, query, params, arraysize=self._core.fetch_settings['arraysize']))
+        except Exception as exc:
+            print(f"{self._core.utils.timestamp()} ┗ [ERROR] cannot read table relationships")
+            self._core.log.warn(f"cannot read table relationships: {exc}")
+            return False
+        print(f"{self._core.utils.timestamp()} ┗ [OK] {len(results.foreign_keys)} foreign keys, "
+              f"{len(results.tables)} tables")
+        self._core.log.info(f"OK {len(results.foreign_keys)} foreign keys between {len(results.tables)} tables")
+        return results
+
     # utility methods for obtaining details
 
     def _get_column_details(self, catalog, schema, name):
@@ -163,25 +740,22 @@ class MyFetcher:
         :return: table properties list
         :rtype: list(any)
         """
-        query = (f"select column_name, data_type, isnull(cast(character_maximum_length as varchar), 'not set'),"
-                 f" is_nullable from information_schema.columns "
-                 f"where table_catalog = '{catalog}' and table_schema = '{schema}' and table_name = '{name}'")
-        return self._core.utils.get_data(self._db_conn, query)
+        query = ("select column_name, data_type, isnull(cast(character_maximum_length as varchar), 'not set'),"
+                 " is_nullable from information_schema.columns "
+                 "where table_catalog = ? and table_schema = ? and table_name = ?")
+        return self._get_prepared_data(query, (catalog, schema, name))
 
     def _get_key_details(self, catalog, schema, name):
         """
         Attempt to obtain key details for a given table.
-        :param str catalog: catalog name
+        :param str catalog: catalog name, catalog views describe current database only
         :param str schema: schema name
         :param str name: table name
-        :return: table keys list
+        :return: table keys list - column, constraint name, constraint type, reference
         :rtype: list(any)
         """
-        query = (f"select K.table_name, K.column_name, K.constraint_name, T.constraint_type "
-                 f"from information_schema.key_column_usage as K "
-                 f"join information_schema.table_constraints as T on K.constraint_name = T.constraint_name "
-                 f"where K.table_catalog = '{catalog}' and K.table_schema = '{schema}' and K.table_name = '{name}'")
-        return self._core.utils.get_data(self._db_conn, query)
+        query = _keys_query.format(condition="s.name = ? and t.name = ?")
+        return [record[2:] for record in self._get_prepared_data(query, (schema, name) * 3)]
 
     def _get_table_ep(self, schema, name):
         """
@@ -191,13 +765,206 @@ class MyFetcher:
         :return: table extended properties list
         :rtype: list(any)
         """
-        query = (f"select cast(isnull(p.name, '---') as varchar(max)) as Property, "
+        query = ("select cast(isnull(p.name, '---') as varchar(max)) as Property, "
+                 "cast(isnull(p.value, '---') as varchar(max)) as Value "
+                 "from sys.extended_properties p "
+                 "inner join sys.tables t on p.major_id = t.object_id "
+                 "inner join sys.schemas s on t.schema_id = s.schema_id "
+                 "where t.name = ? and s.name = ? and p.class = 1 and p.minor_id = 0")
+        return self._get_prepared_data(query, (name, schema))
+
+    def _get_column_details_bulk(self):
+        """
+        Attempt to obtain column details of all tables in a single query.
+        :return: column details lists per (schema, table) or None on failure
+        :rtype: dict(tuple, list), optional
+        """
+        condition, params = self._get_filter('tables', 'table_schema', 'table_name')
+        query = (f"select table_schema, table_name, column_name, data_type, "
+                 f"isnull(cast(character_maximum_length as varchar), 'not set'), is_nullable "
+                 f"from information_schema.columns "
+                 f"where table_catalog = db_name() and {condition} "
+                 f"order by table_schema, table_name, ordinal_position")
+        return self._get_grouped_data(query, Column.from_record, params)
+
+    def _get_key_details_bulk(self):
+        """
+        Attempt to obtain key details of all tables in a single query.
+        :return: unique key details per (schema, table) or None on failure
+        :rtype: dict(tuple, list), optional
+        """
+        condition, params = self._get_filter('tables', 's.name', 't.name')
+        grouped = self._get_grouped_data(_keys_query.format(condition=condition), Key.from_record, params * 3)
+        if grouped is None:
+            return None
+        return {table: list(dict.fromkeys(keys)) for table, keys in grouped.items()}
+
+    def _get_table_ep_bulk(self):
+        """
+        Attempt to obtain extended properties of all tables in a single query.
+        :return: extended properties lists per (schema, table) or None on failure
+        :rtype: dict(tuple, list), optional
+        """
+        condition, params = self._get_filter('tables', 's.name', 't.name')
+        query = (f"select s.name, t.name, "
+                 f"cast(isnull(p.name, '---') as varchar(max)) as Property, "
                  f"cast(isnull(p.value, '---') as varchar(max)) as Value "
                  f"from sys.extended_properties p "
                  f"inner join sys.tables t on p.major_id = t.object_id "
                  f"inner join sys.schemas s on t.schema_id = s.schema_id "
-                 f"where t.name = '{name}' and s.name = '{schema}' and p.minor_id = 0")
-        return self._core.utils.get_data(self._db_conn, query)
+                 f"where p.class = 1 and p.minor_id = 0 and {condition}")
+        return self._get_grouped_data(query, ExtendedProperty.from_record, params)
+
+    # utility methods for incremental runs
+
+    def _get_objects(self):
+        """
+        Attempt to read identifiers and modification dates of user tables, views and stored procedures.
+        :return: dictionary of [schema, name, type, modify date] per object id or None on failure
+        :rtype: dict(str, list), optional
+        """
+        # style 121 keeps milliseconds, default style would hide changes made within the same minute
+        condition, params = self._get_filter(None, 's.name', 'o.name')
+        query = (f"select o.object_id, s.name, o.name, rtrim(o.type), convert(varchar(23), o.modify_date, 121) "
+                 f"from sys.objects o "
+                 f"inner join sys.schemas s on o.schema_id = s.schema_id "
+                 f"where o.type in ('U', 'V', 'P') and o.is_ms_shipped = 0 and {condition}")
+        data = self._get_data(query, params)
+        if data is None:
+            self._core.log.warn("cannot read object modification dates, incremental mode disabled")
+            return None
+        return {str(record[0]): record[1:] for record in data}
+
+    def _get_changed_objects(self, types):
+        """
+        Compare current objects with previous run state.
+        :param tuple types: object types to compare
+        :return: set of (schema, name) of objects created or altered since previous run
+        :rtype: set(tuple)
+        """
+        previous = self._previous.objects
+        changed = set()
+        for object_id, record in self._objects.items():
+            if record[2] in types and previous.get(object_id) != record:
+                changed.add((record[0], record[1]))
+        dropped = [object_id for object_id, record in previous.items()
+                   if record[2] in types and object_id not in self._objects]
+        if dropped:
+            self._core.log.info(f"{len(dropped)} objects of type {', '.join(types)} dropped since last run")
+        return changed
+
+    def _state_file(self):
+        """
+        Get path of incremental run state file.
+        :return: state file path
+        :rtype: str
+        """
+        return os.path.join(self._core.state, f"{self._core.db_name}_state.sqdoc")
+
+    def _load_state(self):
+        """
+        Attempt to read state saved by previous run.
+        :return: previous run snapshot or None if not available
+        :rtype: MySnapshot, optional
+        """
+        path = self._state_file()
+        if not os.path.isfile(path):
+            self._core.log.info(f"no previous state in {path}, reading full catalog")
+            return None
+        try:
+            state = MySnapshot.load(path)
+            if state.objects is None:
+                raise ValueError("snapshot contains no object modification dates")
+            return state
+        except Exception as exc:
+            self._core.log.warn(f"cannot read previous state {path}: {exc}, reading full catalog")
+            return None
+
+    def _save_state(self):
+        """
+        Attempt to save current objects and fetched details for next incremental run.
+        """
+        path = self._state_file()
+        try:
+            MySnapshot(self._core.db_name, self.db_config, self.db_tables, self.db_procedures, self._objects).save(path)
+            self._core.log.info(f"incremental state saved: {path}")
+        except Exception as exc:
+            self._core.log.warn(f"cannot save incremental state {path}: {exc}")
+
+    def _get_filter(self, subject, schema_column, name_column):
+        """
+        Build query condition of schema and object name include / exclude patterns set in fetch filters.
+        :param str subject: 'tables' or 'procedures' - filtered object type, schema filter only if not set
+        :param str schema_column: column containing schema name
+        :param str name_column: column containing object name
+        :return: query condition and its parameters
+        :rtype: tuple(str, list)
+        """
+        conditions = []
+        params = []
+        filters = [(schema_column, self._core.fetch_filters['schemas'])]
+        if subject:
+            filters.append((name_column, self._core.fetch_filters[subject]))
+        for column, patterns in filters:
+            if patterns['include']:
+                conditions.append(f"({' or '.join(f'{column} like ?' for _ in patterns['include'])})")
+                params += patterns['include']
+            for pattern in patterns['exclude']:
+                conditions.append(f"{column} not like ?")
+                params.append(pattern)
+        return ' and '.join(conditions) or '1 = 1', params
+
+    def _get_data(self, query, params=()):
+        """
+        Run query on a connection borrowed from the pool.
+        :param str query: query string
+        :param params: query parameters
+        :type params: list(any)
+        :return: list of records - result of query
+        :rtype: list[Any], optional
+        """
+        with self._db_pool.connection() as db_conn:
+            return self._core.utils.get_data(db_conn, query, params,
+                                             arraysize=self._core.fetch_settings['arraysize'])
+
+    def _get_prepared_data(self, query, params):
+        """
+        Run parameterized query repeated per object on a cursor reused for the query text, so that statement
+        is prepared once per pooled connection and its plan is reused by the server.
+        :param str query: query string with ? parameter markers
+        :param params: query parameters
+        :type params: tuple(any)
+        :return: list of records - result of query
+        :rtype: list[Any], optional
+        """
+        with self._db_pool.connection() as db_conn:
+            return self._core.utils.get_data(db_conn, query, params, arraysize=self._core.fetch_settings['arraysize'],
+                                             cursor=self._db_pool.cursor(db_conn, query))
+
+    def _get_grouped_data(self, query, record_type, params=(), fields=2):
+        """
+        Run bulk query and group its records by object while they are streamed from database. Leading fields
+        of each record are expected to identify an object - schema and table name by default - remaining fields
+        are kept as record details.
+        :param str query: query string
+        :param record_type: factory creating model object of record details
+        :param params: query parameters
+        :param int fields: number of leading fields identifying an object
+        :type record_type: callable
+        :type params: list(any)
+        :return: model object lists per object identifier tuple, (schema, table) by default, or None on failure
+        :rtype: dict(tuple, list), optional
+        """
+        grouped = {}
+        try:
+            with self._db_pool.connection() as db_conn:
+                for record in self._core.utils.stream_data(db_conn, query, params,
+                                                           arraysize=self._core.fetch_settings['arraysize']):
+                    grouped.setdefault(tuple(record[:fields]), []).append(record_type(record[fields:]))
+            return grouped
+        except Exception as exc:
+            self._core.log.warn(f"cannot read bulk query result: {exc}")
+            return None
 
     def _get_db_options(self, subject):
         """
@@ -205,24 +972,15 @@ class MyFetcher:
         :return: dictionary of configuration details
         :rtype: dict(str, any)
         """
-        query = ""
         # set query
-        if subject == 'Configuration':
-            query = ("select name, "
-                     "cast(value as nvarchar(max)) as value, "
-                     "cast(value_in_use as nvarchar(max)) as value_in_use "
-                     "from sys.configurations")
-        if subject == 'Scoped configuration':
-            query = ("select name, "
-                     "cast(value as nvarchar(max)) as value "
-                     "from sys.database_scoped_configurations")
+        query = _options_queries.get(subject, "")
         if not query:
             return ["Not configured"]
         else:
             # execute query
             try:
                 print(f"{self._core.utils.timestamp()} ┗ {subject} [OK]")
-                data = self._core.utils.get_data(self._db_conn, query)
+                data = self._get_data(query)
                 return data
             except Exception as exc:
                 print(f"{self._core.utils.timestamp()} ┗ {subject} [ERROR]")
@@ -232,19 +990,42 @@ class MyFetcher:
     def _get_procedure_ep(self, name, schema):
         """
         Attempt to read extended properties of a procedure
-        :return: 
-        """
-        query = (f"select cast(ep.name as varchar(max)), cast(ep.value as varchar(max)) "
-                 f"from sys.extended_properties ep "
-                 f"join sys.objects o on ep.major_id = o.object_id "
-                 f"join sys.schemas s on o.schema_id = s.schema_id "
-                 f"where o.type = 'P' and s.name = '{schema}' and o.name = '{name}' "
-                 f"order by ep.name;")
-        properties = self._core.utils.get_data(self._db_conn, query)
-        if len(properties) > 0:
-            return properties
-        else:
-            return False
+        :return: procedure extended properties
+        :rtype: list(ExtendedProperty)
+        """
+        query = _procedure_ep_query.format(condition="s.name = ? and p.name = ?")
+        return [ExtendedProperty.from_record(record[1:]) for record in self._get_prepared_data(query, (schema, name))]
+
+    def _get_procedure_parameters(self, name, schema):
+        """
+        Attempt to read parameters of a procedure.
+        :param str name: procedure name
+        :param str schema: schema name
+        :return: procedure parameters in declaration order
+        :rtype: list(Parameter)
+        """
+        query = _parameters_query.format(condition="s.name = ? and p.name = ?")
+        return [Parameter.from_record(record[1:]) for record in self._get_prepared_data(query, (schema, name))]
+
+
+def get_server_configuration(_core, conn_string):
+    """
+    Read server level configuration, to be shared by data fetchers of all databases of a server.
+    :param _core: SQDoc script object
+    :param str conn_string: pyodbc connection string of any database of a server
+    :type _core: SQDoc()
+    :return: configuration details list or None on failure
+    :rtype: list(any), optional
+    """
+    try:
+        db_conn = pyodbc.connect(conn_string)
+        try:
+            return _core.utils.get_data(db_conn, _options_queries['Configuration'])
+        finally:
+            db_conn.close()
+    except Exception as exc:
+        _core.log.warn(f"cannot read server configuration: {exc}")
+        return None
 
 
 def execute(_core):
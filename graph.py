@@ -0,0 +1,250 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: foreign key relationship graph - adjacency index of referencing and referenced tables, dependency
+              depth, connected table groups and Graphviz / Mermaid export
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+"""
+
+# import generic libraries
+import os
+from collections import deque
+
+# engine modules
+from model import ForeignKey
+
+# relationship graph export file extensions per format
+extensions = {'dot': 'dot', 'mermaid': 'mmd'}
+
+
+class MyRelationships:
+    """
+    Class responsible for indexing foreign keys by table. Every computation visits each table and foreign key
+    a constant number of times, so it stays linear on large schemas.
+    """
+
+    def __init__(self, foreign_keys):
+        """
+        Initialize class instance, build adjacency index and compute table depth and groups.
+        :param foreign_keys: foreign keys of documented tables
+        :type foreign_keys: list(ForeignKey)
+        """
+        self.foreign_keys = [ForeignKey(*item) for item in foreign_keys]
+        # referenced and referencing tables per table, both keep first occurrence order
+        self.references = {}
+        self.referenced_by = {}
+        for item in self.foreign_keys:
+            table = f"{item.schema}.{item.table}"
+            referenced = f"{item.referenced_schema}.{item.referenced_table}"
+            self.references.setdefault(referenced, {})
+            self.referenced_by.setdefault(table, {})
+            self.references.setdefault(table, {})[referenced] = None
+            self.referenced_by.setdefault(referenced, {})[table] = None
+        self.tables = sorted(self.references)
+        self.depth = self._get_depth()
+        self.groups = self._get_groups()
+
+    def _get_cycles(self):
+        """
+        Find strongly connected components - tables referencing each other in cycles, iterative Tarjan algorithm.
+        :return: list of components, each listed after components it references
+        :rtype: list(list)
+        """
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        components = []
+        for root in self.tables:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.references[root]))]
+            while work:
+                table, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = low[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.references[child])))
+                        break
+                    if child in on_stack:
+                        low[table] = min(low[table], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[table])
+                    if low[table] == index[table]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == table:
+                                break
+                        components.append(component)
+        return components
+
+    def _get_depth(self):
+        """
+        Compute dependency depth - length of the longest chain of referenced tables, 0 for tables referencing no
+        other table. Tables in a reference cycle share depth.
+        :return: depth per table
+        :rtype: dict(str, int)
+        """
+        depth = {}
+        component_of = {}
+        for component_id, component in enumerate(self._get_cycles()):
+            for table in component:
+                component_of[table] = component_id
+            # referenced components are already computed
+            depth_value = max((depth[child] + 1 for table in component for child in self.references[table]
+                               if component_of.get(child) != component_id), default=0)
+            for table in component:
+                depth[table] = depth_value
+        return depth
+
+    def _get_groups(self):
+        """
+        Find groups of tables connected by foreign keys in any direction, largest group first.
+        :return: group number per table, starting from 1
+        :rtype: dict(str, int)
+        """
+        groups = []
+        visited = set()
+        for root in self.tables:
+            if root in visited:
+                continue
+            visited.add(root)
+            group = [root]
+            pending = deque([root])
+            while pending:
+                table = pending.popleft()
+                for neighbour in (*self.references[table], *self.referenced_by[table]):
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        group.append(neighbour)
+                        pending.append(neighbour)
+            groups.append(group)
+        groups.sort(key=len, reverse=True)
+        return {table: group_id for group_id, group in enumerate(groups, 1) for table in group}
+
+    @property
+    def rows(self):
+        """
+        Relationships per table formatted for printing, ordered by group, depth and table name.
+        :return: table, referenced tables, referencing tables, depth, group
+        :rtype: list(list)
+        """
+        tables = sorted(self.tables, key=lambda table: (self.groups[table], self.depth[table], table))
+        return [[table, ', '.join(self.references[table]) or '---', ', '.join(self.referenced_by[table]) or '---',
+                 str(self.depth[table]), str(self.groups[table])] for table in tables]
+
+    @property
+    def group_rows(self):
+        """
+        Table groups formatted for printing.
+        :return: group, number of tables, number of foreign keys, largest depth
+        :rtype: list(list)
+        """
+        summary = {}
+        for table in self.tables:
+            group = summary.setdefault(self.groups[table], [0, 0, 0])
+            group[0] += 1
+            group[2] = max(group[2], self.depth[table])
+        for item in self.foreign_keys:
+            summary[self.groups[f"{item.schema}.{item.table}"]][1] += 1
+        return [[str(group_id)] + [str(value) for value in values] for group_id, values in sorted(summary.items())]
+
+    def as_dict(self):
+        """
+        Get relationships as JSON serializable dictionary.
+        :return: foreign keys and relationships per table
+        :rtype: dict(str, any)
+        """
+        return {'foreign_keys': [item._asdict() for item in self.foreign_keys],
+                'tables': {table: {'references': list(self.references[table]),
+                                   'referenced_by': list(self.referenced_by[table]),
+                                   'depth': self.depth[table], 'group': self.groups[table]}
+                           for table in self.tables}}
+
+    def to_dot(self, title):
+        """
+        Get relationship graph in Graphviz DOT language.
+        :param str title: graph name
+        :return: graph source
+        :rtype: str
+        """
+        lines = [f'digraph {_quote(title)} {{', '  rankdir=LR;', '  node [shape=box, fontname="Calibri"];']
+        lines += [f'  {_quote(table)};' for table in self.tables]
+        lines += [f'  {_quote(f"{item.schema}.{item.table}")} -> '
+                  f'{_quote(f"{item.referenced_schema}.{item.referenced_table}")} [label={_quote(item.name)}];'
+                  for item in self.foreign_keys]
+        return '\n'.join(lines + ['}']) + '\n'
+
+    def to_mermaid(self):
+        """
+        Get relationship graph as Mermaid flowchart.
+        :return: graph source
+        :rtype: str
+        """
+        node = {table: f"t{table_id}" for table_id, table in enumerate(self.tables)}
+        lines = ['flowchart LR']
+        lines += [f'  {node[table]}["{_mermaid(table)}"]' for table in self.tables]
+        lines += [f'  {node[f"{item.schema}.{item.table}"]} -->|"{_mermaid(item.name)}"| '
+                  f'{node[f"{item.referenced_schema}.{item.referenced_table}"]}' for item in self.foreign_keys]
+        return '\n'.join(lines) + '\n'
+
+
+def _quote(text):
+    """
+    Quote DOT identifier.
+    :param str text: identifier
+    :return: quoted identifier
+    :rtype: str
+    """
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _mermaid(text):
+    """
+    Escape Mermaid label text.
+    :param str text: label text
+    :return: escaped label text
+    :rtype: str
+    """
+    return text.replace('"', '#quot;')
+
+
+def execute(_details, _core):
+    """
+    Save relationship graph in configured export formats next to documentation.
+    :param _details: data fetcher object
+    :param _core: SQDoc script object
+    :type _details: MyFetcher()
+    :type _core: SQDoc()
+    :return: list of saved file paths
+    :rtype: list(str)
+    """
+    paths = []
+    if not _details.db_relationships:
+        return paths
+    for output in _core.build_settings['graph_formats']:
+        path = os.path.join(_core.export, f"{_core.db_name}_relationships.{extensions[output]}")
+        try:
+            source = _details.db_relationships.to_dot(_core.db_name) if output == 'dot' \
+                else _details.db_relationships.to_mermaid()
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(source)
+            print(f"{_core.utils.timestamp()} relationship graph saved: {path}")
+            _core.log.info(f"relationship graph saved: {path}")
+            paths.append(path)
+        except Exception as exc:
+            print(f"{_core.utils.timestamp()} [ERROR] cannot save relationship graph, check log for details")
+            _core.log.warn(f"cannot save relationship graph {path}: {exc}")
+    return paths
@@ -5,6 +5,20 @@ Updates:
 
 * 2024-07-26 - v1.0 - creation
 * 2024-08-27 - v1.0 - code cleanup, adding document property settings
+* 2026-10-16 - v1.1 - data fetch settings
+* 2026-10-16 - v1.1 - offline snapshots of fetched data
+* 2026-10-16 - v1.1 - batch mode settings
+* 2026-10-16 - v1.1 - run metrics
+* 2026-10-16 - v1.1 - output format settings
+* 2026-10-16 - v1.1 - documentation volume settings
+* 2026-10-16 - v1.1 - data fetch filters
+* 2026-10-16 - v1.1 - changelog against previous snapshot
+* 2026-10-16 - v1.1 - render cache settings
+* 2026-10-16 - v1.1 - static table of contents setting
+* 2026-10-16 - v1.1 - table storage section
+* 2026-10-16 - v1.1 - table relationships section and graph export
+* 2026-10-16 - v1.1 - resident worker settings
+* 2026-10-16 - v1.1 - documentation run shared by all entry points
 """
 
 # import generic libraries
@@ -17,33 +31,94 @@ from datetime import date, datetime
 import fetcher as f
 import builder as b
 import utility as u
+import snapshot as s
+import metrics as m
+import diff as d
+import graph as g
 
 # global variables
 _main_path = "C:\\SQDoc"
 _logs_path = "C:\\SQDoc\\logs"
 _docs_path = "C:\\SQDoc\\docx"
+_state_path = "C:\\SQDoc\\state"
+_snapshots_path = "C:\\SQDoc\\snapshots"
+_metrics_path = "C:\\SQDoc\\metrics"
+_cache_path = "C:\\SQDoc\\cache"
+_spool_path = "C:\\SQDoc\\spool"
 _db_name = "Neo_DB"
 db_conn_string = "Driver={SQL Server};Server=G02PLXN08339\\SQLEXPRESS;Database=Neo_DB;Trusted_Connection=yes;"
 
+# batch mode - servers and databases documented by batch.py, connection string template filled per database
+_batch_targets = [{'server': 'G02PLXN08339\\SQLEXPRESS', 'databases': ['Neo_DB']}]
+_batch_conn_string = "Driver={{SQL Server}};Server={server};Database={database};Trusted_Connection=yes;"
+# processes - number of databases documented concurrently
+_batch_settings = {'processes': 4}
+
 # printed document properties
 _doc_properties = [['Owner:', 'ECS'], ['Author:', 'Michal Paradowski'], ['E-mail:', 'michal.paradowski@fujitsu.com'],
                    ['Version:', '1.0'], ['Status:', 'Final'], ['Created on:', date.today().strftime("%Y-%m-%d")]]
 
 # printed document content setting
 # set sections available for printing to be included
-_doc_content = {'db_configuration': True, 'db_tables': True, 'db_procedures': True}
+# db_storage - row counts and disk space of tables from partition statistics, needs VIEW DATABASE STATE permission
+# db_relationships - foreign keys between tables, with table dependency depth and groups of related tables
+_doc_content = {'db_configuration': True, 'db_tables': True, 'db_procedures': True, 'db_storage': False,
+                'db_relationships': False}
 
+# data fetch settings
+# bulk - read details of all tables with one query per detail type instead of per-table queries
+# workers - number of concurrent fetch workers and pooled database connections
+# incremental - re-read only objects altered since previous run, based on state kept in _state_path
+# snapshot - save fetched details to _snapshots_path, enabling document rendering without database access
+# arraysize - number of records read from database per batch
+# pipeline - number of per-table details read ahead of document builder, 0 reads all tables before building;
+#            applies to per-table reads only - bulk disabled or failed - with single output format, without
+#            incremental mode, snapshots, changelog and static table of contents; read time of pipelined tables
+#            is reported as its own fetch phase
+_fetch_settings = {'bulk': True, 'workers': 4, 'incremental': False, 'snapshot': False, 'arraysize': 1000,
+                   'pipeline': 16}
 
-class SQDoc:
-    """
-    Main executable.
-    """
+# data fetch filters - SQL LIKE patterns of documented schemas, tables and stored procedures, applied in catalog
+# queries; include - object is read if it matches any pattern, all objects if empty; exclude - object is skipped if
+# it matches any pattern; use [_] and [%] to match literal underscore and percent sign
+_fetch_filters = {'schemas': {'include': [], 'exclude': []},
+                  'tables': {'include': [], 'exclude': ['sysdiagrams']},
+                  'procedures': {'include': [], 'exclude': ['sp%']}}
 
-    def __init__(self):
-        """
-        Initialize class instance.
-        """
-        print("""
+# document build settings
+# streaming - write document body to file as it is produced instead of keeping whole document in memory
+# formats - output formats created from one data fetch: 'docx', 'md', 'html', 'json'
+# volume_by_schema - split documentation into volumes per schema, with an index document linking volumes
+# volume_tables - maximum number of tables per volume, 0 for no limit; volumes are not used if 0 and not split by schema
+# volume_processes - number of processes printing volumes concurrently
+# changelog - print *.docx changelog of fetched details against latest snapshot in _snapshots_path, before new
+#             snapshot is saved; use with snapshot fetch setting to compare consecutive runs
+# render_cache - reuse *.docx sections of tables and procedures with details unchanged since they were printed,
+#                kept in _cache_path and shared by all databases
+# render_cache_size - render cache size limit in MB, least recently used sections are removed above limit
+# static_toc - print *.docx table of contents at build time, linking headings, instead of a field Word rebuilds on
+#              open; Word can still refresh it on request to add page numbers
+# storage_top - number of largest tables listed at the beginning of storage section
+# graph_formats - relationship graph files saved next to documentation when db_relationships is printed:
+#                 'dot' (Graphviz), 'mermaid'
+_build_settings = {'streaming': False, 'formats': ['docx'], 'volume_by_schema': False, 'volume_tables': 0,
+                   'volume_processes': 4, 'changelog': False, 'render_cache': False, 'render_cache_size': 256,
+                   'static_toc': False, 'storage_top': 20, 'graph_formats': []}
+
+# resident worker settings, see worker.py
+# port - local TCP port accepting jobs on 127.0.0.1, 0 to accept jobs from _spool_path only
+# spool - scan _spool_path for job files
+# poll_interval - seconds between spool directory scans
+# idle_timeout - seconds after which unused warm connections and cached server configuration are dropped
+_worker_settings = {'port': 8765, 'spool': True, 'poll_interval': 1.0, 'idle_timeout': 300}
+
+# run metrics settings
+# export - save query counters, phase and section timings to _metrics_path as JSON and Prometheus textfile
+# profile - save cProfile statistics of main thread and fetch worker threads next to metrics
+_metrics_settings = {'export': True, 'profile': False}
+
+# console banner
+_banner = """
 __________________________________________
 
 ███████╗ ██████╗ ██████╗ 
@@ -54,10 +129,54 @@ __________________________________________
 ╚══════╝ ╚══▀▀═╝ ╚═════╝  ╚═════╝  ╚═════╝
 __________________________________________
   MSSQL Database documentation processor
-        """)
+        """
+
+
+def run(_core, details=None):
+    """
+    Document a database - fetch its details, print changelog against latest snapshot and save a new one, print
+    documents, relationship graph and run metrics. Shared by single run, batch, resident worker and snapshot
+    rendering.
+    :param _core: SQDoc script object or job object exposing the same settings
+    :param details: details rendered from snapshot, fetched from database if not set
+    :type details: MySnapshot, optional
+    :return: documented details or None if data fetch failed
+    :rtype: MyFetcher() | MySnapshot, optional
+    """
+    if details is None:
+        with _core.metrics.timer('phase', 'fetch'):
+            details = f.execute(_core)
+        if details is None:
+            return None
+        if _core.build_settings['changelog']:
+            d.execute(details, _core)
+        if _core.fetch_settings['snapshot']:
+            s.execute(details, _core)
+    with _core.metrics.timer('phase', 'build'):
+        b.execute(details, _core)
+    if _core.doc_content['db_relationships']:
+        g.execute(details, _core)
+    if _metrics_settings['export']:
+        m.execute(_core)
+    return details
+
+
+class SQDoc:
+    """
+    Main executable.
+    """
+
+    def __init__(self):
+        """
+        Initialize class instance.
+        """
+        print(_banner)
 
-        # import utility methods class
-        self.utils = u.MyUtils()
+        # import utility methods class, instrumented with run metrics
+        self.metrics = m.MyMetrics(_db_name)
+        self.utils = self.metrics.instrument(u.MyUtils())
+        if _metrics_settings['profile']:
+            self.metrics.start_profile()
 
         # setup log
         _log_path = f"{_logs_path}\\{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.log"
@@ -67,16 +186,28 @@ __________________________________________
             # directory checks
             os.makedirs(_logs_path, exist_ok=True)
             os.makedirs(_docs_path, exist_ok=True)
+            os.makedirs(_state_path, exist_ok=True)
+            os.makedirs(_snapshots_path, exist_ok=True)
             # set document properties
             self.doc_content = _doc_content
             self.doc_properties = _doc_properties
+            self.fetch_settings = _fetch_settings
+            self.fetch_filters = _fetch_filters
+            self.build_settings = _build_settings
             # set utilities
             self.db_name = _db_name
+            self.db_conn_string = db_conn_string
+            self.server_config = None
+            self.db_pool = None
             self.export = _docs_path
+            self.state = _state_path
+            self.snapshots = _snapshots_path
+            self.metrics_path = _metrics_path
+            self.cache = _cache_path
             # proceed with db data fetch and export
             self.log.info(f"----------")
             self.log.info(f"new script execution")
-            b.execute(f.execute(self), self)
+            run(self)
         except Exception as exc:
             self.log.warn(f'Unspecified script exception: {exc}')
             time.sleep(5)
@@ -0,0 +1,263 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: run instrumentation - query counters, phase and section timings, metrics export
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+* 2026-10-16 - v1.1 - profiling of fetch worker threads
+* 2026-10-16 - v1.1 - metrics of volume worker processes
+* 2026-10-16 - v1.1 - event counters
+"""
+
+# import generic libraries
+import os
+import re
+import json
+import time
+import pstats
+import cProfile
+import functools
+import threading
+from datetime import datetime
+from contextlib import contextmanager
+
+# tables referenced by a query, used as query type
+_query_tables = re.compile(r"\b(?:from|join)\s+([\w.\[\]]+)", re.IGNORECASE)
+
+
+class MyMetrics:
+    """
+    Class responsible for collecting run metrics: query counts, fetched rows and bytes, wall time per query type,
+    phase and per-section render times, event counters.
+    """
+
+    def __init__(self, db_name):
+        """
+        Initialize class instance.
+        :param str db_name: documented database name
+        """
+        self._db_name = db_name
+        self._lock = threading.Lock()
+        self._profile = None
+        self.started = datetime.now()
+        self.queries = {}
+        self.phases = {}
+        self.sections = {}
+        self.counters = {}
+
+    def instrument(self, utils):
+        """
+        Wrap query methods of utility methods object, so that each query is recorded.
+        :param utils: utility methods object
+        :type utils: MyUtils()
+        :return: instrumented utility methods object
+        :rtype: MyUtils()
+        """
+        get_data = utils.get_data
+        stream_data = utils.stream_data
+
+        @functools.wraps(get_data)
+        def _get_data(db_conn, query, *args, **kwargs):
+            start = time.perf_counter()
+            data = get_data(db_conn, query, *args, **kwargs)
+            rows, size = 0, 0
+            for record in data or ():
+                rows += 1
+                size += _record_size(record)
+            self.record_query(query, rows, size, time.perf_counter() - start)
+            return data
+
+        @functools.wraps(stream_data)
+        def _stream_data(db_conn, query, *args, **kwargs):
+            start = time.perf_counter()
+            rows, size = 0, 0
+            try:
+                for record in stream_data(db_conn, query, *args, **kwargs):
+                    rows += 1
+                    size += _record_size(record)
+                    yield record
+            finally:
+                self.record_query(query, rows, size, time.perf_counter() - start)
+
+        utils.get_data = _get_data
+        utils.stream_data = _stream_data
+        return utils
+
+    def record_query(self, query, rows, size, seconds):
+        """
+        Record single query execution.
+        :param str query: query string
+        :param int rows: number of fetched records
+        :param int size: approximate size of fetched values in bytes
+        :param float seconds: query wall time, including result reading
+        """
+        query_type = '+'.join(table.lower() for table in _query_tables.findall(query)) or 'other'
+        with self._lock:
+            stats = self.queries.setdefault(query_type, {'count': 0, 'rows': 0, 'bytes': 0, 'seconds': 0.0})
+            stats['count'] += 1
+            stats['rows'] += rows
+            stats['bytes'] += size
+            stats['seconds'] += seconds
+
+    @contextmanager
+    def timer(self, scope, name):
+        """
+        Measure wall time of a ``with`` block as a run phase or a document section.
+        :param str scope: 'phase' or 'section'
+        :param str name: measured phase or section name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            target = self.phases if scope == 'phase' else self.sections
+            with self._lock:
+                target[name] = target.get(name, 0.0) + seconds
+
+    def count(self, name, value=1):
+        """
+        Increase event counter, such as render cache hits.
+        :param str name: counted event name
+        :param int value: number of events
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, report):
+        """
+        Add metrics collected by another process, such as documentation volume worker.
+        :param report: metrics dictionary created by report()
+        :type report: dict(str, any)
+        """
+        with self._lock:
+            for query_type, stats in report['queries'].items():
+                target = self.queries.setdefault(query_type, {'count': 0, 'rows': 0, 'bytes': 0, 'seconds': 0.0})
+                for field in target:
+                    target[field] += stats[field]
+            for key, target in (('phases', self.phases), ('sections', self.sections)):
+                for name, seconds in report[key].items():
+                    target[name] = target.get(name, 0.0) + seconds
+            for name, value in report['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def start_profile(self):
+        """
+        Start cProfile profiling of the calling thread and of threads started afterwards - fetch workers. Python
+        3.12, required by SQDoc, profiles all threads with a single profiler.
+        """
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def _save_profile(self, path):
+        """
+        Stop profiling and save statistics of all profiled threads.
+        :param str path: statistics file path
+        """
+        self._profile.disable()
+        pstats.Stats(self._profile).dump_stats(path)
+        self._profile = None
+
+    def report(self):
+        """
+        Get collected metrics.
+        :return: metrics dictionary
+        :rtype: dict(str, any)
+        """
+        with self._lock:
+            return {'database': self._db_name, 'started': self.started.strftime("%Y-%m-%d %H:%M:%S"),
+                    'queries': {name: dict(stats, seconds=round(stats['seconds'], 4))
+                                for name, stats in self.queries.items()},
+                    'phases': {name: round(seconds, 4) for name, seconds in self.phases.items()},
+                    'sections': {name: round(seconds, 4) for name, seconds in self.sections.items()},
+                    'counters': dict(self.counters)}
+
+    def save(self, directory):
+        """
+        Write metrics as a JSON file and a Prometheus textfile collector file, stop profiling if started.
+        :param str directory: metrics directory
+        :return: JSON metrics file path
+        :rtype: str
+        """
+        os.makedirs(directory, exist_ok=True)
+        stamp = self.started.strftime('%Y-%m-%d_%H-%M-%S')
+        if self._profile is not None:
+            self._save_profile(os.path.join(directory, f"{self._db_name}_{stamp}.prof"))
+        report = self.report()
+        path = os.path.join(directory, f"{self._db_name}_{stamp}.json")
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        # textfile collectors read complete files only, so file is replaced at once
+        prom_path = os.path.join(directory, f"{self._db_name}.prom")
+        with open(f"{prom_path}.tmp", 'w', encoding='utf-8') as file:
+            file.write(self._prometheus(report))
+        os.replace(f"{prom_path}.tmp", prom_path)
+        return path
+
+    @staticmethod
+    def _prometheus(report):
+        """
+        Format metrics in Prometheus text exposition format.
+        :param report: metrics dictionary
+        :type report: dict(str, any)
+        :return: metrics text
+        :rtype: str
+        """
+        database = _label(report['database'])
+        lines = []
+        for metric, field, description in (('sqdoc_queries_total', 'count', 'Number of executed queries.'),
+                                           ('sqdoc_query_rows_total', 'rows', 'Number of fetched records.'),
+                                           ('sqdoc_query_bytes_total', 'bytes', 'Approximate size of fetched values.'),
+                                           ('sqdoc_query_seconds_total', 'seconds', 'Wall time of queries.')):
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} counter"]
+            for query_type, stats in report['queries'].items():
+                lines.append(f'{metric}{{database="{database}",query="{_label(query_type)}"}} {stats[field]}')
+        for metric, key, label, description in (('sqdoc_phase_seconds', 'phases', 'phase', 'Wall time of run phases.'),
+                                                ('sqdoc_section_seconds', 'sections', 'section',
+                                                 'Render time of document sections.')):
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} gauge"]
+            for name, seconds in report[key].items():
+                lines.append(f'{metric}{{database="{database}",{label}="{_label(name)}"}} {seconds}')
+        lines += ["# HELP sqdoc_events_total Number of counted events.", "# TYPE sqdoc_events_total counter"]
+        for name, value in report['counters'].items():
+            lines.append(f'sqdoc_events_total{{database="{database}",event="{_label(name)}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+def _record_size(record):
+    """
+    Approximate size of record values in bytes.
+    :param record: query result record
+    :type record: list(any)
+    :return: size in bytes
+    :rtype: int
+    """
+    return sum(len(value) if isinstance(value, str) else 8 for value in record if value is not None)
+
+
+def _label(value):
+    """
+    Escape Prometheus label value.
+    :param str value: label value
+    :return: escaped label value
+    :rtype: str
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def execute(_core):
+    """
+    Save run metrics in metrics directory.
+    :param _core: SQDoc script object
+    :type _core: SQDoc()
+    :return: JSON metrics file path or None on failure
+    :rtype: str, optional
+    """
+    try:
+        path = _core.metrics.save(_core.metrics_path)
+        print(f"{_core.utils.timestamp()} metrics saved: {path}")
+        _core.log.info(f"metrics saved: {path}")
+        return path
+    except Exception as exc:
+        _core.log.warn(f"cannot save run metrics: {exc}")
+        return None
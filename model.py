@@ -0,0 +1,292 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: compact model of fetched database metadata - tables, columns, keys, extended properties and
+              stored procedures
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+* 2026-10-16 - v1.1 - key constraint references
+* 2026-10-16 - v1.1 - table storage
+* 2026-10-16 - v1.1 - foreign key relationships
+* 2026-10-16 - v1.1 - stored procedure parameters
+"""
+
+# import generic libraries
+from sys import intern
+from collections import namedtuple
+
+
+def _text(value):
+    """
+    Intern repeated short text value, such as data type name or nullable flag.
+    :param value: fetched value
+    :return: interned string, or value itself if it is not a string
+    :rtype: str, optional
+    """
+    return intern(value) if isinstance(value, str) else value
+
+
+class Column(namedtuple('Column', ['name', 'data_type', 'max_length', 'nullable'])):
+    """
+    Table column, printed as a row of table columns section.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Create column from query record.
+        :param record: column name, data type, max length, nullable flag
+        :type record: list(any)
+        :return: column object
+        :rtype: Column
+        """
+        return cls(record[0], _text(record[1]), _text(record[2]), _text(record[3]))
+
+
+class Key(namedtuple('Key', ['column', 'constraint', 'constraint_type', 'reference'])):
+    """
+    Table key column, printed as a row of table keys section. Reference is referenced table and column of a
+    foreign key, or definition of a check constraint.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Create key from query record.
+        :param record: column name, constraint name, constraint type, reference
+        :type record: list(any)
+        :return: key object
+        :rtype: Key
+        """
+        return cls(record[0], record[1], _text(record[2]), record[3])
+
+
+class ExtendedProperty(namedtuple('ExtendedProperty', ['name', 'value'])):
+    """
+    Extended property of a table or stored procedure.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Create extended property from query record.
+        :param record: property name, property value
+        :type record: list(any)
+        :return: extended property object
+        :rtype: ExtendedProperty
+        """
+        return cls(_text(record[0]), record[1])
+
+
+class Parameter(namedtuple('Parameter', ['name', 'data_type', 'max_length', 'direction'])):
+    """
+    Stored procedure parameter, printed as a row of procedure parameters section.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Create parameter from query record.
+        :param record: parameter name, data type, max length, direction
+        :type record: list(any)
+        :return: parameter object
+        :rtype: Parameter
+        """
+        return cls(record[0], _text(record[1]), _text(record[2]), _text(record[3]))
+
+
+class Storage(namedtuple('Storage', ['schema', 'table', 'rows', 'reserved_kb', 'used_kb', 'data_kb', 'index_kb'])):
+    """
+    Row count and disk space of a table, printed as a row of storage section.
+    """
+
+    __slots__ = ()
+
+    @property
+    def row(self):
+        """
+        Storage values formatted for printing.
+        :return: table name, row count, reserved, used, data and index space in KB
+        :rtype: list(str)
+        """
+        return [f"{self.schema}.{self.table}"] + [f"{value:,}" for value in self[2:]]
+
+
+class ForeignKey(namedtuple('ForeignKey', ['name', 'schema', 'table', 'referenced_schema', 'referenced_table'])):
+    """
+    Foreign key between referencing and referenced table, edge of relationship graph.
+    """
+
+    __slots__ = ()
+
+
+class Table:
+    """
+    Table details.
+    """
+
+    __slots__ = ('schema', 'name', 'columns', 'keys', 'extended')
+
+    def __init__(self, schema, name, columns=(), keys=(), extended=()):
+        """
+        Initialize class instance.
+        :param str schema: schema name
+        :param str name: table name
+        :param columns: table columns
+        :param keys: table key columns
+        :param extended: table extended properties
+        :type columns: tuple(Column)
+        :type keys: tuple(Key)
+        :type extended: tuple(ExtendedProperty)
+        """
+        self.schema = _text(schema)
+        self.name = name
+        self.columns = tuple(columns)
+        self.keys = tuple(keys)
+        self.extended = tuple(extended)
+
+    def as_dict(self):
+        """
+        Get table details as JSON serializable dictionary.
+        :return: table details
+        :rtype: dict(str, any)
+        """
+        return {'schema': self.schema, 'name': self.name,
+                'columns': [list(column) for column in self.columns],
+                'keys': [list(key) for key in self.keys],
+                'extended': [list(prop) for prop in self.extended]}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create table from dictionary created by as_dict().
+        :param data: table details
+        :type data: dict(str, any)
+        :return: table object
+        :rtype: Table
+        """
+        return cls(data.get('schema'), data.get('name'),
+                   [Column.from_record(record) for record in data['columns']],
+                   [Key.from_record(record) for record in data['keys']],
+                   [ExtendedProperty.from_record(record) for record in data['extended']])
+
+
+class Procedure:
+    """
+    Stored procedure details.
+    """
+
+    __slots__ = ('schema', 'name', 'created', 'modified', 'ansi_nulls', 'quoted_identifier', 'auto_executed',
+                 'extended', 'parameters')
+
+    # printed procedure properties and attributes they are read from
+    properties = [('Created on', 'created'), ('Updated on', 'modified'), ('Use ANSI nulls', 'ansi_nulls'),
+                  ('Use quoted identifier', 'quoted_identifier'), ('Is auto executed', 'auto_executed')]
+
+    def __init__(self, schema, name, created, modified, ansi_nulls, quoted_identifier, auto_executed, extended=(),
+                 parameters=()):
+        """
+        Initialize class instance.
+        :param str schema: schema name
+        :param str name: procedure name
+        :param str created: creation date
+        :param str modified: modification date
+        :param str ansi_nulls: ANSI nulls flag
+        :param str quoted_identifier: quoted identifier flag
+        :param str auto_executed: auto execution flag
+        :param extended: procedure extended properties
+        :param parameters: procedure parameters in declaration order
+        :type extended: tuple(ExtendedProperty)
+        :type parameters: tuple(Parameter)
+        """
+        self.schema = _text(schema)
+        self.name = name
+        self.created = created
+        self.modified = modified
+        self.ansi_nulls = _text(ansi_nulls)
+        self.quoted_identifier = _text(quoted_identifier)
+        self.auto_executed = _text(auto_executed)
+        self.extended = tuple(extended)
+        self.parameters = tuple(parameters)
+
+    @classmethod
+    def from_record(cls, record, extended=(), parameters=()):
+        """
+        Create procedure from query record.
+        :param record: name, schema, create date, modify date, ANSI nulls, quoted identifier, auto executed
+        :param extended: procedure extended properties
+        :param parameters: procedure parameters
+        :type record: list(any)
+        :type extended: tuple(ExtendedProperty)
+        :type parameters: tuple(Parameter)
+        :return: procedure object
+        :rtype: Procedure
+        """
+        return cls(record[1], record[0], record[2], record[3], record[4], record[5], record[6], extended, parameters)
+
+    @property
+    def info(self):
+        """
+        Procedure properties printed in procedure details table.
+        :return: list of [property name, property value]
+        :rtype: list(list)
+        """
+        return [[label, getattr(self, attr)] for label, attr in self.properties]
+
+    def as_dict(self):
+        """
+        Get procedure details as JSON serializable dictionary.
+        :return: procedure details
+        :rtype: dict(str, any)
+        """
+        data = {attr: getattr(self, attr) for attr in self.__slots__}
+        data['extended'] = [list(prop) for prop in self.extended]
+        data['parameters'] = [list(parameter) for parameter in self.parameters]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create procedure from dictionary created by as_dict().
+        :param data: procedure details
+        :type data: dict(str, any)
+        :return: procedure object
+        :rtype: Procedure
+        """
+        return cls(**dict(data, extended=[ExtendedProperty.from_record(record) for record in data['extended']],
+                          parameters=[Parameter.from_record(record) for record in data['parameters']]))
+
+
+def dump(items):
+    """
+    Get details per object as JSON serializable dictionary.
+    :param items: details per table or stored procedure
+    :type items: dict(str, Table | Procedure)
+    :return: dictionaries per object, or items itself if it is empty
+    :rtype: dict(str, dict), optional
+    """
+    if not items:
+        return items
+    return {name: item.as_dict() for name, item in items.items()}
+
+
+def load(items, item_type):
+    """
+    Create details per object from dictionaries created by dump().
+    :param items: dictionaries per object
+    :param item_type: Table or Procedure
+    :type items: dict(str, dict), optional
+    :return: details per object, or items itself if it is empty
+    :rtype: dict(str, Table | Procedure)
+    """
+    if not items:
+        return items
+    return {name: item_type.from_dict(data) for name, data in items.items()}
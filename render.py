@@ -0,0 +1,79 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: renders SQDoc documentation from a saved snapshot, without database access
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+* 2026-10-16 - v1.1 - render cache directory
+* 2026-10-16 - v1.1 - documentation run shared with other entry points, relationship graph export
+
+Usage:
+
+    python render.py <snapshot file>
+"""
+
+# import generic libraries
+import os
+import sys
+import time
+from datetime import datetime
+
+# import engine modules
+import main
+import utility as u
+import snapshot as s
+import metrics as m
+
+
+class SQRender:
+    """
+    Snapshot rendering executable.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize class instance.
+        :param str path: snapshot file path
+        """
+        print(main._banner)
+
+        # import utility methods class
+        self.utils = u.MyUtils()
+        self.metrics = None
+
+        # setup log
+        _log_path = os.path.join(main._logs_path, f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_render.log")
+        self.log = self.utils.get_logger(_log_path)
+        print(f"{self.utils.timestamp()} log file: {_log_path}\n----------")
+        try:
+            os.makedirs(main._docs_path, exist_ok=True)
+            # read snapshot
+            print(f"{self.utils.timestamp()} reading snapshot: {path}")
+            details = s.MySnapshot.load(path)
+            self.metrics = m.MyMetrics(details.db_name)
+            print(f"{self.utils.timestamp()} ┗ [OK] {details.db_name} snapshot created on {details.created}")
+            # set document properties, limited to sections available in snapshot
+            self.doc_content = details.content(main._doc_content)
+            self.doc_properties = main._doc_properties
+            self.build_settings = main._build_settings
+            # set utilities
+            self.db_name = details.db_name
+            self.export = main._docs_path
+            self.metrics_path = main._metrics_path
+            self.cache = main._cache_path
+            # proceed with export
+            self.log.info(f"----------")
+            self.log.info(f"new snapshot rendering: {path}")
+            main.run(self, details)
+        except Exception as exc:
+            print(f"{self.utils.timestamp()} [ERROR] cannot render snapshot, check log for details")
+            self.log.warn(f'Unspecified snapshot rendering exception: {exc}')
+            time.sleep(5)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    SQRender(sys.argv[1])
@@ -0,0 +1,678 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: document renderers - section layout shared by all output formats, streaming Markdown, HTML
+              and JSON outputs
+Updates:
+
+* 2026-10-16 - v1.1 - creation, section layout extracted from *.docx builder
+* 2026-10-16 - v1.1 - table details iterated as pairs, enabling pipelined fetch
+* 2026-10-16 - v1.1 - compact metadata model
+* 2026-10-16 - v1.1 - documentation volumes and volume index
+* 2026-10-16 - v1.1 - key constraint references
+* 2026-10-16 - v1.1 - heading collector of static table of contents
+* 2026-10-16 - v1.1 - table storage section
+* 2026-10-16 - v1.1 - table relationships section
+* 2026-10-16 - v1.1 - stored procedure parameters
+"""
+
+# import generic libraries
+import os
+import re
+import json
+import html
+
+
+class MyRenderer:
+    """
+    Base class of document renderers. Defines section layout of documentation, output formats implement
+    primitives writing headings, paragraphs and tables.
+    """
+
+    # output file extension
+    extension = None
+
+    def __init__(self, _details, _core, volume=None, volumes=None):
+        """
+        Initialize class instance.
+        :param volume: printed documentation volume - title and file name suffix, whole documentation if not set
+        :param volumes: documentation volumes printed as volume index instead of documentation content
+        :type volume: dict(str, any), optional
+        :type volumes: list(dict), optional
+        """
+        # content settings
+        self._content = _core.doc_content
+        self._properties = _core.doc_properties
+        self._settings = _core.build_settings
+        # content objects
+        self._db_config = _details.db_config
+        self._db_tables = _details.db_tables
+        self._db_procedures = _details.db_procedures
+        self._db_storage = _details.db_storage
+        self._db_relationships = _details.db_relationships
+        # utilities
+        self._db_name = _core.db_name
+        self._log = _core.log
+        self._utils = _core.utils
+        self._export = _core.export
+        self._metrics = _core.metrics
+        # documentation volumes
+        self._volume = volume
+        self._volumes = volumes
+        # document export
+        self._print_document()
+
+    def _print_document(self):
+        """
+        Attempt to export database information to a file.
+        """
+        print(f"----------\n{self._utils.timestamp()} creating *.{self.extension} file")
+        path = os.path.join(self._export, self._file_name(self._volume))
+        self._open(path)
+        for name, method, enabled in self._sections():
+            if enabled:
+                with self._metrics.timer('section', f"{name} ({self.extension})"):
+                    method()
+        # Save the document
+        with self._metrics.timer('phase', f"save ({self.extension})"):
+            self._close(path)
+
+    def _sections(self):
+        """
+        Get document sections in print order.
+        :return: list of section name, print method and inclusion flag
+        :rtype: list(tuple)
+        """
+        if self._volumes is not None:
+            return [('main page', self._print_main_page, True),
+                    ('volumes', self._print_volumes, True)]
+        return [('main page', self._print_main_page, True),
+                ('table of contents', self._print_toc, True),
+                ('document purpose', self._print_purpose, True),
+                ('configuration', self._print_configuration, self._content['db_configuration']),
+                ('tables', self._print_tables, self._content['db_tables']),
+                ('procedures', self._print_procedures, self._content['db_procedures']),
+                ('storage', self._print_storage, self._content['db_storage']),
+                ('relationships', self._print_relationships, self._content['db_relationships'])]
+
+    def _file_name(self, volume=None):
+        """
+        Get document file name.
+        :param volume: documentation volume, whole documentation or volume index if not set
+        :type volume: dict(str, any), optional
+        :return: file name
+        :rtype: str
+        """
+        suffix = volume['suffix'] if volume else ''
+        return f"{self._db_name}_documentation{suffix}.{self.extension}"
+
+    # document sections
+
+    def _print_main_page(self):
+        """
+        Print main page with document properties.
+        """
+        title = f'{self._db_name} database technical documentation'
+        if self._volume:
+            title = f"{title} - {self._volume['title']}"
+        self._heading(title, 0)
+        # document details table
+        config = {'header': ['Properties', ''], 'columns': [1, 3]}
+        self._table(config, self._properties)
+        # next page
+        self._page_break()
+
+    def _print_toc(self):
+        """
+        Print table of contents page.
+        """
+        self._heading('Table of contents', 1)
+        self._toc()
+        # next page
+        self._page_break()
+
+    def _print_purpose(self):
+        """
+        Print document purpose section.
+        """
+        self._heading('1. Document purpose', 1)
+        self._paragraph(f'Purpose of this document is to provide a technical overview on details and structure of '
+                        f'{self._db_name} database. Document covers configuration of the database itself and '
+                        f'properties of each included table such as:')
+        self._paragraph(f'table columns', style='List Bullet')
+        self._paragraph(f'column types', style='List Bullet')
+        self._paragraph(f'keys', style='List Bullet')
+        self._paragraph(f'Details related to table contents and / or volume are not part o this document due to '
+                        f'their potentially sensitive nature.')
+        # next page
+        self._page_break()
+        self._flush()
+
+    def _print_configuration(self):
+        """
+        Print database details section.
+        """
+        self._heading(f'2. {self._db_name} database details', 1)
+        self._paragraph(f'This section covers basic configuration details of database.')
+        # for each subject - create content table
+        paragraph = 1
+        for scope in self._db_config:
+            content = self._db_config[scope]
+            self._heading(f"2.{paragraph} {scope}", 2)
+            # create table
+            # separate formatting for different scope subjects
+            if scope == 'Configuration':
+                config = {'header': ['Configuration item', 'Value default', 'Value in use'], 'columns': [4, 1, 1]}
+                self._table(config, content)
+            if scope == "Scoped configuration":
+                config = {'header': ['Configuration item', 'Value'], 'columns': [4, 2]}
+                self._table(config, content)
+            paragraph += 1
+            self._flush()
+        # next page
+        self._page_break()
+
+    def _print_tables(self):
+        """
+        Print per-table details section.
+        """
+        self._heading(f'3. {self._db_name} tables', 1)
+        self._paragraph(f'This section covers basic configuration details of database tables.')
+        if self._db_tables is False:
+            self._paragraph('Table details are not available.')
+        elif self._db_tables == {}:
+            self._paragraph('No tables match configured schema and table filters.')
+        else:
+            # for each subject - create content table
+            paragraph = 1
+            for table, content in self._db_tables.items():
+                self._print_table(f"3.{paragraph}", table, content)
+                paragraph += 1
+                self._flush()
+        # next page
+        self._page_break()
+
+    def _print_table(self, number, table, content):
+        """
+        Print details of a single table.
+        :param str number: table heading number
+        :param str table: table name
+        :param content: table details
+        :type content: Table
+        """
+        self._heading(f"{number} {table}", 2)
+
+        # section - keys
+        self._heading(f"{number}.1 Keys", 3)
+        if len(content.keys) == 0:
+            self._paragraph(f'No keys configured for this table.')
+        else:
+            config = {'header': ['Key column name', 'Constraint name', 'Constraint type', 'References'],
+                      'columns': [1.5, 2, 1, 1.5]}
+            self._table(config, content.keys)
+
+        # section - extended properties
+        self._heading(f"{number}.2 Extended properties", 3)
+        if len(content.extended) == 0:
+            self._paragraph(f'No extended properties configured for this table.')
+        else:
+            config = {'header': ['Property name', 'Property value'], 'columns': [2, 4]}
+            self._table(config, content.extended)
+
+        # section - columns
+        self._heading(f"{number}.3 Columns", 3)
+        if len(content.columns) == 0:
+            self._paragraph(f'No columns configured for this table')
+        else:
+            config = {'header': ['Column name', 'Data type', 'Max length', 'Nullable'], 'columns': [2, 2, 1, 1]}
+            self._table(config, content.columns)
+
+    def _print_procedures(self):
+        """
+        Print stored procedure details section.
+        """
+        self._heading(f'3. {self._db_name} stored procedures', 1)
+        self._paragraph(f'This section covers basic configuration details of configured stored procedures.')
+        if self._db_procedures is False:
+            self._paragraph('Stored procedure details are not available.')
+        elif not self._db_procedures:
+            self._paragraph('No stored procedures match configured schema and procedure filters.')
+        else:
+            # for each subject - create content table
+            paragraph = 1
+            for procedure in self._db_procedures:
+                self._print_procedure(f"3.{paragraph}", procedure, self._db_procedures[procedure])
+                paragraph += 1
+                self._flush()
+
+    def _print_procedure(self, number, procedure, content):
+        """
+        Print details of a single stored procedure.
+        :param str number: procedure heading number
+        :param str procedure: procedure name
+        :param content: procedure details
+        :type content: Procedure
+        """
+        self._heading(f"{number} {procedure}", 2)
+
+        # section - extended properties
+        self._heading(f"{number}.1 Extended properties", 3)
+        if not content.extended:
+            self._paragraph(f'No extended properties configured for this procedure.')
+        else:
+            config = {'header': ['Property name', 'Property value'], 'columns': [2, 4]}
+            self._table(config, content.extended)
+
+        # section - stored procedure details
+        self._heading(f"{number}.2 Details", 3)
+        if not content.info:
+            self._paragraph(f'No properties obtained for this procedure.')
+        else:
+            config = {'header': ['Property name', 'Property value'], 'columns': [2, 4]}
+            self._table(config, content.info)
+
+        # section - stored procedure parameters
+        self._heading(f"{number}.3 Parameters", 3)
+        if not content.parameters:
+            self._paragraph(f'No parameters declared for this procedure.')
+        else:
+            config = {'header': ['Parameter name', 'Data type', 'Max length', 'Direction'], 'columns': [2, 2, 1, 1]}
+            self._table(config, content.parameters)
+
+    def _print_storage(self):
+        """
+        Print table storage section - largest tables, followed by storage of every table.
+        """
+        self._heading(f'4. {self._db_name} storage', 1)
+        self._paragraph(f'This section covers row counts and disk space of database tables, as reported by '
+                        f'partition statistics at the time of documentation.')
+        config = {'header': ['Table', 'Rows', 'Reserved (KB)', 'Used (KB)', 'Data (KB)', 'Indexes (KB)'],
+                  'columns': [2, 1, 0.75, 0.75, 0.75, 0.75]}
+        # partition statistics cannot be read without VIEW DATABASE STATE permission
+        if self._db_storage is False:
+            self._paragraph('Table storage is not available.')
+            self._page_break()
+            return
+        total_rows = sum(item.rows for item in self._db_storage)
+        total_kb = sum(item.reserved_kb for item in self._db_storage)
+        self._paragraph(f'Total of {len(self._db_storage)} tables, {total_rows:,} rows, {total_kb:,} KB reserved.')
+        # section - largest tables
+        top = sorted(self._db_storage, key=lambda item: item.reserved_kb, reverse=True)[:self._settings['storage_top']]
+        self._heading(f"4.1 Largest tables", 2)
+        self._table(config, [item.row for item in top])
+        self._flush()
+        # section - all tables
+        self._heading(f"4.2 Storage per table", 2)
+        self._table(config, [item.row for item in self._db_storage])
+        self._flush()
+        # next page
+        self._page_break()
+
+    def _print_relationships(self):
+        """
+        Print table relationships section - groups of tables connected by foreign keys, followed by referenced and
+        referencing tables of every table.
+        """
+        self._heading(f'5. {self._db_name} relationships', 1)
+        self._paragraph(f'This section covers foreign keys between database tables. Depth is the length of the '
+                        f'longest chain of referenced tables, tables of a group are connected by foreign keys.')
+        if not self._db_relationships:
+            self._paragraph('Table relationships are not available.')
+            self._page_break()
+            return
+        graph = self._db_relationships
+        self._paragraph(f'Total of {len(graph.foreign_keys)} foreign keys between {len(graph.tables)} tables in '
+                        f'{len(set(graph.groups.values()))} groups, largest depth '
+                        f'{max(graph.depth.values(), default=0)}.')
+        # section - table groups
+        self._heading(f"5.1 Table groups", 2)
+        config = {'header': ['Group', 'Tables', 'Foreign keys', 'Largest depth'], 'columns': [1, 1, 1, 1]}
+        self._table(config, self._db_relationships.group_rows)
+        self._flush()
+        # section - all tables
+        self._heading(f"5.2 Relationships per table", 2)
+        config = {'header': ['Table', 'References', 'Referenced by', 'Depth', 'Group'],
+                  'columns': [1.5, 1.75, 1.75, 0.5, 0.5]}
+        self._table(config, self._db_relationships.rows)
+        self._flush()
+        # next page
+        self._page_break()
+
+    def _print_volumes(self):
+        """
+        Print index of documentation volumes.
+        """
+        self._heading('1. Documentation volumes', 1)
+        self._paragraph(f'Documentation of {self._db_name} database is split into following volumes:')
+        for volume in self._volumes:
+            self._link(volume['title'], self._file_name(volume))
+        self._heading('1.1 Volume contents', 2)
+        config = {'header': ['Volume', 'Tables', 'First table', 'Last table'], 'columns': [2, 1, 2, 2]}
+        self._table(config, [[volume['title'], str(volume['tables']), volume['first'], volume['last']]
+                             for volume in self._volumes])
+
+    # output format primitives
+
+    def _open(self, path):
+        """
+        Start output file.
+        :param str path: output file path
+        """
+        raise NotImplementedError
+
+    def _close(self, path):
+        """
+        Finish and close output file.
+        :param str path: output file path
+        """
+        raise NotImplementedError
+
+    def _heading(self, text, level):
+        """
+        Write heading.
+        :param str text: heading text
+        :param int level: heading level, 0 for document title
+        """
+        raise NotImplementedError
+
+    def _paragraph(self, text, style=None):
+        """
+        Write paragraph.
+        :param str text: paragraph text
+        :param str style: paragraph style, 'List Bullet' for list items
+        """
+        raise NotImplementedError
+
+    def _table(self, config, content):
+        """
+        Write table.
+        :param config: table configuration containing header column names and column dimensions list
+        :param content: table content list
+        :type config: dict(str, any)
+        :type content: list(any)
+        """
+        raise NotImplementedError
+
+    def _link(self, text, target):
+        """
+        Write list item linking another document.
+        :param str text: link text
+        :param str target: linked document file name, relative to current document
+        """
+        self._paragraph(f"{text}: {target}", style='List Bullet')
+
+    def _toc(self):
+        """
+        Write table of contents.
+        """
+
+    def _page_break(self):
+        """
+        Start new page.
+        """
+
+    def _flush(self):
+        """
+        Write content produced so far to output file.
+        """
+
+
+class MyHeadingCollector(MyRenderer):
+    """
+    Renderer printing nothing, collects headings of sections following table of contents. Used to print static
+    table of contents before the headings it lists are printed.
+    """
+
+    def __init__(self, renderer):
+        """
+        Initialize class instance and collect headings.
+        :param renderer: renderer printing table of contents, its content and settings are shared
+        :type renderer: MyRenderer
+        """
+        self.__dict__.update(renderer.__dict__)
+        self.headings = []
+        sections = self._sections()
+        names = [name for name, method, enabled in sections]
+        for name, method, enabled in sections[names.index('table of contents') + 1:]:
+            if enabled:
+                method()
+
+    def _heading(self, text, level):
+        self.headings.append((level, text))
+
+    def _paragraph(self, text, style=None):
+        pass
+
+    def _table(self, config, content):
+        pass
+
+
+class MyTextRenderer(MyRenderer):
+    """
+    Base class of renderers writing text directly to output file handle as data is iterated.
+    """
+
+    def __init__(self, _details, _core, **kwargs):
+        """
+        Initialize class instance.
+        """
+        self._file = None
+        super().__init__(_details, _core, **kwargs)
+
+    def _open(self, path):
+        self._file = open(path, 'w', encoding='utf-8', newline='\n')
+
+    def _close(self, path):
+        print(f"{self._utils.timestamp()} Saving file: {path}")
+        self._file.close()
+
+    def _print_toc(self):
+        """
+        Table of contents is left to document viewer, no page is printed.
+        """
+
+
+class MyMarkdownRenderer(MyTextRenderer):
+    """
+    Class responsible for exporting data into *.md file.
+    """
+
+    extension = 'md'
+
+    def __init__(self, _details, _core, **kwargs):
+        """
+        Initialize class instance.
+        """
+        self._in_list = False
+        super().__init__(_details, _core, **kwargs)
+
+    def _block(self, text):
+        """
+        Write block of text separated from previous block by a blank line.
+        :param str text: block text
+        """
+        self._in_list = False
+        self._file.write(f"{text}\n\n")
+
+    def _heading(self, text, level):
+        self._block(f"{'#' * (level + 1)} {_md_escape(text)}")
+
+    def _paragraph(self, text, style=None):
+        if style == 'List Bullet':
+            self._in_list = True
+            self._file.write(f"- {_md_escape(text)}\n")
+            return
+        if self._in_list:
+            self._file.write("\n")
+        self._block(_md_escape(text))
+
+    def _link(self, text, target):
+        self._in_list = True
+        self._file.write(f"- [{_md_escape(text)}]({target.replace(' ', '%20')})\n")
+
+    def _table(self, config, content):
+        if self._in_list:
+            self._in_list = False
+            self._file.write("\n")
+        cols = len(config['columns'])
+        write = self._file.write
+        write(f"| {' | '.join(_md_cell(header) for header in config['header'][:cols])} |\n")
+        write(f"|{' --- |' * cols}\n")
+        for item in content:
+            write(f"| {' | '.join(_md_cell(item[item_id]) for item_id in range(cols))} |\n")
+        write("\n")
+
+
+class MyHtmlRenderer(MyTextRenderer):
+    """
+    Class responsible for exporting data into *.html file.
+    """
+
+    extension = 'html'
+
+    def __init__(self, _details, _core, **kwargs):
+        """
+        Initialize class instance.
+        """
+        self._in_list = False
+        super().__init__(_details, _core, **kwargs)
+
+    def _open(self, path):
+        super()._open(path)
+        title = html.escape(f'{self._db_name} database technical documentation')
+        self._file.write(f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n'
+                         f'<style>\n'
+                         f'body {{ font-family: Calibri, sans-serif; margin: 2em; }}\n'
+                         f'table {{ border-collapse: collapse; margin-bottom: 1em; }}\n'
+                         f'th {{ background: #4f81bd; color: #fff; text-align: left; }}\n'
+                         f'th, td {{ border: 1px solid #4f81bd; padding: 2px 8px; }}\n'
+                         f'</style>\n</head>\n<body>\n')
+
+    def _close(self, path):
+        self._end_list()
+        self._file.write("</body>\n</html>\n")
+        super()._close(path)
+
+    def _end_list(self):
+        """
+        Close bullet list if one is open.
+        """
+        if self._in_list:
+            self._in_list = False
+            self._file.write("</ul>\n")
+
+    def _heading(self, text, level):
+        self._end_list()
+        anchor = re.sub(r'[^\w.-]+', '-', text.lower()).strip('-')
+        self._file.write(f'<h{level + 1} id="{html.escape(anchor)}">{html.escape(text)}</h{level + 1}>\n')
+
+    def _paragraph(self, text, style=None):
+        if style == 'List Bullet':
+            if not self._in_list:
+                self._in_list = True
+                self._file.write("<ul>\n")
+            self._file.write(f"<li>{html.escape(text)}</li>\n")
+            return
+        self._end_list()
+        self._file.write(f"<p>{html.escape(text)}</p>\n")
+
+    def _link(self, text, target):
+        if not self._in_list:
+            self._in_list = True
+            self._file.write("<ul>\n")
+        self._file.write(f'<li><a href="{html.escape(target)}">{html.escape(text)}</a></li>\n')
+
+    def _table(self, config, content):
+        self._end_list()
+        cols = len(config['columns'])
+        write = self._file.write
+        write("<table>\n<thead><tr>")
+        for item_id in range(cols):
+            write(f'<th style="width: {config["columns"][item_id]}in">{html.escape(config["header"][item_id])}</th>')
+        write("</tr></thead>\n<tbody>\n")
+        for item in content:
+            write(f"<tr>{''.join(f'<td>{html.escape(str(item[item_id]))}</td>' for item_id in range(cols))}</tr>\n")
+        write("</tbody>\n</table>\n")
+
+
+class MyJsonRenderer(MyTextRenderer):
+    """
+    Class responsible for exporting data into *.json file. Follows the same sections as other formats, but
+    writes fetched data instead of document layout.
+    """
+
+    extension = 'json'
+
+    def _open(self, path):
+        super()._open(path)
+        self._file.write(f'{{"database": {json.dumps(self._db_name)}')
+
+    def _close(self, path):
+        self._file.write("}\n")
+        super()._close(path)
+
+    def _print_main_page(self):
+        if self._volume:
+            self._file.write(f',\n"volume": {json.dumps(self._volume["title"])}')
+        properties = {item[0].rstrip(':'): item[1] for item in self._properties}
+        self._file.write(f',\n"properties": {json.dumps(properties)}')
+
+    def _print_purpose(self):
+        pass
+
+    def _print_configuration(self):
+        self._file.write(f',\n"configuration": {json.dumps(self._db_config)}')
+
+    def _print_tables(self):
+        self._write_items('tables', self._db_tables)
+
+    def _print_procedures(self):
+        self._write_items('procedures', self._db_procedures)
+
+    def _print_storage(self):
+        storage = self._db_storage and [item._asdict() for item in self._db_storage]
+        self._file.write(f',\n"storage": {json.dumps(storage)}')
+
+    def _print_relationships(self):
+        relationships = self._db_relationships and self._db_relationships.as_dict()
+        self._file.write(f',\n"relationships": {json.dumps(relationships)}')
+
+    def _print_volumes(self):
+        volumes = [dict(volume, file=self._file_name(volume)) for volume in self._volumes]
+        self._file.write(f',\n"volumes": {json.dumps(volumes)}')
+
+    def _write_items(self, key, items):
+        """
+        Write dictionary of per-object details, one object at a time.
+        :param str key: output key
+        :param items: details per object, False if not available
+        :type items: dict(str, Table | Procedure)
+        """
+        if items is False:
+            self._file.write(f',\n{json.dumps(key)}: false')
+            return
+        self._file.write(f',\n{json.dumps(key)}: {{')
+        separator = '\n'
+        for name, details in items.items():
+            self._file.write(f'{separator}{json.dumps(name)}: {json.dumps(details.as_dict())}')
+            separator = ',\n'
+        self._file.write('\n}')
+
+
+def _md_escape(text):
+    """
+    Escape Markdown inline formatting characters.
+    :param str text: text
+    :return: escaped text
+    :rtype: str
+    """
+    return re.sub(r'([\\`*_\[\]<>#|])', r'\\\1', str(text))
+
+
+def _md_cell(value):
+    """
+    Format Markdown table cell value.
+    :param value: cell value
+    :return: cell text
+    :rtype: str
+    """
+    return _md_escape(value).replace('\r', ' ').replace('\n', '<br>')
@@ -0,0 +1,172 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: offline snapshot of fetched database details, enables document rendering without database access
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+* 2026-10-16 - v1.1 - compact metadata model, snapshot version 2
+* 2026-10-16 - v1.1 - key constraint references, snapshot version 3
+* 2026-10-16 - v1.1 - latest snapshot lookup
+* 2026-10-16 - v1.1 - table storage
+* 2026-10-16 - v1.1 - table relationships
+* 2026-10-16 - v1.1 - stored procedure parameters
+* 2026-10-16 - v1.1 - tables and stored procedures keyed by schema and name, snapshot version 5
+"""
+
+# import generic libraries
+import os
+import re
+import gzip
+import json
+from datetime import datetime
+
+# import engine modules
+import model
+from graph import MyRelationships
+
+# snapshot file identification
+_format = 'sqdoc-snapshot'
+_version = 5
+
+# printed document sections and data fetcher attributes they are rendered from
+sections = {'db_configuration': 'db_config', 'db_tables': 'db_tables', 'db_procedures': 'db_procedures',
+            'db_storage': 'db_storage', 'db_relationships': 'db_relationships'}
+
+
+class MySnapshot:
+    """
+    Fetched database details detached from database connection. Exposes the same content attributes as
+    data fetcher, so it can be passed directly to document builder.
+    """
+
+    def __init__(self, db_name, db_config=False, db_tables=False, db_procedures=False, objects=None, created=None,
+                 db_storage=False, db_relationships=False):
+        """
+        Initialize class instance.
+        :param str db_name: documented database name
+        :param db_config: database configuration details
+        :param db_tables: details per table
+        :param db_procedures: details per stored procedure
+        :param objects: object modification dates used by incremental runs
+        :param str created: snapshot creation timestamp
+        :param db_storage: storage per table
+        :param db_relationships: foreign key relationship graph
+        :type db_config: dict(str, any)
+        :type db_tables: dict(str, Table)
+        :type db_procedures: dict(str, Procedure)
+        :type objects: dict(str, list), optional
+        :type db_storage: list(Storage)
+        :type db_relationships: MyRelationships
+        """
+        self.db_name = db_name
+        self.db_config = db_config
+        self.db_tables = db_tables
+        self.db_procedures = db_procedures
+        self.objects = objects
+        self.created = created or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.db_storage = db_storage
+        self.db_relationships = db_relationships
+
+    @classmethod
+    def from_fetcher(cls, _details, _core):
+        """
+        Create snapshot of data fetcher content.
+        :param _details: data fetcher object
+        :param _core: SQDoc script object
+        :type _details: MyFetcher()
+        :type _core: SQDoc()
+        :return: snapshot object
+        :rtype: MySnapshot
+        """
+        return cls(_core.db_name, _details.db_config, _details.db_tables, _details.db_procedures,
+                   db_storage=_details.db_storage, db_relationships=_details.db_relationships)
+
+    def content(self, doc_content):
+        """
+        Limit document content settings to sections available in snapshot.
+        :param doc_content: document content settings
+        :type doc_content: dict(str, bool)
+        :return: document content settings
+        :rtype: dict(str, bool)
+        """
+        content = dict(doc_content)
+        for section, attr in sections.items():
+            content[section] = content.get(section, False) and bool(getattr(self, attr))
+        return content
+
+    def save(self, path):
+        """
+        Write snapshot to a gzip compressed JSON file.
+        :param str path: snapshot file path
+        """
+        data = {'format': _format, 'version': _version, 'db_name': self.db_name, 'created': self.created,
+                'objects': self.objects,
+                'sections': {'db_config': self.db_config, 'db_tables': model.dump(self.db_tables),
+                             'db_procedures': model.dump(self.db_procedures),
+                             'db_storage': self.db_storage and [list(item) for item in self.db_storage],
+                             'db_relationships': self.db_relationships and
+                             [list(item) for item in self.db_relationships.foreign_keys]}}
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            json.dump(data, file, separators=(',', ':'), default=str)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read snapshot from file.
+        :param str path: snapshot file path
+        :return: snapshot object
+        :rtype: MySnapshot
+        :raise ValueError: file is not a snapshot or snapshot version is not supported
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('format') != _format:
+            raise ValueError(f"{path} is not a SQDoc snapshot")
+        if data.get('version') != _version:
+            raise ValueError(f"unsupported snapshot version {data.get('version')}")
+        content = data['sections']
+        return cls(data['db_name'], content.get('db_config', False),
+                   model.load(content.get('db_tables', False), model.Table),
+                   model.load(content.get('db_procedures', False), model.Procedure),
+                   data.get('objects'), data.get('created'),
+                   [model.Storage(*record) for record in content['db_storage']] if content.get('db_storage') else False,
+                   MyRelationships(content['db_relationships']) if content.get('db_relationships') else False)
+
+
+def latest(directory, db_name):
+    """
+    Find latest snapshot of a database saved by execute().
+    :param str directory: snapshots directory
+    :param str db_name: database name
+    :return: snapshot file path or None if there is no snapshot of database
+    :rtype: str, optional
+    """
+    if not os.path.isdir(directory):
+        return None
+    # file names end with creation timestamp, so they sort in creation order
+    pattern = re.compile(rf"{re.escape(db_name)}_\d{{4}}-\d{{2}}-\d{{2}}_\d{{2}}-\d{{2}}-\d{{2}}\.sqdoc")
+    files = sorted(name for name in os.listdir(directory) if pattern.fullmatch(name))
+    return os.path.join(directory, files[-1]) if files else None
+
+
+def execute(_details, _core):
+    """
+    Save fetched details as a snapshot in snapshots directory.
+    :param _details: data fetcher object
+    :param _core: SQDoc script object
+    :type _details: MyFetcher()
+    :type _core: SQDoc()
+    :return: snapshot file path or None on failure
+    :rtype: str, optional
+    """
+    path = os.path.join(_core.snapshots, f"{_core.db_name}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.sqdoc")
+    try:
+        MySnapshot.from_fetcher(_details, _core).save(path)
+        print(f"{_core.utils.timestamp()} snapshot saved: {path}")
+        _core.log.info(f"snapshot saved: {path}")
+        return path
+    except Exception as exc:
+        print(f"{_core.utils.timestamp()} [ERROR] cannot save snapshot, check log for details")
+        _core.log.warn(f"cannot save snapshot {path}: {exc}")
+        return None
@@ -4,12 +4,29 @@ Description	: utility methods for use across script functionalities
 Updates:
 
 * 2024-08-02 - v1.0 - creation
+* 2026-10-16 - v1.1 - streaming query results
+* 2026-10-16 - v1.1 - reused cursors
+* 2026-10-16 - v1.1 - queued logging to SQDoc logger, rate limited progress display
 """
 
 # import generic libraries
 import os
+import time
+import queue
+import atexit
 import logging
-from datetime import datetime
+import threading
+import logging.handlers
+from datetime import datetime, timedelta
+
+# number of records read from database per batch
+_arraysize = 1000
+# level of log records written to log file
+_log_level = logging.INFO
+# minimum interval between progress lines in seconds
+_progress_interval = 2.0
+# background thread writing queued log records to log file
+_listener = None
 
 
 class MyUtils:
@@ -33,33 +50,160 @@ class MyUtils:
 
     @staticmethod
     def get_logger(name):
+        """
+        Set up SQDoc logger writing to a log file. Logging threads only put records to a queue, file is written by
+        a background thread. Records of libraries logging to root logger are not written.
+        :param str name: log file path
+        :return: logger object
+        :rtype: logging.Logger
+        """
+        global _listener
         os.makedirs(os.path.dirname(name), exist_ok=True)
-        # Configure logging
-        logging.basicConfig(
-            filename=name,
-            level=logging.DEBUG,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        logger = logging.getLogger()
+        MyUtils.stop_logger()
+        handler = logging.FileHandler(name, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        records = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(records, handler)
+        _listener.start()
+        logger = logging.getLogger('SQDoc')
+        logger.setLevel(_log_level)
+        logger.propagate = False
+        logger.addHandler(logging.handlers.QueueHandler(records))
         return logger
 
     @staticmethod
-    def get_data(db_conn, query):
+    def stop_logger():
+        """
+        Write queued log records and close log file, called on exit and by processes serving several jobs.
+        """
+        global _listener
+        logger = logging.getLogger('SQDoc')
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                logger.removeHandler(handler)
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+    @staticmethod
+    def progress(label, total):
+        """
+        Create progress display of a counted task.
+        :param str label: counted items name
+        :param int total: number of items
+        :return: progress display object
+        :rtype: MyProgress
+        """
+        return MyProgress(label, total)
+
+    @staticmethod
+    def stream_data(db_conn, query, params=(), arraysize=_arraysize, cursor=None):
+        """
+        Obtain raw data from db based on a provided query, yielding records in batches instead of reading
+        complete result at once. Cursor is closed as soon as result is exhausted or generator is closed, unless
+        it was provided by caller for reuse.
+        :param db_conn: database connection object
+        :param str query: query string
+        :param params: query parameters
+        :param int arraysize: number of records read from database per batch
+        :param cursor: cursor of db_conn to run query on, new cursor if not set
+        :type db_conn: pyodbc.connect()
+        :type params: tuple(any)
+        :type cursor: pyodbc.Cursor, optional
+        :return: generator of records - result of query
+        :rtype: Iterator[pyodbc.Row]
+        """
+        reused = cursor is not None
+        if not reused:
+            cursor = db_conn.cursor()
+        try:
+            cursor.arraysize = arraysize
+            cursor.execute(query, *params)
+            while True:
+                records = cursor.fetchmany(arraysize)
+                if not records:
+                    break
+                yield from records
+        finally:
+            if not reused:
+                cursor.close()
+
+    @staticmethod
+    def get_data(db_conn, query, params=(), arraysize=_arraysize, cursor=None):
         """
         Default function to obtain raw data from db based on a provided query.
         :param db_conn: database connection object
         :param str query: query string
+        :param params: query parameters
+        :param int arraysize: number of records read from database per batch
+        :param cursor: cursor of db_conn to run query on, new cursor if not set
         :type db_conn: pyodbc.connect()
+        :type params: tuple(any)
+        :type cursor: pyodbc.Cursor, optional
         :return: list of records - result of query
         :rtype: list[Any], optional
         :raise Exception: ``e`` query execution error, returning None
         """
-        result_list = []
         try:
-            cursor = db_conn.cursor()
-            cursor.execute(query)
-            for record in cursor.fetchall():
-                result_list.append(list(record))
-            return result_list
+            return [list(record) for record in MyUtils.stream_data(db_conn, query, params, arraysize, cursor)]
         except Exception as exc:
             return None
+
+
+class MyProgress:
+    """
+    Console progress of a counted task, printed at most once per interval with item count, throughput and
+    estimated time left, instead of a line per item. Items may be counted by concurrent threads.
+    """
+
+    def __init__(self, label, total, interval=_progress_interval):
+        """
+        Initialize class instance.
+        :param str label: counted items name
+        :param int total: number of items
+        :param float interval: minimum interval between progress lines in seconds
+        """
+        self._label = label
+        self._total = total
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._printed = self._start
+        self.done = 0
+        self.failed = 0
+
+    def update(self, failed=False):
+        """
+        Count finished item, print progress if interval passed since last line or all items are finished.
+        :param bool failed: item failed
+        """
+        with self._lock:
+            self.done += 1
+            self.failed += failed
+            now = time.perf_counter()
+            if now - self._printed < self._interval and self.done < self._total:
+                return
+            self._printed = now
+            seconds = max(now - self._start, 1e-6)
+            rate = self.done / seconds
+            left = timedelta(seconds=round((self._total - self.done) / rate))
+            failed = f", {self.failed} failed" if self.failed else ''
+            line = (f"{MyUtils.timestamp()} ┗ {self._label} {self.done}/{self._total} "
+                    f"({self.done / self._total:.0%}), {rate:.1f}/s, ETA {left}{failed}")
+        print(line, flush=True)
+
+    def summary(self):
+        """
+        Get progress summary for log.
+        :return: summary string
+        :rtype: str
+        """
+        with self._lock:
+            return (f"{self.done} of {self._total} {self._label} in {time.perf_counter() - self._start:.1f} s, "
+                    f"{self.failed} failed")
+
+
+# queued log records are written before interpreter exits
+atexit.register(MyUtils.stop_logger)
@@ -0,0 +1,484 @@
+"""
+Author		: paradowski.michal@outlook.com
+Description	: resident worker of SQDoc - serves documentation jobs without process start-up, keeping modules
+              imported and database connections of configured servers open between jobs
+Updates:
+
+* 2026-10-16 - v1.1 - creation
+
+Usage:
+
+    python worker.py
+
+Jobs are JSON objects - {"database": "Neo_DB", "server": "...", "sections": ["db_tables"], "formats": ["md"]} -
+where server defaults to the first server of _batch_targets documenting the database, sections to enabled sections
+of _doc_content and formats to _build_settings formats. Only databases listed in _batch_targets are served.
+
+Jobs are accepted as single line sent to 127.0.0.1:port, answered with single line job summary, or as *.json files
+put in _spool_path, answered with *.result.json file of the same name.
+"""
+
+# import generic libraries
+import os
+import sys
+import json
+import time
+import queue
+import threading
+import socketserver
+from datetime import datetime
+from concurrent.futures import Future
+
+# import engine modules
+import main
+import fetcher as f
+import builder as b
+import utility as u
+import metrics as m
+from batch import server_path
+
+# spool directory result file suffix
+_result_suffix = '.result.json'
+
+
+class MyWarmConnections:
+    """
+    Idle database connections kept open per server between jobs. Connections unused for longer than idle timeout
+    are closed.
+    """
+
+    def __init__(self, idle_timeout):
+        """
+        Initialize class instance.
+        :param float idle_timeout: seconds after which idle connection is closed
+        """
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # [connection, last use] lists per server, most recently used last
+        self._idle = {}
+
+    def take(self, server):
+        """
+        Take most recently used idle connection of a server.
+        :param str server: server name
+        :return: database connection object or None if there is no idle connection
+        :rtype: pyodbc.connect(), optional
+        """
+        with self._lock:
+            connections = self._idle.get(server)
+            return connections.pop()[0] if connections else None
+
+    def give(self, server, connections):
+        """
+        Keep connections of a server open for following jobs.
+        :param str server: server name
+        :param connections: database connections
+        :type connections: list(pyodbc.connect())
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._idle.setdefault(server, []).extend([conn, now] for conn in connections)
+
+    def evict(self):
+        """
+        Close connections idle for longer than idle timeout.
+        :return: number of closed connections
+        :rtype: int
+        """
+        limit = time.monotonic() - self._idle_timeout
+        evicted = []
+        with self._lock:
+            for server, connections in self._idle.items():
+                evicted += [conn for conn, used in connections if used < limit]
+                connections[:] = [item for item in connections if item[1] >= limit]
+        _close(evicted)
+        return len(evicted)
+
+    def count(self, server):
+        """
+        Get number of idle connections of a server.
+        :param str server: server name
+        :return: number of idle connections
+        :rtype: int
+        """
+        with self._lock:
+            return len(self._idle.get(server, ()))
+
+    def close(self):
+        """
+        Close all idle connections.
+        """
+        with self._lock:
+            evicted = [conn for connections in self._idle.values() for conn, used in connections]
+            self._idle = {}
+        _close(evicted)
+
+
+class MyWarmPool(f.MyConnectionPool):
+    """
+    Connection pool of a single job, borrowing warm connections of a server before opening new ones. Closing the
+    pool returns its connections to warm connections instead of closing them.
+    """
+
+    def __init__(self, warm, server, database, conn_string, size):
+        """
+        Initialize class instance.
+        :param warm: warm connections of all servers
+        :param str server: server name
+        :param str database: documented database name, current database of borrowed connections is switched to it
+        :param str conn_string: pyodbc connection string of new connections
+        :param int size: maximum number of open connections
+        :type warm: MyWarmConnections
+        """
+        super().__init__(conn_string, size)
+        self._warm = warm
+        self._server = server
+        self._database = database
+
+    def _open(self):
+        """
+        Borrow warm connection of the server, switched to documented database, or open a new one.
+        :return: database connection object
+        :rtype: pyodbc.connect()
+        """
+        quoted = '[' + self._database.replace(']', ']]') + ']'
+        while True:
+            conn = self._warm.take(self._server)
+            if conn is None:
+                return super()._open()
+            try:
+                cursor = conn.cursor()
+                cursor.execute(f"use {quoted}")
+                cursor.close()
+                return conn
+            except Exception:
+                # connection broken while idle, e.g. by server restart
+                _close([conn])
+
+    def _discard(self, connections):
+        """
+        Return connections of a closed pool to warm connections.
+        :param connections: database connections
+        :type connections: list(pyodbc.connect())
+        """
+        self._warm.give(self._server, connections)
+
+
+class MyWorkerJob:
+    """
+    Documentation of a single database, executed by resident worker.
+    """
+
+    def __init__(self, server, database, sections, formats, server_config, db_pool, log):
+        """
+        Initialize class instance and document database.
+        :param str server: server name
+        :param str database: database name
+        :param sections: printed document sections
+        :param formats: output formats
+        :param server_config: server level configuration shared across jobs of a server
+        :param db_pool: connection pool of the job
+        :param log: worker logger
+        :type sections: list(str)
+        :type formats: list(str)
+        :type server_config: list(any), optional
+        :type db_pool: MyWarmPool
+        :type log: logging.Logger
+        """
+        self.metrics = m.MyMetrics(database)
+        self.utils = self.metrics.instrument(u.MyUtils())
+        self.log = log
+        # set document properties
+        self.doc_content = {section: section in sections for section in main._doc_content}
+        self.doc_properties = main._doc_properties
+        self.fetch_settings = main._fetch_settings
+        self.fetch_filters = main._fetch_filters
+        self.build_settings = dict(main._build_settings, formats=formats)
+        # set utilities
+        self.db_name = database
+        self.db_conn_string = main._batch_conn_string.format(server=server, database=database)
+        self.server_config = server_config
+        self.db_pool = db_pool
+        self.export = server_path(main._docs_path, server)
+        self.state = server_path(main._state_path, server)
+        self.snapshots = server_path(main._snapshots_path, server)
+        self.metrics_path = server_path(main._metrics_path, server)
+        self.cache = main._cache_path
+        # job summary
+        self.summary = {'server': server, 'database': database, 'status': 'ERROR', 'tables': 0, 'procedures': 0,
+                        'seconds': 0.0,
+                        'documents': [os.path.join(self.export, f"{database}_documentation.{output}")
+                                      for output in formats]}
+        start = time.perf_counter()
+        try:
+            for path in (self.export, self.state, self.snapshots):
+                os.makedirs(path, exist_ok=True)
+            self.log.info(f"----------")
+            self.log.info(f"new worker job: {server} {database}, sections {sections}, formats {formats}")
+            details = main.run(self)
+            if details is not None:
+                self.summary['status'] = 'OK'
+                self.summary['tables'] = len(details.db_tables or {})
+                self.summary['procedures'] = len(details.db_procedures or {})
+        except SystemExit:
+            self.log.warn(f"worker job {server} {database} stopped")
+        except Exception as exc:
+            self.log.warn(f"Unspecified worker job exception: {exc}")
+        finally:
+            # connections are returned to the worker even if fetch stopped before closing the pool
+            db_pool.close()
+        self.summary['seconds'] = round(time.perf_counter() - start, 2)
+
+
+class MyJobHandler(socketserver.StreamRequestHandler):
+    """
+    Socket connection of a single job - reads job line, waits for job to be served and answers job summary.
+    """
+
+    def handle(self):
+        """
+        Serve job sent over the connection.
+        """
+        line = self.rfile.readline()
+        try:
+            job = json.loads(line)
+            summary = self.server.worker.submit(job).result()
+        except Exception as exc:
+            summary = {'status': 'ERROR', 'error': str(exc)}
+        self.wfile.write(json.dumps(summary).encode('utf-8') + b'\n')
+
+
+class MyJobServer(socketserver.ThreadingTCPServer):
+    """
+    Local socket accepting jobs of resident worker.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port, worker):
+        """
+        Initialize class instance.
+        :param int port: TCP port on 127.0.0.1
+        :param worker: served resident worker
+        :type worker: SQWorker
+        """
+        self.worker = worker
+        super().__init__(('127.0.0.1', port), MyJobHandler)
+
+
+class SQWorker:
+    """
+    Resident worker executable. Jobs of socket and spool directory are served one by one by main thread, data
+    fetch and document build parallelize work of each job as in a single run.
+    """
+
+    def __init__(self, settings, targets, run=True):
+        """
+        Initialize class instance.
+        :param settings: resident worker settings
+        :param targets: list of servers with databases served by worker
+        :param bool run: serve jobs until interrupted
+        :type settings: dict(str, any)
+        :type targets: list(dict)
+        """
+        print(main._banner)
+        self.settings = settings
+        self.targets = targets
+        self.warm = MyWarmConnections(settings['idle_timeout'])
+        self._jobs = queue.Queue()
+        # server configuration and its read time per server
+        self._server_config = {}
+        self._server = None
+
+        # import utility methods class
+        self.utils = u.MyUtils()
+
+        # setup log
+        _log_path = os.path.join(main._logs_path, f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_worker.log")
+        self.log = self.utils.get_logger(_log_path)
+        print(f"{self.utils.timestamp()} log file: {_log_path}\n----------")
+        if settings['spool']:
+            os.makedirs(main._spool_path, exist_ok=True)
+        if settings['port']:
+            self._server = MyJobServer(settings['port'], self)
+            threading.Thread(target=self._server.serve_forever, name='SQDoc-socket', daemon=True).start()
+            print(f"{self.utils.timestamp()} accepting jobs on 127.0.0.1:{settings['port']}")
+        if settings['spool']:
+            print(f"{self.utils.timestamp()} accepting jobs in {main._spool_path}")
+        self.log.info(f"resident worker started")
+        if run:
+            try:
+                self.serve()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                self.close()
+
+    def submit(self, job):
+        """
+        Queue a job for main thread.
+        :param job: job - database, server, sections, formats
+        :type job: dict(str, any)
+        :return: future of job summary
+        :rtype: Future
+        """
+        future = Future()
+        self._jobs.put((job, future))
+        return future
+
+    def serve(self, stop=None):
+        """
+        Serve queued and spooled jobs, closing idle connections between jobs.
+        :param stop: event ending the loop, loop runs until interrupted if not set
+        :type stop: threading.Event, optional
+        """
+        while stop is None or not stop.is_set():
+            try:
+                job, future = self._jobs.get(timeout=self.settings['poll_interval'])
+            except queue.Empty:
+                if self.settings['spool']:
+                    self._serve_spool()
+            else:
+                try:
+                    future.set_result(self.run(job))
+                except Exception as exc:
+                    future.set_exception(exc)
+            self._evict()
+
+    def run(self, job):
+        """
+        Document a database.
+        :param job: job - database, server, sections, formats
+        :type job: dict(str, any)
+        :return: job summary
+        :rtype: dict(str, any)
+        """
+        try:
+            server, database, sections, formats = self._validate(job)
+        except ValueError as exc:
+            self.log.warn(f"rejected worker job {job}: {exc}")
+            return {'status': 'ERROR', 'error': str(exc)}
+        print(f"{self.utils.timestamp()} job {server} {database} "
+              f"({self.warm.count(server)} warm connections)")
+        server_config = self._get_server_config(server, database, sections)
+        db_pool = MyWarmPool(self.warm, server, database,
+                             main._batch_conn_string.format(server=server, database=database),
+                             main._fetch_settings['workers'])
+        summary = MyWorkerJob(server, database, sections, formats, server_config, db_pool, self.log).summary
+        print(f"{self.utils.timestamp()} ┗ [{summary['status']}] {server} {database}: {summary['tables']} tables, "
+              f"{summary['procedures']} procedures, {summary['seconds']} s")
+        self.log.info(f"{summary['status']} {server} {database}")
+        return dict(summary, id=job.get('id'))
+
+    def close(self):
+        """
+        Stop accepting jobs and close all connections.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self.warm.close()
+        self.log.info(f"resident worker stopped")
+        self.utils.stop_logger()
+
+    def _validate(self, job):
+        """
+        Check job against configured targets and fill in default values.
+        :param job: job - database, server, sections, formats
+        :type job: dict(str, any)
+        :return: server, database, sections, formats
+        :rtype: tuple
+        :raise ValueError: database, server, section or format is not known
+        """
+        database = job.get('database')
+        servers = [target['server'] for target in self.targets if database in target['databases']]
+        server = job.get('server') or (servers[0] if servers else None)
+        if server not in servers:
+            raise ValueError(f"database {database} of server {server} is not configured in _batch_targets")
+        sections = job.get('sections') or [section for section, enabled in main._doc_content.items() if enabled]
+        formats = job.get('formats') or main._build_settings['formats']
+        unknown = [section for section in sections if section not in main._doc_content] + \
+                  [output for output in formats if output not in b.renderers]
+        if unknown:
+            raise ValueError(f"unknown sections or formats: {unknown}")
+        return server, database, list(sections), list(formats)
+
+    def _get_server_config(self, server, database, sections):
+        """
+        Read server level configuration once per server, re-read after idle timeout.
+        :param str server: server name
+        :param str database: database name used to connect
+        :param sections: printed document sections
+        :type sections: list(str)
+        :return: configuration details list or None if not needed or not available
+        :rtype: list(any), optional
+        """
+        if 'db_configuration' not in sections:
+            return None
+        if server not in self._server_config:
+            conn_string = main._batch_conn_string.format(server=server, database=database)
+            self._server_config[server] = [f.get_server_configuration(self, conn_string), time.monotonic()]
+        self._server_config[server][1] = time.monotonic()
+        return self._server_config[server][0]
+
+    def _serve_spool(self):
+        """
+        Serve job files of spool directory in creation order. Job file is renamed before job starts, so that
+        a job is served once even if several workers share spool directory.
+        """
+        entries = []
+        for entry in os.scandir(main._spool_path):
+            if entry.name.endswith('.json') and not entry.name.endswith(_result_suffix):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+        for created, path in sorted(entries):
+            running = f"{path}.running"
+            try:
+                os.replace(path, running)
+            except OSError:
+                # job taken by another worker
+                continue
+            try:
+                with open(running, encoding='utf-8') as file:
+                    job = json.load(file)
+                summary = self.run(job)
+            except Exception as exc:
+                self.log.warn(f"cannot read spooled job {path}: {exc}")
+                summary = {'status': 'ERROR', 'error': str(exc)}
+            result = path[:-len('.json')] + _result_suffix
+            with open(f"{result}.tmp", 'w', encoding='utf-8') as file:
+                json.dump(summary, file, indent=2)
+            os.replace(f"{result}.tmp", result)
+            os.remove(running)
+
+    def _evict(self):
+        """
+        Close connections and drop server configuration unused for longer than idle timeout.
+        """
+        evicted = self.warm.evict()
+        if evicted:
+            self.log.info(f"closed {evicted} idle connections")
+        limit = time.monotonic() - self.settings['idle_timeout']
+        for server in [server for server, (config, used) in self._server_config.items() if used < limit]:
+            del self._server_config[server]
+
+
+def _close(connections):
+    """
+    Close database connections, ignoring failures of broken ones.
+    :param connections: database connections
+    :type connections: list(pyodbc.connect())
+    """
+    for conn in connections:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+if __name__ == '__main__':
+    SQWorker(main._worker_settings, main._batch_targets)
+    sys.exit(0)